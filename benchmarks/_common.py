@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Shared helpers for the benchmark scripts.
+
+    The scripts are meant to be run by hand from the repository root,
+    e.g. ``python benchmarks/bench_normalize.py``.
+"""
+
+import os
+import sys
+import random
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+WORDS = (
+    'the quick brown fox jumps over lazy dog lorem ipsum dolor sit amet '
+    'consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore '
+    'et dolore magna aliqua one two street and of in on at to for with '
+    'from this that these those report page section total order shipping'
+).split()
+
+ADDRESSES = {
+    'US': [
+        '225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062',
+        '1827 Union St, San Francisco, CA 94123',
+        '7000 Peachtree Dunwoody Rd NE Bldg 7, Miami, FL, USA',
+        '1500 Westlake Avenue North Suite 108 Seattle, WA 98109',
+    ],
+    'CA': [
+        '1111, 101-3RD STREET SW, CALGARY, ALBERTA T2P3E6',
+        '3000 Steeles Avenue East, Suite 700 Markham, Ontario Canada L3R 9W2',
+        '405, rue Sainte Montreal Québec',
+    ],
+    'GB': [
+        '9 Shaun glen, East Joan, LN4 1LE',
+        '11-59 High Road, East Finchley London, N2 8AW, UK',
+        'Studio 53, Harrison cove, Smithbury, G88 4US, United Kingdom',
+    ],
+}
+
+
+def prose(size, seed=0):
+    '''Returns roughly `size` characters of address-free text'''
+    rnd = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = rnd.choice(WORDS)
+        if rnd.random() < 0.05:
+            word += ','
+        if rnd.random() < 0.02:
+            word += '\n'
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+
+def document(size, country='US', every=2000, seed=0):
+    '''Returns text of roughly `size` characters with an address
+    inserted after about every `every` characters of prose
+    '''
+    rnd = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        chunk = prose(every, seed=rnd.random())
+        address = rnd.choice(ADDRESSES[country])
+        parts.append(chunk)
+        parts.append(address)
+        length += len(chunk) + len(address)
+    return '\n'.join(parts)
+
+
+def legacy_combine_results(match_as_dict):
+    '''Merges alternative groups ('postal_code_b', ...) of a groupdict
+    into address parts as the parser did before the field table of
+    registry.CountryRules
+    '''
+    keys = []
+    vals = []
+    for k, v in match_as_dict.items():
+        if k[-2:] in '_a_b_c_d_e_f_g_h_i_j_k_l_m':
+            if v:
+                keys.append(k[:-2])
+                vals.append(v)
+        elif k not in keys:
+            keys.append(k)
+            vals.append(v)
+    return dict(zip(keys, vals))
+
+
+def best_of(func, repeat=5, number=1):
+    '''Returns the best wall time of `func` in seconds'''
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def report(name, seconds, extra=''):
+    print('{name:<40} {ms:>10.3f} ms {extra}'.format(
+        name=name, ms=seconds * 1000, extra=extra))
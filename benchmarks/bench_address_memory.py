@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Memory held per parsed address: the lazy, slotted Address against
+    the previous Address storing every part as an attribute and again
+    in a dictionary. Documents are either dense with addresses or long
+    with few of them, where results holding on to their documents would
+    show.
+"""
+
+import gc
+import tracemalloc
+
+from _common import document, legacy_combine_results
+from pyap import parser
+from pyap.packages import six
+
+
+class LegacyAddress(object):
+
+    def __init__(self, **args):
+        keys = []
+        vals = []
+        for k, v in six.iteritems(args):
+            if v and isinstance(v, str):
+                v = v.strip(' ,;:')
+            setattr(self, k, v)
+            keys.append(k)
+            vals.append(v)
+        self.data_as_dict = dict(zip(keys, vals))
+
+
+def legacy_parse(ap, text):
+    results = []
+    for match in ap._rules.pattern.finditer(text):
+        parts = match.groupdict()
+        parts['country_id'] = ap.country
+        parts = legacy_combine_results(parts)
+        parts['match_start'] = match.start()
+        parts['match_end'] = match.end()
+        results.append(LegacyAddress(**parts))
+    return results
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    results = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return results, size
+
+
+def report(name, ap, documents):
+    legacy, legacy_size = measure(lambda: [
+        address for document in documents
+        for address in legacy_parse(ap, ap._normalize_string(document))])
+    count = len(legacy)
+    del legacy
+    lazy, lazy_size = measure(lambda: [
+        address for document in documents for address in ap.parse(document)])
+    _, full_size = measure(lambda: [a.full_address for a in lazy])
+    _, dict_size = measure(lambda: [a.as_dict() for a in lazy])
+
+    print('%s: %d addresses in %d characters' % (
+        name, count, sum(len(document) for document in documents)))
+    print('legacy Address:                %6d bytes/result' %
+          (legacy_size / count))
+    print('lazy Address:                  %6d bytes/result' %
+          (lazy_size / count))
+    print('  + a part read, all built:    %6d bytes/result' %
+          ((lazy_size + full_size) / count))
+    print('  + as_dict() materialized:    %6d bytes/result' %
+          ((lazy_size + full_size + dict_size) / count))
+
+
+def main():
+    ap = parser.AddressParser(country='US')
+    # the documents are dropped once parsed, only the results are kept
+    report('dense', ap, [document(500000, every=100)])
+    report('sparse', ap, [document(50000, every=50000, seed=seed)
+                          for seed in range(300)])
+
+
+if __name__ == '__main__':
+    main()
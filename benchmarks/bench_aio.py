@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Event loop latency and throughput of the asyncio API: documents
+    parsed inline in a coroutine against pyap.aiter_parse with thread
+    and process executors. Latency is the worst delay of a task asking
+    to wake up every millisecond while the documents are parsed.
+"""
+
+import time
+import asyncio
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from _common import document, report
+import pyap
+
+TICK = 0.001
+
+
+async def ticker(lags):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - started - TICK)
+
+
+async def inline(documents):
+    for text in documents:
+        for address in pyap.parse(text, country='US'):
+            pass
+        await asyncio.sleep(0)
+
+
+async def offloaded(documents, executor):
+    async def source():
+        for text in documents:
+            yield text
+    async for address in pyap.aiter_parse(source(), executor=executor,
+                                          country='US'):
+        pass
+
+
+async def measure(run):
+    lags = []
+    tick = asyncio.ensure_future(ticker(lags))
+    started = time.perf_counter()
+    await run
+    elapsed = time.perf_counter() - started
+    tick.cancel()
+    return elapsed, max(lags or [0])
+
+
+def main():
+    documents = [document(100000, seed=i) for i in range(40)]
+    pyap.parse(documents[0], country='US')
+    thread = ThreadPoolExecutor(4)
+    process = ProcessPoolExecutor(4)
+    # start the workers and compile their rules before timing
+    list(process.map(functools.partial(pyap.parse, country='US'),
+                     documents[:4]))
+    for name, run in [
+            ('inline parse', lambda: inline(documents)),
+            ('aiter_parse, threads', lambda: offloaded(documents, thread)),
+            ('aiter_parse, processes',
+             lambda: offloaded(documents, process))]:
+        elapsed, lag = asyncio.run(measure(run()))
+        report(name, elapsed, '%.0f docs/s, worst loop lag %.1f ms' % (
+            len(documents) / elapsed, lag * 1000))
+    thread.shutdown()
+    process.shutdown()
+
+
+if __name__ == '__main__':
+    main()
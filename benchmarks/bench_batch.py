@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+    AddressParser.parse_batch against AddressParser.parse called in a
+    loop, on many short texts like the cells of a table: mostly a few
+    words, one in twenty an address.
+
+        python benchmarks/bench_batch.py [COUNT]
+
+    COUNT texts (1000000 by default) are parsed both ways.
+"""
+
+import sys
+import random
+
+from _common import ADDRESSES, WORDS, best_of, report
+from pyap import parser
+
+
+def cells(count, country='US', seed=0):
+    '''Returns count short texts, about one in twenty an address'''
+    rnd = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        if rnd.random() < 0.05:
+            texts.append(rnd.choice(ADDRESSES[country]))
+        else:
+            texts.append(' '.join(rnd.choice(WORDS)
+                                  for _ in range(rnd.randint(1, 8))))
+    return texts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for country in ('US', 'CA', 'GB'):
+        ap = parser.AddressParser(country=country)
+        texts = cells(count, country)
+        loop = best_of(lambda: [ap.parse(text) for text in texts], 3)
+        batch = best_of(lambda: ap.parse_batch(texts), 3)
+        found = sum(map(len, ap.parse_batch(texts)))
+        report('%s, parse in a loop' % country, loop, '%d found' % found)
+        report('%s, parse_batch' % country, batch, 'x%.1f' % (loop / batch))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Parsing a large UTF-8 file: read and decoded into a str, streamed
+    through parse_stream, or memory-mapped and matched as bytes. Every
+    way runs in a fresh interpreter, which reports its time and peak
+    memory (RSS). The RSS of the memory-mapped file counts the pages of
+    the file read so far, which are shared with the page cache and
+    dropped by the kernel when memory runs short, unlike the decoded
+    text.
+
+        python benchmarks/bench_binary.py [MEGABYTES] [COUNTRY]
+
+    The file (2048 MB by default) is written to the temporary directory
+    and removed afterwards.
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+
+from _common import document, report
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+# prints seconds, peak RSS in kilobytes and the number of addresses
+FRESH = '''
+import io, mmap, resource, time
+from pyap import parser
+ap = parser.AddressParser(country={country!r})
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started,
+      resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, count)
+'''
+
+STATEMENTS = [
+    ('read and decode', '''
+with open({path!r}, encoding='utf-8') as f:
+    count = sum(1 for _ in ap.iter_parse(f.read()))
+'''),
+    ('parse_stream', '''
+with open({path!r}, encoding='utf-8') as f:
+    count = sum(1 for _ in ap.parse_stream(f))
+'''),
+    ('mmap, bytes', '''
+with open({path!r}, 'rb') as f:
+    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    count = sum(1 for _ in ap.iter_parse(data))
+'''),
+]
+
+
+def write(path, size, country):
+    '''Writes about size bytes of documents with addresses to path'''
+    block = (document(1 << 20, country, every=2000) + u'\n').encode('utf-8')
+    with open(path, 'wb') as f:
+        for _ in range(max(1, size // len(block))):
+            f.write(block)
+    return os.path.getsize(path)
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    country = sys.argv[2] if len(sys.argv) > 2 else 'US'
+    handle, path = tempfile.mkstemp(suffix='.txt')
+    os.close(handle)
+    try:
+        size = write(path, megabytes << 20, country)
+        for name, statement in STATEMENTS:
+            script = FRESH.format(country=country,
+                                  statement=statement.format(path=path))
+            seconds, rss, count = subprocess.check_output(
+                [sys.executable, '-c', script], cwd=ROOT).decode().split()
+            seconds = float(seconds)
+            report('%s, %d MB' % (name, size >> 20), seconds,
+                   '%.0f MB/s, %d MB peak RSS, %s found' % (
+                       size / seconds / (1 << 20), int(rss) >> 10, count))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
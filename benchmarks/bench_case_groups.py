@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Compile and match time of the rules written with scoped '(?ai:...)'
+    groups against the same rules with every letter spelled out as a
+    '[Xx]' character class, the way they were written before.
+"""
+
+import re
+import time
+
+from _common import best_of, document, prose, report
+from pyap import parser
+from pyap import registry
+from pyap import utils
+
+CASE_GROUP = re.compile(r'\(\?a?i:((?:[A-Za-z]|\\.)*)\)')
+
+
+def spelled_out(regex):
+    '''Expands '(?ai:abc)' groups into '[Aa][Bb][Cc]' '''
+    def expand(group):
+        return re.sub(
+            r'\\.|[A-Za-z]',
+            lambda m: m.group() if len(m.group()) > 1 else
+            '[%s%s]' % (m.group().upper(), m.group().lower()),
+            group.group(1))
+    return CASE_GROUP.sub(expand, regex)
+
+
+def compile_time(regex):
+    re.purge()
+    started = time.perf_counter()
+    re.compile(regex, utils.DEFAULT_FLAGS)
+    return time.perf_counter() - started
+
+
+def main():
+    for country in ('US', 'CA', 'GB'):
+        source = registry.get_rules(country).source
+        old_source = spelled_out(source)
+        assert '(?ai:' not in old_source
+        report('%s compile, [Xx] classes' % country,
+               compile_time(old_source), '%d chars' % len(old_source))
+        report('%s compile, (?ai:...) groups' % country,
+               compile_time(source), '%d chars' % len(source))
+
+        old = re.compile(old_source, utils.DEFAULT_FLAGS)
+        new = re.compile(source, utils.DEFAULT_FLAGS)
+        size = 30000 if country == 'GB' else 200000
+        texts = [('every 1000 chars', document(size, country, every=1000)),
+                 ('no addresses', prose(size))]
+        for name, text in texts:
+            text = parser.AddressParser._normalize_string(text)
+            found = [m.groupdict() for m in old.finditer(text)]
+            assert [m.groupdict() for m in new.finditer(text)] == found
+            report('%s match, [Xx] classes, %s' % (country, name),
+                   best_of(lambda: list(old.finditer(text)), 3))
+            report('%s match, (?ai:...) groups, %s' % (country, name),
+                   best_of(lambda: list(new.finditer(text)), 3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Per-match cost of merging alternative groups ('postal_code_b',
+    'full_street_b', ...) into address parts: the groupdict based
+    merging of the parser before the field table (legacy_combine_results)
+    against the precomputed field table.
+"""
+
+from _common import document, best_of, report, legacy_combine_results
+from pyap import parser
+
+
+def main():
+    for country in ('CA', 'US'):
+        ap = parser.AddressParser(country=country)
+        text = ap._normalize_string(document(200000, country, every=100))
+        matches = list(ap._rules.pattern.finditer(text))
+        rules = ap._rules
+
+        def legacy():
+            for match in matches:
+                parts = match.groupdict()
+                parts['country_id'] = country
+                legacy_combine_results(parts)
+
+        def table():
+            for match in matches:
+                rules.field_spans(match)
+
+        old = best_of(legacy) / len(matches)
+        new = best_of(table) / len(matches)
+        report('%s groupdict + legacy merging' % country, old,
+               'per match, %d groups' % rules.pattern.groups)
+        report('%s field table' % country, new,
+               'per match, x%.1f' % (old / new))
+
+
+if __name__ == '__main__':
+    main()
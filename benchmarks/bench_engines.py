@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Country rules compiled with every installed regex engine (see
+    pyap.engines): compile time, parse time of a document, and how
+    many addresses are found exactly as with re.
+"""
+
+import time
+
+from _common import best_of, document, report
+from pyap import engines
+from pyap import parser
+from pyap import registry
+
+COUNTRIES = ('US', 'CA', 'GB')
+
+
+def installed():
+    names = []
+    for name in sorted(engines.ENGINES):
+        try:
+            engines.get(name)
+        except ImportError as e:
+            print('%s skipped: %s' % (name, e))
+        else:
+            names.append(name)
+    return names
+
+
+def main():
+    names = installed()
+    for country in COUNTRIES:
+        text = document(200000, country, every=500)
+        expected = None
+        for name in names:
+            started = time.perf_counter()
+            registry.load_rules(country, name)
+            compiled = time.perf_counter() - started
+            report('%s compile, %s' % (country, name), compiled)
+
+            ap = parser.AddressParser(country=country, engine=name)
+            found = [a.as_dict() for a in ap.parse(text)]
+            if expected is None:
+                expected = found
+            same = len([a for a in found if a in expected])
+            report('%s parse, %s' % (country, name),
+                   best_of(lambda: ap.parse(text), 3),
+                   '%d found, %d as with re' % (len(found), same))
+
+
+if __name__ == '__main__':
+    main()
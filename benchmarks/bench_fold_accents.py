@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Cost of matching the CA rules against accent-folded text
+    (utils.fold_accents) instead of spelling accented letters out
+    in the rules: folding French text alone, and parsing with the
+    current pure ASCII rules.
+"""
+
+from _common import best_of, document, report
+from pyap import parser
+from pyap import utils
+
+FRENCH = (u'Écrire à l\'équipe de Montréal avant le début de l\'été, '
+          u'nous répondrons à votre requête très bientôt. ') * 4
+
+
+def main():
+    text = parser.AddressParser._normalize_string(
+        u'\n'.join([FRENCH, document(200000, 'CA', every=1000)] * 2))
+    ascii_text = parser.AddressParser._normalize_string(
+        document(400000, 'CA', every=1000).replace(u'é', u'e'))
+    report('fold, French text', best_of(lambda: utils.fold_accents(text)),
+           '%d chars' % len(text))
+    report('fold, ASCII text',
+           best_of(lambda: utils.fold_accents(ascii_text)),
+           '%d chars' % len(ascii_text))
+
+    ap = parser.AddressParser(country='CA')
+    found = len(ap.parse(text))
+    report('CA parse, French text', best_of(lambda: ap.parse(text), 3),
+           '%d found' % found)
+    report('CA parse, ASCII text', best_of(lambda: ap.parse(ascii_text), 3))
+
+
+if __name__ == '__main__':
+    main()
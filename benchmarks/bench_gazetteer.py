@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""
+    French communes checked by a gazetteer lookup against the same
+    communes compiled into a single regex, the way the FR rules
+    were written before, and the cost of loading the communes from
+    the CSV file or from the packaged memory-mapped table in a fresh
+    process.
+"""
+
+import os
+import re
+import sys
+import time
+import subprocess
+
+from _common import best_of, report
+from pyap import gazetteer
+from pyap import utils
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+CSV = dict(path=os.path.join(ROOT, 'pyap', 'source_FR', 'codes_postal.csv'),
+           column='Nom_de_la_commune', delimiter=';', encoding='latin-1')
+
+TABLE = os.path.join(ROOT, 'pyap', 'source_FR', 'communes.bin')
+
+# prints seconds and kilobytes of memory (RSS) taken by statement
+FRESH = '''
+import resource, time
+from pyap import gazetteer
+names = {names!r}
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+{statement}
+for name in names:
+    known.longest_prefix(name)
+print(time.perf_counter() - started,
+      resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+'''
+
+SPECIAL_CASES = {
+    'e': u'éèêë', 'c': u'ç', 'i': u'îï', 'a': u'àâä',
+    'o': u'ôöù', 'u': u'ûü', 'y': u'ÿ',
+}
+
+CANDIDATES = [
+    u'Paris 02', u'Lyon 07', u'St Martin d\'Hères', u'Aix en Provence',
+    u'L\'Abergement-Clémenciat', u'Nullepart du tout', u'Bordeaux cedex',
+]
+
+
+def commune_char_to_regex(char):
+    if char in u" '-":
+        return u"[ '-]?"
+    if char in SPECIAL_CASES:
+        return u'[{0}{1}]'.format(char, SPECIAL_CASES[char])
+    return re.escape(char)
+
+
+def fresh(statement, repeat=5):
+    '''Runs statement in new interpreters, returns
+    the best time and the memory it took
+    '''
+    script = FRESH.format(statement=statement, names=CANDIDATES)
+    runs = [subprocess.check_output([sys.executable, '-c', script],
+                                    cwd=ROOT).split()
+            for _ in range(repeat)]
+    return min(float(seconds) for seconds, rss in runs), \
+        min(int(rss) for seconds, rss in runs)
+
+
+def main():
+    for name, statement in [
+            ('CSV file', 'known = gazetteer.load(**%r)' % CSV),
+            ('table', 'known = gazetteer.load(%r)' % TABLE)]:
+        seconds, rss = fresh(statement)
+        report('startup and lookups, %s' % name, seconds,
+               '+%d KB RSS' % rss)
+
+    started = time.perf_counter()
+    names = gazetteer.Gazetteer.from_csv(**CSV)
+    report('gazetteer load', time.perf_counter() - started,
+           '%d names' % len(names))
+
+    communes = sorted(names.names)
+    started = time.perf_counter()
+    regex = r'\b' + utils.words_to_regex(
+        communes, char_regex=commune_char_to_regex) + r'\b'
+    pattern = re.compile(regex, utils.DEFAULT_FLAGS)
+    report('regex build and compile', time.perf_counter() - started,
+           '%d chars' % len(regex))
+
+    table = gazetteer.load(TABLE)
+
+    def lookups():
+        return [names.longest_prefix(text) for text in CANDIDATES]
+
+    def table_lookups():
+        return [table.longest_prefix(text) for text in CANDIDATES]
+
+    def matches():
+        return [pattern.match(text) for text in CANDIDATES]
+
+    report('gazetteer lookups, set', best_of(lookups) / len(CANDIDATES),
+           'per candidate')
+    report('gazetteer lookups, table',
+           best_of(table_lookups) / len(CANDIDATES), 'per candidate')
+    report('regex matches', best_of(matches) / len(CANDIDATES),
+           'per candidate')
+
+
+if __name__ == '__main__':
+    main()
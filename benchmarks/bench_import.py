@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Time to import the rules of a country in a fresh interpreter:
+    the data module assembling the grammar against the frozen module
+    generated by 'python -m pyap.freeze'.
+"""
+
+import os
+import subprocess
+import sys
+
+from _common import report
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+SCRIPT = '''
+import time
+import pyap
+from pyap import registry
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started)
+'''
+
+STATEMENTS = [
+    ('data module',
+     "import importlib; importlib.import_module('pyap.source_{0}.data')"),
+    ('frozen module', "registry.load_data('{0}')"),
+]
+
+
+def import_time(statement, repeat=7):
+    '''Returns the best time of statement, each run in a new interpreter'''
+    script = SCRIPT.format(statement=statement)
+    # compiled modules are cached as usual, the first run writes them
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return min(float(subprocess.check_output(
+        [sys.executable, '-c', script], cwd=ROOT, env=env))
+        for _ in range(repeat))
+
+
+def main():
+    for country in ('US', 'CA', 'GB'):
+        for name, statement in STATEMENTS:
+            report('%s import, %s' % (country, name),
+                   import_time(statement.format(country)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Time to the first address and peak memory of AddressParser.iter_parse
+    against AddressParser.parse on documents with many addresses.
+"""
+
+import itertools
+import tracemalloc
+
+from _common import document, best_of, report
+from pyap import parser
+
+
+def main():
+    ap = parser.AddressParser(country='US')
+    for size in (10 ** 5, 10 ** 6):
+        text = document(size, every=200)
+        parse = best_of(lambda: ap.parse(text)[:3], repeat=3)
+        first = best_of(
+            lambda: list(itertools.islice(ap.iter_parse(text), 3)), repeat=3)
+        report('parse, first 3 of %d chars' % size, parse)
+        report('iter_parse, first 3 of %d chars' % size, first,
+               'x%.1f' % (parse / first))
+
+        for name, func in (('parse', ap.parse), ('iter_parse', ap.iter_parse)):
+            tracemalloc.start()
+            for _ in func(text):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print('{0:<40} peak {1:.1f} MB'.format(
+                '%s, all of %d chars' % (name, size), peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
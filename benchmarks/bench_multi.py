@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Looking for addresses of all countries in a document: one
+    pyap.parse call per country against pyap.parse_multi, with the
+    anchors of every country found in a single Hyperscan scan or,
+    without hyperscan, by every country on its own.
+"""
+
+from _common import best_of, document, prose, report
+import pyap
+from pyap import multi
+from pyap import parser
+from pyap import registry
+
+
+def separately(texts):
+    return [a for text in texts for country in multi.DEFAULT_COUNTRIES
+            for a in pyap.parse(text, country=country)]
+
+
+def together(texts):
+    return [a for text in texts for a in pyap.parse_multi(text)]
+
+
+def main():
+    # mostly prose, a few US addresses, as in crawled pages
+    texts = [prose(20000, seed=i) + document(2000, 'US', seed=i)
+             for i in range(20)]
+    expected = [a.as_dict() for a in separately(texts)]
+
+    report('parse per country', best_of(lambda: separately(texts), 3),
+           '%d found' % len(expected))
+    hyperscan = multi._load_hyperscan()
+    for name, loader in [('Python anchors', lambda: None),
+                         ('Hyperscan', lambda: hyperscan)]:
+        if name == 'Hyperscan' and hyperscan is None:
+            print('hyperscan not installed, skipped')
+            continue
+        multi._load_hyperscan = loader
+        multi._prefilters.clear()
+        assert [a.as_dict() for a in together(texts)] == expected
+        report('parse_multi, %s' % name,
+               best_of(lambda: together(texts), 3))
+
+    rules = [registry.get_rules(country)
+             for country in multi.DEFAULT_COUNTRIES]
+    text = parser.AddressParser._normalize_string(''.join(texts))
+    report('anchor search, per country',
+           best_of(lambda: [list(r._candidate_ranges(r.shadow(text), 0))
+                            for r in rules if r.anchor is not None]),
+           '%d chars' % len(text))
+    if hyperscan is not None:
+        prefilter = multi.Prefilter(rules)
+        report('anchor search, one Hyperscan scan',
+               best_of(lambda: prefilter.ranges(text)))
+
+
+if __name__ == '__main__':
+    main()
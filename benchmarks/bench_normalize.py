@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Compares the single-pass text normalizer with the previous
+    implementation that ran one re.sub per conversion rule.
+"""
+
+import re
+
+from _common import prose, best_of, report
+from pyap.parser import AddressParser
+
+
+def legacy_normalize_string(text):
+    conversion = {
+        r'\r*(\n\r*)+': ', ',
+        r'\s*(\,\s*)+': ', ',
+        r'\s+': ' ',
+        u'‐': '-', u'‑': '-', u'‒': '-', u'–': '-', u'—': '-', u'―': '-',
+    }
+    for find, replace in conversion.items():
+        text = re.sub(find, replace, text, flags=re.UNICODE)
+    return text
+
+
+def main():
+    for size in (10 ** 4, 10 ** 6, 4 * 10 ** 6):
+        text = prose(size) + u'\t — \r\n'
+        assert legacy_normalize_string(text) == \
+            AddressParser._normalize_string(text)
+        old = best_of(lambda: legacy_normalize_string(text))
+        new = best_of(lambda: AddressParser._normalize_string(text))
+        report('legacy normalizer, %d chars' % size, old)
+        report('single-pass normalizer, %d chars' % size, new,
+               'x%.1f' % (old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Cost of mapping addresses back to the original text: normalizing
+    with and without an OffsetMap, the lookups, and finding every
+    address in the original text again with a whitespace-tolerant
+    search, the way callers had to before.
+"""
+
+import re
+
+from _common import best_of, document, report
+from pyap import parser
+
+AP = parser.AddressParser(country='US')
+
+
+def search_again(text, addresses):
+    '''Finds addresses in text by their normalized strings'''
+    spans = []
+    pos = 0
+    for a in addresses:
+        words = re.split(r'[\s,]+', a.full_address)
+        match = re.compile(r'[\s,]+'.join(map(re.escape, words))).search(
+            text, pos)
+        spans.append(match.span())
+        pos = match.end()
+    return spans
+
+
+def main():
+    text = document(1000000, every=500).replace(', ', ',\n  ')
+    report('normalize', best_of(lambda: AP._normalize_string(text)),
+           '%d chars' % len(text))
+    report('normalize with offset map',
+           best_of(lambda: AP._normalize_string(text, parser.OffsetMap())))
+    offsets = parser.OffsetMap()
+    AP._normalize_string(text, offsets)
+
+    addresses = AP.parse(text)
+    starts = [a.match_start for a in addresses]
+    report('offset map lookups',
+           best_of(lambda: [offsets.original(s) for s in starts]),
+           '%d addresses' % len(addresses))
+    spans = search_again(text, addresses)
+    assert spans == [(a.orig_start, a.orig_end) for a in addresses]
+    report('searching the original again',
+           best_of(lambda: search_again(text, addresses)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Throughput of AddressParserPool against sequential pyap.parse calls.
+"""
+
+import time
+import multiprocessing
+
+from _common import document, report
+import pyap
+
+
+def main():
+    documents = [document(20000, seed=i) for i in range(200)]
+
+    started = time.perf_counter()
+    for text in documents:
+        pyap.parse(text, country='US')
+    sequential = time.perf_counter() - started
+    report('sequential pyap.parse', sequential,
+           '%.0f docs/s' % (len(documents) / sequential))
+
+    workers = 1
+    while workers <= multiprocessing.cpu_count():
+        with pyap.AddressParserPool(countries=['US'], workers=workers,
+                                    chunksize=4) as pool:
+            pool.map(documents[:workers])  # warm up the workers
+            started = time.perf_counter()
+            for _ in pool.imap_unordered(documents):
+                pass
+            elapsed = time.perf_counter() - started
+        report('pool, %d workers' % workers, elapsed,
+               '%.0f docs/s' % (len(documents) / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Matching near anchors only (states, provinces, postcodes) against
+    trying the rules at every position, for texts with decreasing
+    density of addresses.
+"""
+
+from _common import best_of, document, prose, report
+from pyap import parser
+
+
+def main():
+    size = 200000
+    for country in ('US', 'CA', 'GB'):
+        plain = parser.AddressParser(country=country, prefilter=False)
+        anchored = parser.AddressParser(country=country)
+        texts = [('every 500 chars', document(size, country, every=500)),
+                 ('every 5000 chars', document(size, country, every=5000)),
+                 ('no addresses', prose(size))]
+        for name, text in texts:
+            found = [a.as_dict() for a in plain.parse(text)]
+            assert [a.as_dict() for a in anchored.parse(text)] == found
+            extra = '%d addresses' % len(found)
+            report('%s every position, %s' % (country, name),
+                   best_of(lambda: plain.parse(text), 3), extra)
+            report('%s near anchors, %s' % (country, name),
+                   best_of(lambda: anchored.parse(text), 3), extra)
+
+
+if __name__ == '__main__':
+    main()
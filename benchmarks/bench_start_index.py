@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Matching only at indexed start positions (digits and number words)
+    against scanning every position, on large mostly-prose documents.
+"""
+
+from _common import best_of, document, prose, report
+from pyap import parser
+from pyap import registry
+
+
+def main():
+    size = 1000000
+    for country in ('US', 'CA'):
+        rules = registry.get_rules(country)
+        texts = [('every 5000 chars', document(size, country, every=5000)),
+                 ('every 50000 chars', document(size, country, every=50000)),
+                 ('no addresses', prose(size))]
+        for name, text in texts:
+            text = parser.AddressParser._normalize_string(text)
+            plain = [m.span() for m in rules.finditer(text, prefilter=False)]
+            assert [m.span() for m in rules.finditer(text)] == plain
+            extra = '%d addresses' % len(plain)
+            report('%s every position, %s' % (country, name),
+                   best_of(lambda: list(rules.finditer(
+                       text, prefilter=False)), 3), extra)
+            report('%s near anchors, %s' % (country, name),
+                   best_of(lambda: list(rules._finditer_anchored(
+                       text, 0, True)), 3), extra)
+            report('%s indexed starts, %s' % (country, name),
+                   best_of(lambda: list(rules.finditer(text)), 3), extra)
+            report('%s building the index, %s' % (country, name),
+                   best_of(lambda: rules.start_positions(text), 3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Peak memory of AddressParser.parse_stream against AddressParser.parse
+    for growing inputs. The streamed input is generated on the fly, so
+    the peak shows the memory used by the parser itself.
+"""
+
+import time
+import tracemalloc
+
+from _common import document, report
+from pyap import parser
+
+
+class RepeatingReader(object):
+    '''File-like object returning `text` over and over
+    until `size` characters were read
+    '''
+
+    def __init__(self, text, size):
+        self.text = text
+        self.left = size
+        self.pos = 0
+
+    def read(self, n):
+        n = min(n, self.left)
+        out = []
+        while n:
+            piece = self.text[self.pos:self.pos + n]
+            self.pos = (self.pos + len(piece)) % len(self.text)
+            n -= len(piece)
+            self.left -= len(piece)
+            out.append(piece)
+        return u''.join(out)
+
+
+def main():
+    ap = parser.AddressParser(country='US')
+    sample = document(200000)
+    for size in (10 ** 6, 4 * 10 ** 6, 10 ** 7):
+        tracemalloc.start()
+        started = time.perf_counter()
+        found = sum(1 for _ in ap.parse_stream(RepeatingReader(sample, size),
+                                               chunk_size=1 << 18))
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report('parse_stream, %d chars' % size, elapsed,
+               'peak %.1f MB, %d addresses' % (peak / 1e6, found))
+
+        if size <= 4 * 10 ** 6:
+            text = RepeatingReader(sample, size).read(size)
+            tracemalloc.start()
+            started = time.perf_counter()
+            found = len(ap.parse(text))
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            report('parse, %d chars' % size, elapsed,
+                   'peak %.1f MB, %d addresses' % (peak / 1e6, found))
+            del text
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Scaling of the 'thread' backend of AddressParserPool: documents
+    per second for 1 to N threads sharing one parser, next to the
+    'process' backend. Threads only scale on free-threaded builds
+    (python3.13t and later), with the GIL they take turns.
+"""
+
+import time
+import multiprocessing
+
+from _common import document, report
+import pyap
+from pyap import pool as pool_module
+
+
+def throughput(documents, workers, backend):
+    with pyap.AddressParserPool(countries=['US'], workers=workers,
+                                chunksize=4, backend=backend) as pool:
+        pool.map(documents[:workers])  # warm up the workers
+        started = time.perf_counter()
+        for _ in pool.imap_unordered(documents):
+            pass
+        return time.perf_counter() - started
+
+
+def main():
+    print('free-threaded: %s' % pool_module.free_threaded())
+    documents = [document(20000, seed=i) for i in range(200)]
+
+    started = time.perf_counter()
+    for text in documents:
+        pyap.parse(text, country='US')
+    sequential = time.perf_counter() - started
+    report('sequential pyap.parse', sequential,
+           '%.0f docs/s' % (len(documents) / sequential))
+
+    for backend in pool_module.BACKENDS:
+        workers = 1
+        while workers <= multiprocessing.cpu_count():
+            elapsed = throughput(documents, workers, backend)
+            report('%s backend, %d workers' % (backend, workers), elapsed,
+                   '%.0f docs/s, x%.1f' % (len(documents) / elapsed,
+                                           sequential / elapsed))
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Single-pass matching against two-stage detection (capture-free
+    detector, then the full rules on found addresses only) for texts
+    with decreasing density of addresses.
+"""
+
+from _common import best_of, document, prose, report
+from pyap import parser
+
+
+def main():
+    size = 200000
+    for country in ('US', 'CA', 'GB'):
+        single = parser.AddressParser(country=country)
+        two_stage = parser.AddressParser(country=country, two_stage=True)
+        texts = [('every 20 chars', document(size, country, every=20)),
+                 ('every 500 chars', document(size, country, every=500)),
+                 ('no addresses', prose(size))]
+        for name, text in texts:
+            found = len(single.parse(text))
+            assert len(two_stage.parse(text)) == found
+            extra = '%d addresses' % found
+            report('%s single pass, %s' % (country, name),
+                   best_of(lambda: single.parse(text), 3), extra)
+            report('%s two-stage, %s' % (country, name),
+                   best_of(lambda: two_stage.parse(text), 3), extra)
+
+
+if __name__ == '__main__':
+    main()
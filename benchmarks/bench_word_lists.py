@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Compile and search time of large word lists written as prefix-factored
+    regexes (utils.words_to_regex) against the same lists joined with '|'
+    one word after another, the way they were written before.
+"""
+
+import re
+import time
+
+from _common import best_of, document, report
+from pyap import parser
+from pyap import utils
+from pyap.source_CA import data as ca_data
+from pyap.source_US import data as us_data
+
+
+def joined(words, ignore_case=True):
+    '''Returns words joined with '|', every word written as
+    '[Xx](?ai:rest)' when ignore_case is set
+    '''
+    if not ignore_case:
+        return '(?:' + '|'.join(re.escape(word) for word in words) + ')'
+    return '(?:' + '|'.join(
+        '[{upper}{lower}](?ai:{rest})'.format(
+            upper=word[0].upper(), lower=word[0].lower(),
+            rest=re.escape(word[1:].lower()))
+        for word in words) + ')'
+
+
+def compile_time(regex):
+    re.purge()
+    started = time.perf_counter()
+    re.compile(regex, utils.DEFAULT_FLAGS)
+    return time.perf_counter() - started
+
+
+def word_lists():
+    lists = [
+        ('US street types', us_data.street_type_list, True),
+        ('US states', us_data.state_names, True),
+        ('US state abbreviations', us_data.state_abbreviations, False),
+        ('CA provinces', ca_data.province_names, True),
+    ]
+    try:
+        from pyap.source_FR import data as fr_data
+    except (ImportError, IOError) as e:
+        print('FR word lists skipped: %s' % e)
+    else:
+        lists.append(('FR street types', fr_data.street_type_list, True))
+    return lists
+
+
+def main():
+    text = parser.AddressParser._normalize_string(
+        document(200000, 'US', every=1000))
+    for name, words, ignore_case in word_lists():
+        old = r'\b' + joined(words, ignore_case) + r'\b'
+        new = r'\b' + utils.words_to_regex(words, ignore_case) + r'\b'
+        report('%s compile, joined' % name, compile_time(old),
+               '%d words' % len(words))
+        report('%s compile, prefix-factored' % name, compile_time(new))
+
+        old = re.compile(old, utils.DEFAULT_FLAGS)
+        new = re.compile(new, utils.DEFAULT_FLAGS)
+        found = [m.span() for m in old.finditer(text)]
+        assert [m.span() for m in new.finditer(text)] == found
+        report('%s search, joined' % name,
+               best_of(lambda: list(old.finditer(text)), 3),
+               '%d found' % len(found))
+        report('%s search, prefix-factored' % name,
+               best_of(lambda: list(new.finditer(text)), 3))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,5 +3,7 @@
 """
 API hooks
 """
-from .api import parse
+from .api import parse, parse_batch, parse_multi
+from .aio import aparse, aiter_parse
+from .pool import AddressParserPool
 from .utils import (match, findall)
@@ -11,27 +11,97 @@
     :license: MIT, see LICENSE for more details.
 """
 
+from array import array
+
 from .packages import six
 
+# characters stripped from both sides of every address part
+STRIP_CHARS = ' ,;:'
+
+
+def _clean(value):
+    if value and isinstance(value, str):
+        value = value.strip(STRIP_CHARS)
+    return value
+
 
 class Address(object):
+    '''Address found in text. Address parts are available as
+    attributes (address.city) and as a dictionary (address.as_dict()).
+
+    Addresses produced by the parser keep a reference to the matched
+    text and the positions of every part; part strings and the
+    dictionary are only built when a part or the dictionary is first
+    accessed. Parts are regular attributes from then on.
+    '''
+
+    # parts are kept in __dict__ once materialized
+    __slots__ = ('_text', '_keys', '_spans', '_values', '_data', '__dict__')
 
     def __init__(self, **args):
-        keys = []
-        vals = []
-        for k, v in six.iteritems(args):
-            if v and isinstance(v, str):
-                v = v.strip(' ,;:')
-            # create object variables
-            setattr(self, k, v)
-            # prepare for dict
-            keys.append(k)
-            vals.append(v)
-        self.data_as_dict = dict(zip(keys, vals))
+        self._text = None
+        self._keys = tuple(args)
+        self._spans = ()
+        self._values = tuple(args.values())
+        self._data = None
+
+    @classmethod
+    def from_spans(cls, text, keys, spans, values=()):
+        '''Creates address whose parts are slices of text.
+        Spans holds start and end positions (-1 for parts not found)
+        of the parts named by the first len(spans) // 2 keys,
+        the remaining keys name the given values.
+        '''
+        address = cls.__new__(cls)
+        address._text = text
+        address._keys = keys
+        address._spans = array('i' if len(text) < 0x7fffffff else 'q', spans)
+        address._values = values
+        address._data = None
+        return address
+
+    def _part(self, index):
+        spans = self._spans
+        if 2 * index >= len(spans):
+            return _clean(self._values[index - len(spans) // 2])
+        start = spans[2 * index]
+        if start < 0:
+            return None
+        return _clean(self._text[start:spans[2 * index + 1]])
 
     def as_dict(self):
         # Return parsed address parts as a dictionary
-        return self.data_as_dict
+        data = self._data
+        if data is None:
+            data = {}
+            for index, key in enumerate(self._keys):
+                data[key] = self._part(index)
+            # the dictionary holds the attributes
+            self._data = self.__dict__ = data
+            # parts are materialized, the text is no longer needed
+            self._text = self._spans = self._values = None
+            self._keys = ()
+        return data
+
+    @property
+    def data_as_dict(self):
+        return self.as_dict()
+
+    def __getattr__(self, name):
+        # called only when regular lookup fails, that is for parts
+        # not materialized yet
+        if name.startswith('_') or self._data is not None or \
+                name not in self._keys:
+            raise AttributeError(name)
+        return self.as_dict()[name]
+
+    def __getstate__(self):
+        return self.as_dict()
+
+    def __setstate__(self, state):
+        self._text = self._spans = self._values = None
+        self._keys = ()
+        self._data = self.__dict__ = state
 
     def __repr__(self):
         # Address object is represented as textual address
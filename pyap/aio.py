@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.aio
+    ~~~~~~~~~~~~~~~~
+
+    This module contains asyncio API functions. Parsing runs in an
+    executor, so the event loop isn't blocked while large documents
+    are matched:
+
+        addresses = await pyap.aparse(text, country='US')
+
+        async for address in pyap.aiter_parse(pages, country='US'):
+            ...
+
+    With the GIL, matching in a thread still holds up the loop for the
+    time of each regex search; pass a ProcessPoolExecutor as executor
+    to keep the loop responsive there.
+
+    asyncio is imported on the first call, importing pyap stays cheap
+    for programs which don't use it.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import functools
+
+from . import api
+
+# documents parsed at once by aiter_parse unless told otherwise
+DEFAULT_CONCURRENCY = 4
+
+
+async def aparse(some_text, executor=None, semaphore=None, **kwargs):
+    '''Parses text in executor (the default executor of the loop when
+    None, a thread pool) and returns list of Address objects. With an
+    asyncio.Semaphore, waits for it before handing the text over,
+    so several callers can share a limit of documents in flight.
+    '''
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    parse = functools.partial(api.parse, some_text, **kwargs)
+    if semaphore is None:
+        return await loop.run_in_executor(executor, parse)
+    async with semaphore:
+        return await loop.run_in_executor(executor, parse)
+
+
+async def aiter_parse(texts, executor=None,
+                      concurrency=DEFAULT_CONCURRENCY, **kwargs):
+    '''Yields addresses found in texts, an iterable or asynchronous
+    iterable of documents, in document order.
+
+    Up to `concurrency` documents are parsed in executor at once. The
+    next document is only taken from texts when one of them has been
+    yielded, so a fast producer waits for the parsing instead of
+    piling up documents in memory.
+    '''
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    # futures of documents in flight in order, None once texts run out
+    queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            if hasattr(texts, '__aiter__'):
+                iterator = texts.__aiter__()
+            else:
+                iterator = iter(texts)
+            while True:
+                # take the next document only when it can be parsed
+                await semaphore.acquire()
+                try:
+                    if hasattr(iterator, '__anext__'):
+                        text = await iterator.__anext__()
+                    else:
+                        text = next(iterator)
+                except (StopIteration, StopAsyncIteration):
+                    break
+                queue.put_nowait(loop.run_in_executor(
+                    executor, functools.partial(api.parse, text, **kwargs)))
+        except Exception as error:
+            failed = loop.create_future()
+            failed.set_exception(error)
+            queue.put_nowait(failed)
+        queue.put_nowait(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            future = await queue.get()
+            if future is None:
+                break
+            addresses = await future
+            semaphore.release()
+            for address in addresses:
+                yield address
+    finally:
+        producer.cancel()
+        while not queue.empty():
+            future = queue.get_nowait()
+            if future is not None:
+                future.cancel()
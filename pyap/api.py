@@ -10,12 +10,30 @@
     :license: MIT, see LICENSE for more details.
 """
 
-from . import parser
+from . import multi
+from . import registry
 
 
 def parse(some_text, **kwargs):
     """Creates request to AddressParser
-    and returns list of Address objects
+    and returns list of Address objects.
+    Parsers are shared between calls with the same arguments.
     """
-    ap = parser.AddressParser(**kwargs)
+    ap = registry.get_parser(**kwargs)
     return ap.parse(some_text)
+
+
+def parse_batch(texts, **kwargs):
+    """Returns for every text the list of Address objects found in it,
+    matching many short texts at once (see AddressParser.parse_batch).
+    """
+    ap = registry.get_parser(**kwargs)
+    return ap.parse_batch(texts)
+
+
+def parse_multi(some_text, countries=multi.DEFAULT_COUNTRIES, **kwargs):
+    """Returns list of Address objects of all the given countries
+    found in text, scanning it once for the anchors of all of them
+    when hyperscan is installed (see pyap.multi).
+    """
+    return multi.parse(some_text, countries, **kwargs)
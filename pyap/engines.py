@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.engines
+    ~~~~~~~~~~~~~~~~
+
+    Regular expression engines country rules can be compiled with:
+
+        're'     the standard library (default)
+        'regex'  the third-party regex module, same syntax as re
+        're2'    google-re2, matching in linear time: no backtracking,
+                 so no input can make a search take long
+
+    Rules are written for re. Engines missing some of its constructs
+    translate the rules, dropping what they can't express; the dropped
+    constructs are listed by check() and by
+
+        python -m pyap.engines ENGINE [COUNTRY ...]
+
+    Matches of translated rules may differ from re's, compare them
+    before relying on an engine for a country.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import re
+import sys
+import threading
+
+from . import utils
+from .utils import sre_parse, sre_constants as c
+
+DEFAULT_ENGINE = 're'
+
+# flags written inline by translated regexes
+INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+# letters matched ignoring ASCII case only
+ASCII_CASE = re.IGNORECASE | re.ASCII
+
+CATEGORIES = {
+    c.CATEGORY_DIGIT: r'\d', c.CATEGORY_NOT_DIGIT: r'\D',
+    c.CATEGORY_SPACE: r'\s', c.CATEGORY_NOT_SPACE: r'\S',
+    c.CATEGORY_WORD: r'\w', c.CATEGORY_NOT_WORD: r'\W',
+}
+
+_lock = threading.Lock()
+_engines = {}
+
+
+class Engine(object):
+    '''The standard library re. Other engines override the methods
+    which differ.
+    '''
+
+    name = 're'
+    # searching again from every candidate position is cheap, so the
+    # two-stage and prefilter paths of CountryRules.finditer pay off
+    incremental = True
+    # rules can be compiled for bytes (see CountryRules)
+    binary = True
+
+    def __init__(self):
+        self.module = re
+
+    def check(self, regex, flags=utils.DEFAULT_FLAGS):
+        '''Returns descriptions of the constructs of regex
+        the engine can't handle as they are
+        '''
+        return []
+
+    def compile(self, regex, flags=utils.DEFAULT_FLAGS):
+        '''Returns compiled regex with the search, match and finditer
+        methods (taking pos and endpos) and groupindex of re patterns
+        '''
+        return self.module.compile(regex, flags)
+
+    @staticmethod
+    def spans(match):
+        '''Returns (start, end) of the whole match and every group'''
+        return match.regs
+
+
+class RegexEngine(Engine):
+    '''The regex module, compiled in its re compatible mode. Its scoped
+    groups ignore the 'a' flag, so the letters of '(?ai:...)' groups
+    are written out as '[Xx]' classes (see translate).
+    '''
+
+    name = 'regex'
+
+    def __init__(self):
+        import regex
+        self.module = regex
+
+    def compile(self, regex, flags=utils.DEFAULT_FLAGS):
+        if not isinstance(regex, bytes):
+            regex, flags = translate(regex, flags, syntax='re')[0], 0
+        return self.module.compile(regex, flags | self.module.VERSION0)
+
+
+class Re2Engine(Engine):
+    '''google-re2. Lookarounds are dropped and conditionals become plain
+    alternatives, so translated rules may accept more text than re;
+    \\b, \\d, \\s and \\w only know ASCII characters. RE2 has no 'a'
+    flag, the letters of '(?ai:...)' groups are written out as classes.
+    '''
+
+    name = 're2'
+    # the re2 module encodes the whole text on every call
+    incremental = False
+    binary = False
+    # memory for a compiled regex, the default 8MB is too little
+    # for the larger grammars
+    max_mem = 64 << 20
+
+    def __init__(self):
+        import re2
+        self.module = re2
+
+    def check(self, regex, flags=utils.DEFAULT_FLAGS):
+        return translate(regex, flags)[1]
+
+    def compile(self, regex, flags=utils.DEFAULT_FLAGS):
+        options = self.module.Options()
+        options.max_mem = self.max_mem
+        return self.module.compile(translate(regex, flags)[0], options)
+
+    @staticmethod
+    def spans(match):
+        return [match.span(index) for index in range(len(match.groups()) + 1)]
+
+
+ENGINES = dict((engine.name, engine)
+               for engine in (Engine, RegexEngine, Re2Engine))
+
+
+def get(name=DEFAULT_ENGINE):
+    '''Returns the engine called name, shared by all rules.
+    Raises ImportError when the module of the engine is not installed
+    and KeyError for unknown names.
+    '''
+    engine = _engines.get(name)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(name)
+            if engine is None:
+                engine = _engines[name] = ENGINES[name]()
+    return engine
+
+
+def translate(regex, flags=utils.DEFAULT_FLAGS, syntax='re2'):
+    '''Rewrites regex in RE2 syntax (or, with syntax='re', in re syntax
+    keeping every construct), without verbose mode and with flags
+    written inline. Letters matched ignoring ASCII case only, as in
+    '(?ai:...)' groups, are written out as '[Xx]' classes. Returns the
+    rewritten regex and descriptions of the constructs changed on the
+    way. Group numbers and names are kept.
+    '''
+    parsed = sre_parse.parse(regex, flags)
+    state = getattr(parsed, 'state', None) or parsed.pattern
+    names = dict((index, name) for name, index in state.groupdict.items())
+    problems = []
+    translator = _Translator(names, problems, syntax)
+    global_flags = state.flags
+    if global_flags & ASCII_CASE == ASCII_CASE:
+        translator.ascii_case = True
+        global_flags &= ~re.IGNORECASE
+    prefix = ''.join(letter for flag, letter in INLINE_FLAGS
+                     if global_flags & flag)
+    body = translator.pattern(parsed)
+    return ('(?%s)' % prefix if prefix else '') + body, problems
+
+
+def _literal(code, in_class=False):
+    char = chr(code)
+    if char.isalnum() or char == '_' or (char == ' ' and not in_class):
+        return char
+    if code < 0x80 and char.isprintable():
+        return '\\' + char
+    if code < 0x100 and (char.isspace() or not char.isprintable()):
+        return '\\x%02x' % code
+    return char
+
+
+def _swap_case(code):
+    '''Returns code of the other case of an ASCII letter, else None'''
+    char = chr(code)
+    if char.isascii() and char.isalpha():
+        return ord(char.swapcase())
+    return None
+
+
+class _Translator(object):
+
+    def __init__(self, names, problems, syntax='re2'):
+        self.names = names
+        self.problems = problems
+        self.syntax = syntax
+        # inside a group ignoring ASCII case only
+        self.ascii_case = False
+
+    def report(self, message, subpattern):
+        text = self.pattern(subpattern)
+        if len(text) > 40:
+            text = text[:37] + '...'
+        self.problems.append(message.format(text))
+
+    def pattern(self, subpattern):
+        return ''.join(self.item(op, av) for op, av in subpattern)
+
+    def atom(self, subpattern):
+        '''Returns subpattern as a single unit a repeat can follow'''
+        text = self.pattern(subpattern)
+        if len(subpattern) == 1:
+            op, av = subpattern[0]
+            if op in (c.LITERAL, c.NOT_LITERAL, c.ANY, c.IN, c.BRANCH,
+                      c.SUBPATTERN):
+                return text
+        return '(?:' + text + ')'
+
+    def item(self, op, av):
+        if op in (c.LITERAL, c.NOT_LITERAL) and self.ascii_case and \
+                _swap_case(av) is not None:
+            return self.charset(
+                ([(c.NEGATE, None)] if op is c.NOT_LITERAL else []) +
+                [(c.LITERAL, min(av, _swap_case(av)))])
+        if op is c.LITERAL:
+            return _literal(av)
+        if op is c.NOT_LITERAL:
+            return '[^' + _literal(av, True) + ']'
+        if op is c.ANY:
+            return '.'
+        if op is c.IN:
+            return self.charset(av)
+        if op is c.BRANCH:
+            return '(?:' + '|'.join(self.pattern(item) for item in av[1]) + ')'
+        if op is c.SUBPATTERN:
+            group, add_flags, del_flags, item = av
+            ascii_case = self.ascii_case
+            if add_flags & ASCII_CASE == ASCII_CASE:
+                self.ascii_case = True
+                add_flags &= ~re.IGNORECASE
+            elif add_flags & re.IGNORECASE or del_flags & re.IGNORECASE:
+                self.ascii_case = False
+            try:
+                text = self.pattern(item)
+            finally:
+                self.ascii_case = ascii_case
+            if add_flags or del_flags:
+                removed = ''.join(letter for flag, letter in INLINE_FLAGS
+                                  if del_flags & flag)
+                text = '(?%s%s:%s)' % (
+                    ''.join(letter for flag, letter in INLINE_FLAGS
+                            if add_flags & flag),
+                    '-' + removed if removed else '', text)
+            if group is None:
+                return text if add_flags or del_flags else '(?:' + text + ')'
+            if group in self.names:
+                return '(?P<%s>%s)' % (self.names[group], text)
+            return '(' + text + ')'
+        if op in (c.MAX_REPEAT, c.MIN_REPEAT) or \
+                op is getattr(c, 'POSSESSIVE_REPEAT', None):
+            low, high, item = av
+            if high == c.MAXREPEAT:
+                repeat = {0: '*', 1: '+'}.get(low, '{%d,}' % low)
+            elif (low, high) == (0, 1):
+                repeat = '?'
+            elif low == high:
+                repeat = '{%d}' % low
+            else:
+                repeat = '{%d,%d}' % (low, high)
+            if op is c.MIN_REPEAT:
+                repeat += '?'
+            elif op is not c.MAX_REPEAT:
+                if self.syntax == 're':
+                    repeat += '+'
+                else:
+                    self.report('possessive repeat of {0} made greedy', item)
+            return self.atom(item) + repeat
+        if op is c.AT:
+            return {c.AT_BEGINNING: '^', c.AT_END: '$',
+                    c.AT_BEGINNING_STRING: r'\A',
+                    c.AT_END_STRING: r'\Z' if self.syntax == 're' else r'\z',
+                    c.AT_BOUNDARY: r'\b',
+                    c.AT_NON_BOUNDARY: r'\B'}[av]
+        if self.syntax == 're':
+            text = self.kept(op, av)
+            if text is not None:
+                return text
+        if op in (c.ASSERT, c.ASSERT_NOT):
+            direction, item = av
+            self.report('{kind} (?{sign}{{0}}) dropped'.format(
+                kind='lookahead' if direction > 0 else 'lookbehind',
+                sign=('' if direction > 0 else '<') +
+                ('=' if op is c.ASSERT else '!')), item)
+            return ''
+        if op is c.GROUPREF_EXISTS:
+            group, yes, no = av
+            self.report('conditional on group %s made an alternative: {0}'
+                        % self.names.get(group, group), yes)
+            return '(?:%s|%s)' % (self.pattern(yes),
+                                  self.pattern(no) if no else '')
+        if op is getattr(c, 'ATOMIC_GROUP', None):
+            self.report('atomic group (?>{0}) made a plain group', av)
+            return '(?:' + self.pattern(av) + ')'
+        raise ValueError('Regex construct not supported: %s' % op)
+
+    def kept(self, op, av):
+        '''Returns constructs of re RE2 has no syntax for as they are,
+        None for other constructs
+        '''
+        if op in (c.ASSERT, c.ASSERT_NOT):
+            direction, item = av
+            return '(?%s%s%s)' % ('' if direction > 0 else '<',
+                                  '=' if op is c.ASSERT else '!',
+                                  self.pattern(item))
+        if op is c.GROUPREF_EXISTS:
+            group, yes, no = av
+            return '(?(%s)%s%s)' % (
+                self.names.get(group, group), self.pattern(yes),
+                '|' + self.pattern(no) if no else '')
+        if op is getattr(c, 'ATOMIC_GROUP', None):
+            return '(?>' + self.pattern(av) + ')'
+        if op is c.GROUPREF:
+            if self.ascii_case:
+                raise ValueError('Backreference ignoring ASCII case '
+                                 'not supported')
+            if av in self.names:
+                return '(?P=%s)' % self.names[av]
+            return '\\%d' % av
+        return None
+
+    def charset(self, items):
+        negate = ''
+        parts = []
+        for op, av in items:
+            if op is c.NEGATE:
+                negate = '^'
+            elif op is c.LITERAL:
+                parts.append(_literal(av, True))
+                if self.ascii_case and _swap_case(av) is not None:
+                    parts.append(_literal(_swap_case(av), True))
+            elif op is c.RANGE:
+                parts.append(_literal(av[0], True) + '-' +
+                             _literal(av[1], True))
+                if self.ascii_case:
+                    # letters of the range in the other case
+                    for low, high in ((0x41, 0x5a), (0x61, 0x7a)):
+                        low, high = max(av[0], low), min(av[1], high)
+                        if low <= high:
+                            parts.append(
+                                _literal(_swap_case(low), True) + '-' +
+                                _literal(_swap_case(high), True))
+            elif op is c.CATEGORY:
+                parts.append(CATEGORIES[av])
+            else:
+                raise ValueError('Character set item not supported: %s' % op)
+        if not negate and len(parts) == 1 and parts[0] in CATEGORIES.values():
+            return parts[0]
+        return '[' + negate + ''.join(parts) + ']'
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        print(__doc__, file=sys.stderr)
+        return 2
+    from . import registry
+
+    engine = get(args[0])
+    countries = [country.upper() for country in args[1:]] or \
+        ['US', 'CA', 'GB', 'FR']
+    for country in countries:
+        data = registry.load_data(country)
+        problems = engine.check(data.full_address)
+        print('{country}: {count} constructs changed'.format(
+            country=country, count=len(problems)))
+        for problem in problems:
+            print('    ' + problem)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,3 +27,10 @@ class CountryDetectionMissing(AddressParserException):
     def __init__(self, message, errors):
         super(CountryDetectionMissing, self).__init__(message)
         self.errors = errors
+
+
+class EngineMissing(AddressParserException):
+    ''' Regex engine is unknown or its module is not installed '''
+    def __init__(self, message, errors):
+        super(EngineMissing, self).__init__(message)
+        self.errors = errors
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.freeze
+    ~~~~~~~~~~~~~~~~
+
+    Build step assembling the detection rules of every country into
+    a generated 'frozen' module, so importing the rules at runtime only
+    loads string constants instead of running the grammar assembly of
+    the data modules.
+
+    Run it after changing a data module or pyap.utils:
+
+        python -m pyap.freeze [COUNTRY ...]
+
+    Frozen modules record a fingerprint of the rules they hold. The
+    registry loads them without looking at the data modules; rules out
+    of date with their data module are reported by the test suite and by
+
+        python -m pyap.freeze --check [COUNTRY ...]
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import os
+import sys
+import zlib
+import importlib
+
+# module level names of a data module used by the registry
+FROZEN_NAMES = ('full_address', 'address_anchor', 'address_start_words',
+                'address_gazetteers', 'address_fold_accents')
+
+# countries frozen when none are given on the command line
+DEFAULT_COUNTRIES = ('US', 'CA', 'GB', 'FR')
+
+_root = os.path.dirname(os.path.abspath(__file__))
+
+TEMPLATE = '''# -*- coding: utf-8 -*-
+# Generated by 'python -m pyap.freeze {country}' from
+# pyap/source_{country}/data.py. Do not edit.
+
+fingerprint = {fingerprint!r}
+'''
+
+
+def rules(country):
+    '''Returns (name, value) pairs of the rules assembled by the data
+    module of a country
+    '''
+    data = importlib.import_module('pyap.source_' + country + '.data')
+    return [(name, getattr(data, name)) for name in FROZEN_NAMES
+            if hasattr(data, name)]
+
+
+def fingerprint(country):
+    '''Returns hash of the rules of a country: edits of the data module
+    or of pyap.utils leaving the rules as they are don't change it
+    '''
+    return '%08x' % zlib.crc32(repr(rules(country)).encode('utf-8'))
+
+
+def render(country):
+    '''Returns source code of the frozen module of a country'''
+    lines = [TEMPLATE.format(country=country,
+                             fingerprint=fingerprint(country))]
+    for name, value in rules(country):
+        lines.append('{name} = {value!r}\n'.format(name=name, value=value))
+    return '\n'.join(lines)
+
+
+def path(country):
+    '''Returns path of the frozen module of a country'''
+    return os.path.join(_root, 'source_' + country, 'frozen.py')
+
+
+def freeze(country):
+    '''Writes the frozen module of a country, returns its path'''
+    source = render(country)
+    with open(path(country), 'w', encoding='utf-8') as f:
+        f.write(source)
+    return path(country)
+
+
+def up_to_date(country):
+    '''Returns True when the frozen module of a country holds the rules
+    of its data module
+    '''
+    try:
+        with open(path(country), encoding='utf-8') as f:
+            return f.read() == render(country)
+    except (IOError, OSError):
+        return False
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    check = '--check' in argv
+    countries = [country.upper() for country in argv if country != '--check']
+    failed = False
+    for country in countries or DEFAULT_COUNTRIES:
+        try:
+            if not check:
+                print('wrote ' + freeze(country))
+            elif not up_to_date(country):
+                print('out of date: ' + path(country))
+                failed = True
+        except ImportError as e:
+            # e.g. optional dependencies of a data module are missing
+            print('{country} skipped: {error}'.format(
+                country=country, error=e), file=sys.stderr)
+            failed = failed or bool(countries)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
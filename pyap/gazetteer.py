@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.gazetteer
+    ~~~~~~~~~~~~~~~~
+
+    Lists of known names (communes, cities...) used to validate parts of
+    addresses instead of spelling every name out in the rules: the rules
+    capture a generic run of words and the name is looked up afterwards.
+
+    Names are compared folded: case, accents and separators between
+    words are ignored, so 'Saint-Étienne' is the same as 'SAINT ETIENNE'.
+
+    Lists shipped with the package are compact tables built from CSV
+    files with
+
+        python -m pyap.gazetteer SOURCE.csv COLUMN TABLE [DELIMITER [ENCODING]]
+
+    Tables are memory-mapped, so processes share their pages and only
+    the pages a lookup touches are read.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import io
+import os
+import re
+import csv
+import sys
+import mmap
+import array
+import struct
+import threading
+import unicodedata
+
+WORD = re.compile(r'[^\W_]+', re.UNICODE)
+
+# table layout: TABLE_MAGIC, number of names and the longest name in
+# words as two little-endian uint32, (number + 1) uint32 offsets of the
+# names in the data, then the sorted UTF-8 encoded names
+TABLE_MAGIC = b'pyap-gazetteer-1\n'
+TABLE_HEADER = struct.Struct('<II')
+
+_root = os.path.dirname(os.path.abspath(__file__))
+_lock = threading.Lock()
+_loaded = {}
+
+
+def fold(text):
+    '''Returns text without case and accents'''
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize('NFKD', text)
+    return u''.join(char for char in text
+                    if not unicodedata.combining(char)).casefold()
+
+
+def normalize(name):
+    '''Returns folded words of name separated by single spaces'''
+    return u' '.join(WORD.findall(fold(name)))
+
+
+class NameTable(object):
+    '''Sorted normalized names stored in a table (see TABLE_MAGIC),
+    searched in place
+    '''
+
+    def __init__(self, buffer):
+        if buffer[:len(TABLE_MAGIC)] != TABLE_MAGIC:
+            raise ValueError('Not a gazetteer table')
+        start = len(TABLE_MAGIC) + TABLE_HEADER.size
+        self._count, self.max_words = TABLE_HEADER.unpack_from(
+            buffer, len(TABLE_MAGIC))
+        end = start + 4 * (self._count + 1)
+        if sys.byteorder == 'little' and array.array('I').itemsize == 4:
+            # offsets are read in place
+            self._offsets = memoryview(buffer)[start:end].cast('I')
+        else:
+            self._offsets = struct.unpack_from(
+                '<%dI' % (self._count + 1), buffer, start)
+        self._data = buffer
+        self._base = end
+
+    @classmethod
+    def open(cls, path):
+        '''Memory-maps a table file'''
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def dumps(names):
+        '''Returns table of normalized names'''
+        names = sorted(set(name.encode('utf-8') for name in names))
+        max_words = max([name.count(b' ') + 1 for name in names] or [0])
+        offsets = [0]
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+        return b''.join([
+            TABLE_MAGIC,
+            TABLE_HEADER.pack(len(names), max_words),
+            struct.pack('<%dI' % len(offsets), *offsets),
+        ] + names)
+
+    def _name(self, index):
+        base = self._base
+        return self._data[base + self._offsets[index]:
+                          base + self._offsets[index + 1]]
+
+    def __contains__(self, name):
+        key = name.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            found = self._name(middle)
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._name(index).decode('utf-8')
+
+
+class Gazetteer(object):
+    '''Set of known names of one kind, e.g. French communes'''
+
+    def __init__(self, names):
+        if isinstance(names, NameTable):
+            self.names = names
+            self.max_words = names.max_words
+        else:
+            self.names = frozenset(filter(None, map(normalize, names)))
+            # longest name in words, to stop looking for longer prefixes
+            self.max_words = max(
+                [name.count(u' ') + 1 for name in self.names] or [0])
+
+    @classmethod
+    def from_csv(cls, path, column, delimiter=',', encoding='utf-8'):
+        '''Reads names from a column of a CSV file'''
+        with io.open(path, encoding=encoding, newline='') as f:
+            rows = csv.reader(f, delimiter=delimiter)
+            index = next(rows).index(column)
+            return cls(row[index] for row in rows if len(row) > index)
+
+    @classmethod
+    def from_table(cls, path):
+        '''Opens a table file written by save'''
+        return cls(NameTable.open(path))
+
+    def save(self, path):
+        '''Writes names to a table file'''
+        with open(path, 'wb') as f:
+            f.write(NameTable.dumps(self.names))
+
+    def __contains__(self, name):
+        return normalize(name) in self.names
+
+    def __len__(self):
+        return len(self.names)
+
+    def longest_prefix(self, text):
+        '''Returns length of the longest prefix of text made of whole
+        words which is a known name, 0 when text starts with none
+        '''
+        words = []
+        length = 0
+        for word in WORD.finditer(text):
+            words.append(fold(word.group()))
+            if len(words) > self.max_words:
+                break
+            if u' '.join(words) in self.names:
+                length = word.end()
+        return length
+
+
+def load(path, **options):
+    '''Returns gazetteer read from a CSV file (with options
+    of Gazetteer.from_csv) or opened from a table file
+    '''
+    if path.endswith('.csv'):
+        return Gazetteer.from_csv(path, **options)
+    return Gazetteer.from_table(path)
+
+
+def get(country, spec):
+    '''Returns the gazetteer described by spec, loading it once per
+    process. Spec is a Gazetteer or a dict of load arguments with
+    the path relative to the data package of the country.
+    '''
+    if isinstance(spec, Gazetteer):
+        return spec
+    key = (country, tuple(sorted(spec.items())))
+    with _lock:
+        gazetteer = _loaded.get(key)
+        if gazetteer is None:
+            spec = dict(spec)
+            spec['path'] = os.path.join(
+                _root, 'source_' + country, spec['path'])
+            gazetteer = _loaded[key] = load(**spec)
+        return gazetteer
+
+
+def main(argv=None):
+    args = sys.argv[1:] if argv is None else argv
+    if not 3 <= len(args) <= 5:
+        print(__doc__, file=sys.stderr)
+        return 2
+    source, column, table = args[:3]
+    options = dict(zip(('delimiter', 'encoding'), args[3:]))
+    gazetteer = Gazetteer.from_csv(source, column, **options)
+    gazetteer.save(table)
+    print('wrote {count} names to {table}'.format(
+        count=len(gazetteer), table=table))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
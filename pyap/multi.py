@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.multi
+    ~~~~~~~~~~~~~~~~
+
+    Looks for addresses of several countries in one text. The anchors
+    of every country (states, provinces, postcodes...) are compiled
+    into a single Hyperscan database when the hyperscan package is
+    installed, so the text is scanned for all of them at once and the
+    rules of a country only run near its anchors, or not at all.
+    Without hyperscan every country looks for its own anchors.
+    Results are the same either way.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import threading
+
+from . import engines
+from . import registry
+from .parser import AddressParser, OffsetMap
+
+DEFAULT_COUNTRIES = ('US', 'CA', 'GB', 'FR')
+
+_lock = threading.Lock()
+_prefilters = {}
+
+
+def _load_hyperscan():
+    '''Returns the hyperscan module, None when it is not installed'''
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    return hyperscan
+
+
+class Prefilter(object):
+    '''Finds the ranges of positions addresses of every country may
+    start at, scanning text once for the anchors of all countries.
+    Rules without an anchor, and all rules when hyperscan is not
+    installed, get no ranges and look for addresses on their own.
+    '''
+
+    def __init__(self, rules):
+        self.rules = tuple(rules)
+        self.database = None
+        # index in self.rules of every pattern in the database
+        self._ids = []
+        hyperscan = _load_hyperscan()
+        if hyperscan is None:
+            return
+        patterns = []
+        for index, rules in enumerate(self.rules):
+            if rules.anchor_source is None or \
+                    rules.max_width is None or not rules.engine.incremental:
+                continue
+            # dropped lookarounds only let more text through
+            patterns.append(engines.translate(
+                rules.anchor_source, rules.flags)[0].encode('utf-8'))
+            self._ids.append(index)
+        if not patterns:
+            return
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=patterns, ids=list(range(len(patterns))),
+                elements=len(patterns),
+                flags=hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP |
+                hyperscan.HS_FLAG_SOM_LEFTMOST)
+        except hyperscan.error:
+            # a pattern Hyperscan can't handle, look for anchors in Python
+            self._ids = []
+            return
+        self._hyperscan = hyperscan
+        self.database = database
+        # scratch space can't be shared between threads
+        self._local = threading.local()
+
+    def ranges(self, text):
+        '''Returns for every rules a list of sorted (first, last) ranges
+        of positions in text an address may start at, or None when the
+        rules have to look for themselves.
+        '''
+        result = [None] * len(self.rules)
+        if self.database is None:
+            return result
+        # rules folding accents look at other text than the rest,
+        # unless there are no accents
+        texts = {}
+        ascii = text.isascii()
+        for pattern, index in enumerate(self._ids):
+            rules = self.rules[index]
+            key = rules.fold_accents and not ascii
+            if key not in texts:
+                texts[key] = (rules.shadow(text), [])
+            texts[key][1].append(pattern)
+        for shadow, patterns in texts.values():
+            hits = self._scan(shadow)
+            for pattern in patterns:
+                index = self._ids[pattern]
+                result[index] = _merge(hits[pattern],
+                                       self.rules[index].max_width)
+        return result
+
+    def _scan(self, text):
+        '''Returns (start, end) of the matches of every pattern,
+        as positions in text
+        '''
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = self._hyperscan.Scratch(
+                self.database)
+        hits = [[] for _ in self._ids]
+
+        def on_match(pattern, start, end, flags, context):
+            hits[pattern].append((start, end))
+
+        # lone surrogates (bytes decoded with 'surrogateescape') are no
+        # valid UTF-8, which Hyperscan must not get; '?' keeps every
+        # character one unit long
+        data = text.encode('utf-8', 'replace')
+        self.database.scan(data, match_event_handler=on_match,
+                           scratch=scratch)
+        if len(data) != len(text):
+            hits = _char_offsets(data, hits)
+        return hits
+
+
+def _merge(hits, width):
+    '''Returns merged ranges of positions up to width characters
+    before an anchor. Hyperscan reports the leftmost start of the
+    anchors ending at a position, an anchor starting later is still
+    covered by taking everything up to the end of the match.
+    '''
+    ranges = []
+    for start, end in sorted(hits):
+        first, last = max(0, start - width), max(start, end - 1)
+        if ranges and first <= ranges[-1][1] + 1:
+            if last > ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], last)
+        else:
+            ranges.append((first, last))
+    return ranges
+
+
+def _char_offsets(data, hits):
+    '''Converts offsets in UTF-8 encoded data to character offsets'''
+    offsets = sorted(set(offset for found in hits
+                         for span in found for offset in span))
+    chars = {}
+    count = last = 0
+    for offset in offsets:
+        count += len(data[last:offset].decode('utf-8'))
+        chars[offset] = count
+        last = offset
+    return [[(chars[start], chars[end]) for start, end in found]
+            for found in hits]
+
+
+def get_prefilter(rules):
+    '''Returns the prefilter of a sequence of rules, built once'''
+    key = tuple(rules)
+    with _lock:
+        prefilter = _prefilters.get(key)
+        if prefilter is None:
+            prefilter = _prefilters[key] = Prefilter(rules)
+        return prefilter
+
+
+def iter_parse(text, countries=DEFAULT_COUNTRIES, **kwargs):
+    '''Yields addresses of every country found in text, country after
+    country in the given order. kwargs configure the parsers like in
+    pyap.parse.
+    '''
+    if isinstance(countries, str):
+        countries = [countries]
+    parsers = [registry.get_parser(country=country, **kwargs)
+               for country in countries]
+    prefilter = get_prefilter([parser._rules for parser in parsers])
+    offsets = OffsetMap()
+    clean_text = AddressParser._normalize_string(text, offsets)
+    all_ranges = prefilter.ranges(clean_text)
+    for parser, ranges in zip(parsers, all_ranges):
+        rules = parser._rules
+        if parser.fold_accents not in (None, rules.fold_accents):
+            # anchors were looked for in other text than is matched
+            ranges = None
+        if ranges == [] and parser.prefilter:
+            # no anchor of the country in text
+            continue
+        for match in rules.finditer(
+                rules.shadow(clean_text, parser.fold_accents), 0,
+                parser.two_stage, parser.prefilter,
+                ranges if parser.prefilter else None):
+            yield parser._parse_address(match, 0, clean_text, offsets)
+
+
+def parse(text, countries=DEFAULT_COUNTRIES, **kwargs):
+    '''Returns list of addresses of every country found in text'''
+    return list(iter_parse(text, countries, **kwargs))
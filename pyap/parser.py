@@ -12,15 +12,315 @@
 """
 
 import re
-import importlib
+import mmap
+import codecs
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
 
 from . import exceptions as e
 from . import address
+from . import engines
+from . import registry
 from . import utils
 from .packages import six
 
+# all types of hyphens/dashes converted to a simple old-school dash
+# from http://utf8-chartable.de/unicode-utf8-table.pl?
+# start=8192&number=128&utf8=string-literal
+DASHES = frozenset(u'‐‑‒–—―')
+
+# Matches a single dash or a run of whitespaces and commas (except a
+# lone space, which needs no change). Starting with a character set lets
+# re skip ordinary text quickly, so the whole text is rewritten in one pass.
+NORMALIZE = re.compile(r'''
+    [\s,‐-―]
+    (?:
+        (?<=[‐-―])         # a dash
+        |[\s,]+            # several whitespaces/commas
+        |(?<![\ ‐-―])      # single whitespace other than a space
+    )
+''', re.VERBOSE | re.UNICODE)
+
+
+# whitespace matched by \s in text besides ASCII whitespace
+UNICODE_SPACES = (u'\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+                  u'\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f'
+                  u'\u205f\u3000')
+
+# ASCII whitespace and commas, as bytes
+ASCII_SPACES = b'\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f ,'
+
+DASH_BYTES = frozenset(dash.encode('utf-8') for dash in DASHES)
+
+
+def _utf8_tails(chars):
+    '''Returns the regexes matching the rest of the UTF-8 encoded chars
+    by their first byte
+    '''
+    tails = {}
+    for char in chars:
+        char = char.encode('utf-8')
+        tails.setdefault(char[:1], []).append(re.escape(char[1:]))
+    return dict((lead, b'(?:' + b'|'.join(rest) + b')')
+                for lead, rest in tails.items())
+
+
+# whitespace other than ASCII, as bytes
+_SPACE_TAILS = _utf8_tails(UNICODE_SPACES)
+
+# a whitespace character or a comma, as bytes
+_SPACE_BYTES = b'(?:' + b'|'.join([br'[\t-\r\x1c-\x20,]'] + [
+    re.escape(lead) + tails
+    for lead, tails in sorted(_SPACE_TAILS.items())]) + b')'
+
+# NORMALIZE for UTF-8 encoded bytes. Like there, the regex starts with
+# a set of bytes (ASCII whitespace, commas and the first byte of other
+# whitespace and dashes) for re to skip ordinary text quickly; the rest
+# is told apart by the byte consumed.
+NORMALIZE_BYTES = re.compile(
+    br'[\t-\r\x1c-\x20,' +
+    b''.join(re.escape(lead) for lead in sorted(_SPACE_TAILS)) + br']'
+    br'(?:'
+    br'(?<=[\t-\r\x1c-\x20,])' + _SPACE_BYTES + b'+'    # a run
+    br'|(?<=[\t-\r\x1c-\x1f,])'   # a single character other than a space
+    br'|(?<=\xe2)\x80[\x90-\x95]' +                       # a dash
+    b''.join(b'|(?<=' + re.escape(lead) + b')' + tails + _SPACE_BYTES + b'*'
+             for lead, tails in sorted(_SPACE_TAILS.items())) +
+    b')')
+
+# types of input taken as UTF-8 encoded text by AddressParser.iter_parse
+BINARY_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# default number of characters read at once by AddressParser.parse_stream
+STREAM_CHUNK_SIZE = 1 << 20
+
+# joins the texts parse_batch matches at once: no rule matches it and
+# it is neither a word character nor whitespace, so it stops a match
+# and normalization like the end or the start of a text does
+BATCH_SEPARATOR = u'\x00'
+# characters of texts parse_batch joins into one buffer
+BATCH_SIZE = 1 << 20
+
+
+def _replace_normalized(match):
+    '''Dashes become '-', whitespace runs containing newlines
+    or commas become ', ', any other run becomes a single space
+    '''
+    run = match.group()
+    if run in DASHES:
+        return u'-'
+    if u',' in run or u'\n' in run:
+        return u', '
+    return u' '
+
+
+def _replace_normalized_bytes(match):
+    '''_replace_normalized for UTF-8 encoded bytes'''
+    run = match.group()
+    if run in DASH_BYTES:
+        return b'-'
+    if b',' in run or b'\n' in run:
+        return b', '
+    return b' '
+
+
+def _text_tail(raw):
+    '''Returns where the whitespace run ending a chunk of text starts.
+    Runs are normalized as a whole, so the run waits for the rest
+    of it in the next chunk.
+    '''
+    end = len(raw)
+    while end and (raw[end - 1].isspace() or raw[end - 1] == u','):
+        end -= 1
+    return end
+
+
+def _binary_tail(raw):
+    '''_text_tail for UTF-8 encoded bytes, where the last character
+    may be cut in the middle as well: it waits for the next chunk
+    together with the whitespace before it
+    '''
+    end = len(raw)
+    lead = end
+    while lead > max(0, end - 3) and 0x80 <= raw[lead - 1] < 0xc0:
+        lead -= 1
+    if lead and raw[lead - 1] >= 0xc0:
+        end = lead - 1
+    while end:
+        if raw[end - 1] in ASCII_SPACES:
+            end -= 1
+            continue
+        for space in UNICODE_SPACES:
+            space = space.encode('utf-8')
+            if raw.endswith(space, 0, end):
+                end -= len(space)
+                break
+        else:
+            break
+    return end
+
+
+def _decode_spans(data, base, spans):
+    '''Decodes UTF-8 encoded data found at position base of the matched
+    bytes. Returns the text and spans (positions in the matched bytes,
+    -1 for parts not found) turned into positions in the text.
+    '''
+    text = data.decode('utf-8', 'surrogateescape')
+    if len(text) == len(data):
+        return text, [p - base if p >= 0 else p for p in spans]
+    return text, [len(data[:p - base].decode('utf-8', 'surrogateescape'))
+                  if p >= 0 else p for p in spans]
+
+
+class Utf8Offsets(object):
+    '''Turns positions in a text into positions in its UTF-8 encoding,
+    or positions in UTF-8 encoded data into positions in the decoded
+    text. Positions must be given in growing order: the text is only
+    measured from the last position on, so converting all positions
+    costs a single pass.
+    '''
+
+    def __init__(self, data):
+        self._data = data
+        self._binary = not isinstance(data, str)
+        if self._binary:
+            decode = codecs.getincrementaldecoder('utf-8')(
+                'surrogateescape').decode
+            self._measure = lambda piece: len(decode(piece))
+        else:
+            self._measure = lambda piece: len(
+                piece.encode('utf-8', 'surrogateescape'))
+        self._position = 0
+        self._converted = 0
+
+    def __call__(self, position):
+        while self._position < position:
+            piece = self._data[self._position:min(
+                position, self._position + STREAM_CHUNK_SIZE)]
+            if self._binary:
+                piece = bytes(piece)
+            self._position += len(piece)
+            self._converted += len(piece) if piece.isascii() else \
+                self._measure(piece)
+        return self._converted
+
+
+class OffsetMap(object):
+    '''Maps positions in normalized text to positions in the text it was
+    normalized from. Normalization shifts positions only where a run is
+    replaced by a string of another length, so the map keeps just those
+    places: the normalized position after every such run and the shift
+    from there on. It is built in the same pass as the normalized text
+    and a lookup is a binary search.
+    '''
+
+    __slots__ = ('_positions', '_shifts')
+
+    def __init__(self):
+        self._positions = array('q', [0])
+        self._shifts = array('q', [0])
+
+    @property
+    def shift(self):
+        '''Shift at the end of the text mapped so far'''
+        return self._shifts[-1]
+
+    def add(self, position, shift):
+        '''Records that normalized positions from position on are
+        shift characters before their original positions
+        '''
+        self._positions.append(position)
+        self._shifts.append(shift)
+
+    def original(self, position):
+        '''Returns original position of a normalized position'''
+        index = bisect_right(self._positions, position) - 1
+        return position + self._shifts[index]
+
+    def normalized(self, position):
+        '''Returns normalized position of an original position
+        which is not inside a replaced run
+        '''
+        positions, shifts = self._positions, self._shifts
+        low, high = 1, len(positions)
+        while low < high:
+            middle = (low + high) // 2
+            if positions[middle] + shifts[middle] <= position:
+                low = middle + 1
+            else:
+                high = middle
+        return position - shifts[low - 1]
+
+    def discard(self, position):
+        '''Forgets places before position, which is no longer looked up'''
+        index = bisect_right(self._positions, position) - 1
+        if index > 0:
+            del self._positions[:index]
+            del self._shifts[:index]
+
+    def __len__(self):
+        return len(self._positions)
+
+
+class Utf8OffsetMap(OffsetMap):
+    '''OffsetMap of normalized UTF-8 encoded bytes. Besides the shift
+    in bytes it keeps the shift in characters at every place, which
+    differ where a run of multibyte whitespace or a dash is replaced.
+    '''
+
+    __slots__ = ('_char_shifts',)
+
+    def __init__(self):
+        OffsetMap.__init__(self)
+        self._char_shifts = array('q', [0])
+
+    @property
+    def char_shift(self):
+        '''Shift in characters at the end of the bytes mapped so far'''
+        return self._char_shifts[-1]
+
+    def add(self, position, shift, char_shift=0):
+        '''Records that normalized positions from position on are
+        shift bytes and char_shift characters before their original
+        positions
+        '''
+        OffsetMap.add(self, position, shift)
+        self._char_shifts.append(char_shift)
+
+    def characters(self, position, original):
+        '''Returns the position in the normalized characters of a
+        normalized position, given the position in the original
+        characters of the place it maps to
+        '''
+        index = bisect_right(self._positions, position) - 1
+        return original - self._char_shifts[index]
+
+    def discard(self, position):
+        index = bisect_right(self._positions, position) - 1
+        if index > 0:
+            del self._char_shifts[:index]
+        OffsetMap.discard(self, position)
+
 
 class AddressParser:
+    '''Finds and parses addresses of a country in text. Parsers hold
+    no state besides their options and the compiled rules, so one
+    instance can be used by several threads at once.
+    '''
+
+    # find addresses with the capture-free detector before parsing them;
+    # pays off only for rules slow to match in full, like GB's
+    two_stage = False
+    # try matching only near anchors (states, postcodes) of the country
+    prefilter = True
+    # regex engine the rules are compiled with (see pyap.engines)
+    engine = engines.DEFAULT_ENGINE
+    # match the rules against text with accents folded ('Québec' is
+    # matched as 'Quebec'); None leaves it to the country rules, which
+    # fold for CA and FR. Their rules are written without accents, so
+    # without folding they miss accented spellings.
+    fold_accents = None
 
     def __init__(self, **args):
         '''Initialize with custom arguments'''
@@ -30,11 +330,16 @@ class AddressParser:
                 v = v.upper()
             setattr(self, k, v)
         try:
-            # import detection rules
-            package = 'pyap' + '.source_' + self.country + \
-                '.data'
-            data = importlib.import_module(package)
-            self.rules = data.full_address
+            engines.get(self.engine)
+        except (ImportError, KeyError):
+            raise e.EngineMissing(
+                'Regex engine "{engine}" is not available.'.
+                format(engine=self.engine), 'Error 3'
+            )
+        try:
+            # import detection rules (compiled once per process)
+            self._rules = registry.get_rules(self.country, self.engine)
+            self.rules = self._rules.source
 
         except AttributeError:
             raise e.NoCountrySelected(
@@ -51,84 +356,326 @@ class AddressParser:
         '''Returns a list of addresses found in text
         together with parsed address parts
         '''
-        results = []
+        return list(self.iter_parse(text))
+
+    def iter_parse(self, text):
+        '''Yields addresses found in text one by one, as soon
+        as they are matched, without collecting all of them first.
+
+        bytes, bytearray, memoryview and mmap objects are taken as UTF-8
+        encoded text and matched as bytes, chunk by chunk: a memory-mapped
+        file is never read whole and only addresses are decoded. Their
+        orig_start and orig_end are positions in the decoded text,
+        match_start and match_end positions in the normalized text, like
+        for str, and byte_start and byte_end positions in the bytes.
+        Countries whose
+        rules can't match bytes (see registry.CountryRules), and parsers
+        folding accents, get the input decoded first, with
+        'surrogateescape' for invalid UTF-8.
+        '''
+        if isinstance(text, BINARY_TYPES):
+            rules = None
+            if not self.fold_accents:
+                try:
+                    rules = registry.get_rules(self.country, self.engine,
+                                               binary=True)
+                except ValueError:
+                    pass
+            if rules is None:
+                text = codecs.decode(text, 'utf-8', 'surrogateescape')
+                return self._iter_parse_text(text, Utf8Offsets(text))
+            return self._iter_parse_binary(text, rules)
         if isinstance(text, str):
             if six.PY2:
                 text = unicode(text, 'utf-8')
-        self.clean_text = self._normalize_string(text)
+        return self._iter_parse_text(text)
+
+    def _iter_parse_text(self, text, utf8=None):
+        # all state of a call is local: a parser can be shared between
+        # threads and keeps no reference to the text once done
+        offsets = OffsetMap()
+        clean_text = self._normalize_string(text, offsets)
+        rules = self._rules
 
         # get addresses
-        address_matches = utils.finditer(self.rules, self.clean_text)
-        if address_matches:
-            # append parsed address info
-            results = list(map(self._parse_address, address_matches))
+        for match in rules.finditer(rules.shadow(clean_text,
+                                                 self.fold_accents), 0,
+                                    self.two_stage, self.prefilter):
+            # parsed address info
+            yield self._parse_address(match, 0, clean_text, offsets, utf8)
 
+    def parse_batch(self, texts, batch_size=BATCH_SIZE):
+        '''Returns for every text the list of addresses found in it,
+        like [self.parse(text) for text in texts], but normalizing and
+        matching texts joined into buffers of about batch_size
+        characters, which saves the cost of a call for every text when
+        texts are short.
+        '''
+        results = []
+        batch = []
+        size = 0
+        for text in texts:
+            batch.append(text)
+            results.append([])
+            size += len(text)
+            if size >= batch_size:
+                self._parse_joined(batch, results[-len(batch):])
+                batch = []
+                size = 0
+        if batch:
+            self._parse_joined(batch, results[-len(batch):])
         return results
 
-    def _parse_address(self, match):
-        '''Parses address into parts'''
+    def _parse_joined(self, texts, results):
+        '''Matches texts joined by BATCH_SEPARATOR at once and appends
+        the addresses found in every text to its list in results. The
+        text a match is in is found by a binary search over the
+        positions the texts start at in the joined text.
+        '''
+        starts = array('q', [0])
+        starts.extend(accumulate(len(text) + len(BATCH_SEPARATOR)
+                                 for text in texts[:-1]))
+        offsets = OffsetMap()
+        clean_text = self._normalize_string(BATCH_SEPARATOR.join(texts),
+                                            offsets)
+
+        def text_start(position):
+            '''Returns index and start of the text at a position
+            of the normalized joined text, in both texts
+            '''
+            orig = offsets.original(position)
+            index = bisect_right(starts, orig) - 1
+            return (index, starts[index],
+                    offsets.normalized(starts[index]))
+
+        rules = self._rules
+        shadow = rules.shadow(clean_text, self.fold_accents)
+        # an anchor only lets addresses of its own text through
+        for match in rules.finditer(
+                shadow, 0, self.two_stage, self.prefilter,
+                floor=lambda anchor: text_start(anchor)[2]):
+            start, end = match.span()
+            index, base, clean_base = text_start(start)
+            # parts are kept apart from the other texts
+            spans = [p - start if p >= 0 else p
+                     for p in rules.field_spans(match)]
+            results[index].append(address.Address.from_spans(
+                clean_text[start:end], rules.keys, spans,
+                (self.country, start - clean_base, end - clean_base,
+                 offsets.original(start) - base,
+                 offsets.original(end) - base)))
+
+    def _iter_parse_binary(self, data, rules, chunk_size=STREAM_CHUNK_SIZE):
+        '''Yields addresses found in UTF-8 encoded data by binary rules,
+        copying chunk_size bytes of data at a time
+        '''
+        size = len(data)
+        chunks = (bytes(data[start:start + chunk_size])
+                  for start in range(0, size, chunk_size))
+        utf8 = Utf8Offsets(data)
+
+        def parse_address(match, offset, text, offsets):
+            start = match.start() + offset
+            end = match.end() + offset
+            byte_start = offsets.original(start)
+            byte_end = offsets.original(end)
+            orig_start = utf8(byte_start)
+            orig_end = utf8(byte_end)
+            first, last = match.span()
+            text, spans = _decode_spans(text[first:last], first,
+                                        rules.field_spans(match))
+            return address.Address.from_spans(
+                text, rules.byte_keys, spans,
+                (self.country, offsets.characters(start, orig_start),
+                 offsets.characters(end, orig_end), orig_start, orig_end,
+                 byte_start, byte_end))
+
+        return self._iter_chunks(chunks, rules, _binary_tail,
+                                 parse_address, b'', rules.max_width,
+                                 Utf8OffsetMap())
+
+    def parse_stream(self, fileobj, chunk_size=STREAM_CHUNK_SIZE,
+                     overlap=None):
+        '''Yields addresses found in a file-like object, reading and
+        normalizing it chunk by chunk so memory use doesn't depend on
+        the size of the input.
+
+        The last `overlap` characters of every chunk are carried over to
+        the next one, so addresses crossing chunk boundaries are found
+        exactly once. By default the overlap is the longest text a match
+        of the country rules can span (see utils.max_width); for rules
+        without such a bound ValueError is raised unless an overlap is
+        given. Offsets of the results are positions in the normalized
+        stream, original offsets are positions in the (decoded)
+        characters read.
+        '''
+        rules = self._rules
+        if overlap is None:
+            overlap = rules.max_width
+        if overlap is None:
+            raise ValueError('Matches of the rules of %s have no bound on '
+                             'their length, give parse_stream an overlap'
+                             % self.country)
+
+        def chunks():
+            decoder = None
+            while True:
+                raw = fileobj.read(chunk_size)
+                if isinstance(raw, bytes):
+                    if decoder is None:
+                        decoder = codecs.getincrementaldecoder('utf-8')()
+                    raw = decoder.decode(raw, final=not raw)
+                if not raw:
+                    return
+                yield raw
+
+        return self._iter_chunks(chunks(), rules, _text_tail,
+                                 self._parse_address, u'', overlap)
+
+    def _iter_chunks(self, chunks, rules, tail, parse_address, empty,
+                     overlap, offsets=None):
+        '''Normalizes and matches chunks of text (or of UTF-8 encoded
+        bytes, mapped by a Utf8OffsetMap) as one stream, see
+        parse_stream. tail(raw) tells where the end of a chunk held back
+        for the next one starts.
+        '''
+        buf = empty     # normalized text not yet scanned to the end
+        offset = 0      # position of buf in the normalized stream
+        pos = 0         # position in buf to continue scanning from
+        pending = empty  # end of the last chunk held back
+        if offsets is None:
+            offsets = OffsetMap()
+        chunks = iter(chunks)
+        raw = next(chunks, None)
+        while raw is not None:
+            following = next(chunks, None)
+            eof = following is None
+            raw = pending + raw
+            pending = empty
+            if not eof:
+                end = tail(raw)
+                raw, pending = raw[:end], raw[end:]
+            buf += self._normalize_string(raw, offsets, offset + len(buf))
+            shadow = rules.shadow(buf, self.fold_accents)
+
+            # a match (or a failure) at a position is final only when
+            # the rest of the match could not be in the next chunk
+            limit = len(buf) if eof else len(buf) - overlap
+            for match in rules.finditer(shadow, pos, self.two_stage,
+                                        self.prefilter):
+                if match.start() > limit:
+                    break
+                yield parse_address(match, offset, buf, offsets)
+                pos = match.end()
+            pos = max(pos, limit + 1)
+
+            # keep some text before pos for lookbehind assertions
+            keep = max(0, min(pos, len(buf)) - overlap)
+            buf = buf[keep:]
+            offset += keep
+            pos -= keep
+            offsets.discard(offset + pos)
+            raw = following
+
+    def _parse_address(self, match, offset=0, text=None, offsets=None,
+                       utf8=None):
+        '''Parses address into parts. Offset is added to the
+        position of the match in the normalized text, offsets maps
+        the result to the original text. Parts are taken
+        from text when given, else from the matched string.
+        With Utf8Offsets of the original text, the positions
+        in its UTF-8 encoding are added as well.
+        '''
         if isinstance(match, str):
             # If the address is passed as a match it saves foing the match twice
-            match = utils.match(self.rules, match, flags=re.VERBOSE | re.U)
+            match = utils.match(self._rules.pattern, match)
         if match:
-            match_as_dict = match.groupdict()
-            match_as_dict.update({'country_id': self.country})
-            # combine results
-            cleaned_dict = self._combine_results(match_as_dict)
-            cleaned_dict['match_start'] = match.start()
-            cleaned_dict['match_end'] = match.end()
-            # create object containing results
-            return address.Address(**cleaned_dict)
+            rules = self._rules
+            start = match.start() + offset
+            end = match.end() + offset
+            if offsets is None:
+                orig_start, orig_end = start, end
+            else:
+                orig_start = offsets.original(start)
+                orig_end = offsets.original(end)
+            keys = rules.keys
+            values = (self.country, start, end, orig_start, orig_end)
+            if utf8 is not None:
+                keys = rules.byte_keys
+                values += (utf8(orig_start), utf8(orig_end))
+            # create object containing results; it keeps the matched
+            # text only, not the whole document
+            first, last = match.span()
+            spans = [p - first if p >= 0 else p
+                     for p in rules.field_spans(match)]
+            text = match.string if text is None else text
+            return address.Address.from_spans(
+                text[first:last], keys, spans, values)
 
         return False
 
     @staticmethod
-    def _combine_results(match_as_dict):
-            '''Combine results from different parsed parts:
-            we look for non-empty results in values like
-            'postal_code_b' or 'postal_code_c' and store
-            them as main value.
-
-            So 'postal_code_b':'123456'
-                becomes:
-               'postal_code'  :'123456'
-            '''
-            keys = []
-            vals = []
-            for k, v in six.iteritems(match_as_dict):
-                if k[-2:] in '_a_b_c_d_e_f_g_h_i_j_k_l_m':
-                    if v:
-                        # strip last 2 chars: '..._b' -> '...'
-                        keys.append(k[:-2])
-                        vals.append(v)
-                else:
-                    if k not in keys:
-                        keys.append(k)
-                        vals.append(v)
-            return dict(zip(keys, vals))
-
-    @staticmethod
-    def _normalize_string(text):
+    def _normalize_string(text, offsets=None, start=0):
         '''Prepares incoming text for parsing:
         removes excessive spaces, tabs, newlines, etc.
+
+        When an OffsetMap is given, the places where positions shift
+        are added to it; start is the position of the normalized text
+        in the normalized stream the map covers. UTF-8 encoded bytes
+        are normalized the same way, their places added to a
+        Utf8OffsetMap.
         '''
-        conversion = {
-            # newlines
-            r'\r*(\n\r*)+': ', ',
-            r'\s*(\,\s*)+': ', ',
-            # replace excessive empty spaces
-            r'\s+': ' ',
-            # convert all types of hyphens/dashes to a
-            # simple old-school dash
-            # from http://utf8-chartable.de/unicode-utf8-table.pl?
-            # start=8192&number=128&utf8=string-literal
-            '‐': '-',
-            '‑': '-',
-            '‒': '-',
-            '–': '-',
-            '—': '-',
-            '―': '-',
-        }
-        for find, replace in six.iteritems(conversion):
-            text = re.sub(find, replace, text, flags=re.UNICODE)
-        return text
+        binary = isinstance(text, bytes)
+        if binary:
+            pattern, replace = NORMALIZE_BYTES, _replace_normalized_bytes
+        else:
+            pattern, replace = NORMALIZE, _replace_normalized
+        if offsets is None:
+            return pattern.sub(replace, text)
+        pieces = []
+        append = pieces.append
+        last = 0
+        shift = offsets.shift
+        # original position of text is start + shift
+        base = start + offsets.shift
+        for match in pattern.finditer(text):
+            run_start, run_end = match.span()
+            replacement = replace(match)
+            append(text[last:run_start])
+            append(replacement)
+            last = run_end
+            if len(replacement) != run_end - run_start:
+                shift += run_end - run_start - len(replacement)
+                if binary:
+                    # a replaced run of bytes is never one byte long,
+                    # so the shift in characters can't change alone
+                    char_shift = offsets.char_shift + len(
+                        match.group().decode('utf-8')) - len(replacement)
+                    offsets.add(base + run_end - shift, shift, char_shift)
+                else:
+                    offsets.add(base + run_end - shift, shift)
+        append(text[last:])
+        return text[:0].join(pieces)
+
+
+class SharedAddressParser(AddressParser):
+    '''AddressParser handed out by registry.get_parser to every caller
+    asking for the same options. Its options can't be changed once it is
+    initialized: create an AddressParser to parse with other options.
+    '''
+
+    def __init__(self, **args):
+        AddressParser.__init__(self, **args)
+        object.__setattr__(self, '_read_only', True)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_read_only', False):
+            raise AttributeError(
+                'Shared parsers are read-only, can\'t set "%s"' % name)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        if getattr(self, '_read_only', False):
+            raise AttributeError(
+                'Shared parsers are read-only, can\'t delete "%s"' % name)
+        object.__delattr__(self, name)
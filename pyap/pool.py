@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.pool
+    ~~~~~~~~~~~~~~~~
+
+    This module contains AddressParserPool which spreads address
+    parsing of many documents over several worker processes, or over
+    threads sharing one set of compiled rules on free-threaded
+    (no GIL) builds of Python.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import sys
+import functools
+import multiprocessing
+
+from . import registry
+
+DEFAULT_CHUNKSIZE = 64
+
+BACKENDS = ('process', 'thread')
+
+# parsers of the current worker process, created once by _init_worker
+_worker_parsers = []
+_worker_as_dict = False
+
+
+def _init_worker(countries, as_dict):
+    '''Pre-imports and compiles rules of every country
+    once per worker process
+    '''
+    global _worker_as_dict
+    _worker_parsers[:] = [registry.get_parser(country=country)
+                          for country in countries]
+    _worker_as_dict = as_dict
+
+
+def _parse_document(parsers, as_dict, item):
+    '''Parses one document with every given parser'''
+    index, text = item
+    results = []
+    for parser in parsers:
+        results.extend(parser.parse(text))
+    if as_dict:
+        results = [address.as_dict() for address in results]
+    return index, results
+
+
+def _parse_indexed(item):
+    '''Parses one document with every configured country'''
+    return _parse_document(_worker_parsers, _worker_as_dict, item)
+
+
+def free_threaded():
+    '''Returns True when running without the GIL, so that threads
+    match regular expressions in parallel
+    '''
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class AddressParserPool(object):
+    '''Pool of workers parsing documents in parallel.
+
+    With the 'process' backend every worker process compiles the rules
+    of the given countries once and keeps them for its lifetime. With
+    the 'thread' backend all threads share the parsers of this process,
+    nothing is pickled or forked. By default threads are used on
+    free-threaded builds of Python and processes otherwise, as threads
+    holding the GIL can't parse in parallel. Results come back as
+    (input index, list of addresses) pairs, where addresses are Address
+    objects or, with as_dict=True, plain dictionaries.
+
+        with AddressParserPool(countries=['US', 'CA'], workers=4) as pool:
+            for index, addresses in pool.imap_unordered(documents):
+                ...
+    '''
+
+    def __init__(self, countries=('US',), workers=None,
+                 chunksize=DEFAULT_CHUNKSIZE, as_dict=False, context=None,
+                 backend=None):
+        if isinstance(countries, str):
+            countries = [countries]
+        if backend is None:
+            backend = 'thread' if free_threaded() else 'process'
+        elif backend not in BACKENDS:
+            raise ValueError('Unknown pool backend: {0}'.format(backend))
+        # fail early (and warm the cache for forked workers)
+        # if detection rules for a country are missing
+        parsers = [registry.get_parser(country=country)
+                   for country in countries]
+        self.countries = [parser.country for parser in parsers]
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunksize = chunksize
+        self.as_dict = as_dict
+        self.backend = backend
+        if backend == 'thread':
+            # parsers keep no per-call state, threads share them
+            self._parse = functools.partial(_parse_document, parsers,
+                                            as_dict)
+            from multiprocessing.pool import ThreadPool
+            self._pool = ThreadPool(self.workers)
+            return
+        self._parse = _parse_indexed
+        if context is None or isinstance(context, str):
+            context = multiprocessing.get_context(context)
+        self._pool = context.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.countries, as_dict))
+
+    def map(self, texts, chunksize=None):
+        '''Returns (index, addresses) pairs in input order'''
+        return self._pool.map(self._parse, enumerate(texts),
+                              chunksize or self.chunksize)
+
+    def imap(self, texts, chunksize=None):
+        '''Lazily yields (index, addresses) pairs in input order'''
+        return self._pool.imap(self._parse, enumerate(texts),
+                               chunksize or self.chunksize)
+
+    def imap_unordered(self, texts, chunksize=None):
+        '''Lazily yields (index, addresses) pairs as soon
+        as documents are parsed
+        '''
+        return self._pool.imap_unordered(self._parse, enumerate(texts),
+                                         chunksize or self.chunksize)
+
+    def close(self):
+        '''Waits for pending work and stops the workers'''
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self):
+        '''Stops the workers immediately'''
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
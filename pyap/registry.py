@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+
+"""
+    pyap.registry
+    ~~~~~~~~~~~~~~~~
+
+    Process-wide cache of compiled country rules and shared
+    AddressParser instances.
+
+    Every country's 'full_address' definition is imported and compiled
+    exactly once per process and regex engine (see pyap.engines); later
+    lookups are served from the cache.
+
+    :copyright: (c) 2015 by Vladimir Goncharov.
+    :license: MIT, see LICENSE for more details.
+"""
+
+import re
+import time
+import importlib
+import threading
+
+from . import engines
+from . import utils
+
+# guards the caches below; rules are compiled outside of it, under
+# a lock of their own key, so other countries are served meanwhile
+_lock = threading.RLock()
+_compile_locks = {}
+# max_width not computed yet
+_UNKNOWN = object()
+_rules = {}
+_parsers = {}
+_stats = {
+    'rules_hits': 0,
+    'rules_misses': 0,
+    'parser_hits': 0,
+    'parser_misses': 0,
+    'compile_time': {},
+}
+
+
+class CountryRules(object):
+    '''Compiled detection rules of a single country.
+    Instances are shared between parsers and must not be modified.
+
+    Binary rules match UTF-8 encoded bytes (see utils.binary) chunk by
+    chunk. Rules folding accents, checked by gazetteers or without a
+    max_width, and engines which can't match bytes, have no binary
+    version: ValueError is raised.
+    '''
+
+    def __init__(self, country, source, flags=utils.DEFAULT_FLAGS,
+                 anchor=None, start_words=None, gazetteers=None,
+                 fold_accents=False, engine=None, binary=False):
+        self.country = country
+        self.source = source
+        self.flags = flags
+        # rules are written for text with accents folded (see shadow)
+        self.fold_accents = fold_accents
+        self.engine = engine or engines.get()
+        self.binary = binary
+        if binary and (fold_accents or gazetteers or
+                       not self.engine.binary or not source.isascii() or
+                       utils.max_width(source, flags) is None):
+            raise ValueError('Rules of %s with engine %s can\'t match bytes'
+                             % (country, self.engine.name))
+        convert = utils.binary if binary else lambda *args: args
+        self._spans = self.engine.spans
+        started = time.perf_counter()
+        self.pattern = self.engine.compile(*convert(source, flags))
+        # same rules without capturing groups, to find addresses quickly
+        self.detector = None
+        if self.engine.incremental:
+            self.detector = self.engine.compile(
+                *convert(utils.strip_groups(source, flags), flags))
+        # matches (zero-width) every position a mandatory part of
+        # an address like a state or a postcode starts at
+        self.anchor = None
+        self.anchor_source = None
+        if anchor is not None:
+            self.anchor_source = utils.strip_groups(anchor, flags)
+            self.anchor = re.compile(
+                *convert('(?=' + self.anchor_source + ')', flags))
+        # index of positions an address may start at: digits and words
+        # followed by a space. Words are found in the reversed text, where
+        # they start with a space and re can skip to it quickly. They are
+        # written by words_to_regex like the word lists of the rules, so
+        # they fold case the same way: ASCII letters to ASCII only.
+        self.start_words = None
+        if start_words is not None:
+            words = sorted(set(word.lower() for word in start_words),
+                           key=len, reverse=True)
+            self.start_words = re.compile(*convert(
+                ' ' + utils.words_to_regex([word[::-1] for word in words]),
+                flags & ~re.VERBOSE))
+            if binary:
+                words = [word.encode('ascii') for word in words]
+            # a word found in the text may end with shorter words
+            self._word_starts = dict(
+                (word, tuple(len(other) for other in words
+                             if word.endswith(other)))
+                for word in words)
+            self._longest = len(words[0])
+            self._digit = re.compile(*convert(r'\d', flags))
+        self.compile_time = time.perf_counter() - started
+        self._max_width = _UNKNOWN
+        # address parts checked by a lookup after matching, by group name;
+        # gazetteers are loaded on the first match only
+        self.gazetteer_specs = tuple(sorted((gazetteers or {}).items()))
+        self._gazetteers = None
+        self.fields, self.keys = _field_table(self.pattern)
+        # keys of addresses found in bytes
+        self.byte_keys = self.keys + BYTE_KEYS
+
+    def finditer(self, text, pos=0, two_stage=False, prefilter=True,
+                 ranges=None, floor=None):
+        '''Yields matches of the rules in text starting at pos.
+
+        With two_stage the detector finds addresses first and the full
+        pattern, which records every part, runs on found addresses only.
+        With prefilter and an anchor defined for the country, matching
+        is only tried up to max_width characters before an anchor, so
+        text without anchors is skipped entirely. Text must be
+        normalized for max_width to bound whitespace runs; rules with
+        unbounded repeats have no max_width and are tried at every
+        position (see utils.max_width). With start
+        words defined as well, matching is only tried at the indexed
+        start positions (see start_positions) near anchors. Ranges of
+        positions near anchors found beforehand (see pyap.multi) may be
+        given instead of looking for anchors again. floor(anchor), when
+        given, is the first position a match containing the anchor may
+        start at, narrowing the positions tried near it further.
+        Matches are the same either way. Engines which can't search from
+        many positions cheaply always scan the text in one pass. Matches
+        failing gazetteer checks are dropped (see validate).
+        '''
+        if prefilter and self.max_width is None:
+            prefilter = False
+        if prefilter and ranges is None and floor is not None and \
+                self.anchor is not None:
+            ranges = self._candidate_ranges(text, pos, floor)
+        if not self.engine.incremental:
+            matches = self.pattern.finditer(text, pos)
+        elif prefilter and self.start_words is not None:
+            matches = self._finditer_indexed(text, pos, two_stage, ranges)
+        elif prefilter and self.anchor is not None:
+            matches = self._finditer_anchored(text, pos, two_stage, ranges)
+        elif not two_stage:
+            matches = self.pattern.finditer(text, pos)
+        else:
+            matches = self._finditer_two_stage(text, pos)
+        if self.gazetteer_specs:
+            return self._finditer_validated(matches)
+        return matches
+
+    def shadow(self, text, fold_accents=None):
+        '''Returns text the rules are matched against: with fold_accents
+        (by default that of the rules) accented letters are replaced by
+        ASCII ones. Positions are the same as in text, so parts of
+        addresses are taken from text.
+        '''
+        if fold_accents is None:
+            fold_accents = self.fold_accents
+        if fold_accents:
+            return utils.fold_accents(text)
+        return text
+
+    def _finditer_validated(self, matches):
+        for match in matches:
+            match = self.validate(match)
+            if match is not None:
+                yield match
+
+    def validate(self, match):
+        '''Looks up address parts of a match in the gazetteers of the
+        country. Returns the match, cut to end with the longest known
+        name when the part is longer, or None when no name is known.
+        '''
+        for name, known in self.gazetteers:
+            start, end = match.span(self.pattern.groupindex[name])
+            if start < 0:
+                continue
+            length = known.longest_prefix(match.string[start:end])
+            if not length:
+                return None
+            if start + length < end:
+                match = self.pattern.match(
+                    match.string, match.start(), start + length)
+                return None if match is None else self.validate(match)
+        return match
+
+    def _finditer_two_stage(self, text, pos):
+        match = self.pattern.match
+        for found in self.detector.finditer(text, pos):
+            yield match(text, found.start())
+
+    def _finditer_anchored(self, text, pos, two_stage, ranges=None):
+        search = (self.detector if two_stage else self.pattern).search
+        match = self.pattern.match
+        width = self.max_width
+        if ranges is None:
+            ranges = self._candidate_ranges(text, pos)
+        for first, last in ranges:
+            start = max(first, pos)
+            while start <= last:
+                # a match starting at or before `last` never looks past
+                # last + width, so cutting the text there changes nothing
+                found = search(text, start, last + width + 1)
+                if found is None or found.start() > last:
+                    break
+                if two_stage:
+                    found = match(text, found.start())
+                yield found
+                start = pos = found.end()
+
+    def _finditer_indexed(self, text, pos, two_stage, ranges=None):
+        match = (self.detector if two_stage else self.pattern).match
+        end = pos
+        for start in self.start_positions(text, pos, ranges):
+            if start < end:
+                # inside the previous match
+                continue
+            found = match(text, start)
+            if found is not None:
+                if two_stage:
+                    found = self.pattern.match(text, start)
+                yield found
+                end = found.end()
+
+    def start_positions(self, text, pos=0, ranges=None):
+        '''Returns sorted positions from pos on where an address may
+        start: every digit and every start word followed by a space.
+        When an anchor is defined, only positions up to max_width
+        characters before an anchor (or in the given ranges)
+        are looked at.
+        '''
+        if ranges is not None:
+            ranges = [(max(first, pos), last) for first, last in ranges
+                      if last >= pos]
+        elif self.anchor is None:
+            ranges = [(pos, len(text) - 1)]
+        else:
+            ranges = self._candidate_ranges(text, pos)
+        size = len(text)
+        reversed_text = None
+        word_starts = self._word_starts
+        starts = []
+        for first, last in ranges:
+            found = set(digit.start() for digit in
+                        self._digit.finditer(text, first, last + 1))
+            if reversed_text is None:
+                reversed_text = text[::-1]
+            # spaces after words starting within first..last
+            for word in self.start_words.finditer(
+                    reversed_text, max(0, size - 1 - last - self._longest),
+                    size - first):
+                # the word ends at the space found at size - 1 - start
+                end = size - 1 - word.start()
+                for length in word_starts[word.group()[:0:-1].lower()]:
+                    if first <= end - length <= last:
+                        found.add(end - length)
+            starts.extend(sorted(found))
+        return starts
+
+    def _candidate_ranges(self, text, pos, floor=None):
+        '''Yields merged (first, last) ranges of positions
+        an address may start at. floor(anchor), when given, is the
+        first position a match containing the anchor may start at.
+        '''
+        width = self.max_width
+        first = last = None
+        for found in self.anchor.finditer(text, pos):
+            anchor = found.start()
+            start = max(pos, anchor - width)
+            if floor is not None:
+                start = max(start, floor(anchor))
+            if last is not None and start <= last + 1:
+                last = anchor
+                continue
+            if last is not None:
+                yield first, last
+            first, last = start, anchor
+        if last is not None:
+            yield first, last
+
+    def field_spans(self, match):
+        '''Returns flat list of start and end positions of every address
+        part of a match, in the order of self.keys. Parts may be captured
+        by several alternative groups ('postal_code_b', 'postal_code_c');
+        the last non-empty alternative is taken, else the main group.
+        '''
+        regs = self._spans(match)
+        spans = []
+        for index, alternatives in self.fields:
+            span = regs[index] if index is not None else NOT_FOUND
+            for alternative in alternatives:
+                start, end = regs[alternative]
+                if end > start:
+                    span = (start, end)
+            spans.extend(span)
+        return spans
+
+    @property
+    def gazetteers(self):
+        '''(group name, Gazetteer) pairs of the parts checked by lookup'''
+        from . import gazetteer
+
+        if self._gazetteers is None:
+            self._gazetteers = tuple(
+                (name, gazetteer.get(self.country, spec))
+                for name, spec in self.gazetteer_specs)
+        return self._gazetteers
+
+    @property
+    def max_width(self):
+        '''Longest span of normalized text a single match may need to
+        inspect, None when the rules have no such bound
+        '''
+        if self._max_width is _UNKNOWN:
+            self._max_width = utils.max_width(self.source, self.flags)
+        return self._max_width
+
+
+# span of a group which didn't participate in the match
+NOT_FOUND = (-1, -1)
+
+# parts added to every address besides the groups of the rules
+EXTRA_KEYS = ('country_id', 'match_start', 'match_end',
+              'orig_start', 'orig_end')
+
+# parts added to addresses found in bytes: UTF-8 offsets of orig_start
+# and orig_end
+BYTE_KEYS = ('byte_start', 'byte_end')
+
+
+def _field_table(pattern):
+    '''Maps groups of a compiled pattern to address parts: groups named
+    like 'postal_code_b' are alternatives of the 'postal_code' part.
+    Returns ((main group index, alternative group indexes), ...) and the
+    tuple of part names in the same order followed by EXTRA_KEYS.
+    '''
+    keys = []
+    main = {}
+    alternatives = {}
+    for name, index in pattern.groupindex.items():
+        if name[-2:] in '_a_b_c_d_e_f_g_h_i_j_k_l_m':
+            name = name[:-2]
+            alternatives.setdefault(name, []).append(index)
+        else:
+            main[name] = index
+        if name not in keys:
+            keys.append(name)
+    fields = tuple(
+        (main.get(name), tuple(alternatives.get(name, ())))
+        for name in keys)
+    return fields, tuple(keys) + EXTRA_KEYS
+
+
+def load_data(country):
+    '''Returns the frozen rules module of a country (see pyap.freeze),
+    or the data module when there is none. Raises ImportError when no
+    detection rules exist for the country.
+    '''
+    package = 'pyap' + '.source_' + country
+    try:
+        return importlib.import_module(package + '.frozen')
+    except ImportError:
+        return importlib.import_module(package + '.data')
+
+
+def load_rules(country, engine=engines.DEFAULT_ENGINE, binary=False):
+    '''Imports rules of a country and compiles them with an engine,
+    for bytes when binary. Raises ImportError when no detection rules
+    exist for the country or the engine is not installed, ValueError
+    when the rules have no binary version.
+    '''
+    data = load_data(country)
+    return CountryRules(country, data.full_address,
+                        anchor=getattr(data, 'address_anchor', None),
+                        start_words=getattr(data, 'address_start_words', None),
+                        gazetteers=getattr(data, 'address_gazetteers', None),
+                        fold_accents=getattr(data, 'address_fold_accents',
+                                             False),
+                        engine=engines.get(engine),
+                        binary=binary)
+
+
+def get_rules(country, engine=engines.DEFAULT_ENGINE, binary=False):
+    '''Returns rules for a country compiled with an engine (for bytes
+    when binary), compiling them on the first request only
+    '''
+    country = country.upper()
+    key = (country, engine) + (('bytes',) if binary else ())
+    rules = _cached_rules(key)
+    if rules is not None:
+        return rules
+    with _lock:
+        compile_lock = _compile_locks.setdefault(key, threading.Lock())
+    with compile_lock:
+        # compiled by another thread while waiting for the lock
+        rules = _cached_rules(key)
+        if rules is not None:
+            return rules
+        try:
+            rules = load_rules(country, engine, binary)
+        except ValueError as error:
+            # no binary version, don't load the rules again to find out
+            rules = error
+        with _lock:
+            _stats['rules_misses'] += 1
+            _rules[key] = rules
+            if not isinstance(rules, ValueError):
+                if engine != engines.DEFAULT_ENGINE or binary:
+                    country = ':'.join(key)
+                _stats['compile_time'][country] = rules.compile_time
+    if isinstance(rules, ValueError):
+        raise rules
+    return rules
+
+
+def _cached_rules(key):
+    '''Returns cached rules of a key, None when not compiled yet'''
+    with _lock:
+        rules = _rules.get(key)
+        if rules is None:
+            return None
+        _stats['rules_hits'] += 1
+    if isinstance(rules, ValueError):
+        raise ValueError(*rules.args)
+    return rules
+
+
+def get_parser(**kwargs):
+    '''Returns a shared, read-only AddressParser configured with kwargs
+    (see parser.SharedAddressParser). Parsers are cached by their
+    arguments, so the same instance is handed out for the same
+    configuration.
+    '''
+    from .parser import SharedAddressParser
+
+    if 'country' in kwargs:
+        kwargs['country'] = kwargs['country'].upper()
+    try:
+        key = tuple(sorted(kwargs.items()))
+        hash(key)
+    except TypeError:
+        # unhashable arguments can't be cached
+        return SharedAddressParser(**kwargs)
+
+    with _lock:
+        parser = _parsers.get(key)
+        if parser is not None:
+            _stats['parser_hits'] += 1
+            return parser
+    # compiles the rules, which mustn't hold up other lookups
+    parser = SharedAddressParser(**kwargs)
+    with _lock:
+        if key in _parsers:
+            # created by another thread meanwhile
+            _stats['parser_hits'] += 1
+            return _parsers[key]
+        _stats['parser_misses'] += 1
+        _parsers[key] = parser
+        return parser
+
+
+def stats():
+    '''Returns a snapshot of cache hit/miss counters
+    and per-country compile times (in seconds)
+    '''
+    with _lock:
+        snapshot = dict(_stats)
+        snapshot['compile_time'] = dict(_stats['compile_time'])
+        return snapshot
+
+
+def clear():
+    '''Drops all cached rules and parsers and resets statistics'''
+    with _lock:
+        _rules.clear()
+        _parsers.clear()
+        for k in ('rules_hits', 'rules_misses',
+                  'parser_hits', 'parser_misses'):
+            _stats[k] = 0
+        _stats['compile_time'] = {}
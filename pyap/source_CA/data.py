@@ -16,50 +16,53 @@
 
 import re
 
+from .. import utils
+
 ''' Numerals from one to nine
-Note: here and below we use syntax like '[Oo][Nn][Ee]'
-instead of '(one)(?i)' to match 'One' or 'oNe' because
-Python Regexps don't seem to support turning On/Off
-case modes for subcapturing groups.
+Note: here and below we use syntax like '[Oo](?ai:ne)' to match
+'One' or 'oNe'. Scoped '(?ai:...)' groups keep the patterns short,
+while the first letter stays a character class, which re checks
+before trying an alternative. The 'a' flag folds ASCII letters only,
+as the classes do: 'ſ' or the Kelvin sign are no 's' or 'k'.
 '''
 zero_to_nine = r"""(?:
-    [Zz][Ee][Rr][Oo]\ |[Oo][Nn][Ee]\ |[Tt][Ww][Oo]\ |
-    [Tt][Hh][Rr][Ee][Ee]\ |[Ff][Oo][Uu][Rr]\ |
-    [Ff][Ii][Vv][Ee]\ |[Ss][Ii][Xx]\ |
-    [Ss][Ee][Vv][Ee][Nn]\ |[Ee][Ii][Gg][Hh][Tt]\ |
-    [Nn][Ii][Nn][Ee]\ |[Tt][Ee][Nn]\ |
-    [Ee][Ll][Ee][Vv][Ee][Nn]\ |
-    [Tt][Ww][Ee][Ll][Vv][Ee]\ |
-    [Tt][Hh][Ii][Rr][Tt][Ee][Ee][Nn]\ |
-    [Ff][Oo][Uu][Rr][Tt][Ee][Ee][Nn]\ |
-    [Ff][Ii][Ff][Tt][Ee][Ee][Nn]\ |
-    [Ss][Ii][Xx][Tt][Ee][Ee][Nn]\ |
-    [Ss][Ee][Vv][Ee][Nn][Tt][Ee][Ee][Nn]\ |
-    [Ee][Ii][Gg][Hh][Tt][Ee][Ee][Nn]\ |
-    [Nn][Ii][Nn][Ee][Tt][Ee][Ee][Nn]\ 
+    [Zz](?ai:ero)\ |[Oo](?ai:ne)\ |[Tt](?ai:wo)\ |
+    [Tt](?ai:hree)\ |[Ff](?ai:our)\ |
+    [Ff](?ai:ive)\ |[Ss](?ai:ix)\ |
+    [Ss](?ai:even)\ |[Ee](?ai:ight)\ |
+    [Nn](?ai:ine)\ |[Tt](?ai:en)\ |
+    [Ee](?ai:leven)\ |
+    [Tt](?ai:welve)\ |
+    [Tt](?ai:hirteen)\ |
+    [Ff](?ai:ourteen)\ |
+    [Ff](?ai:ifteen)\ |
+    [Ss](?ai:ixteen)\ |
+    [Ss](?ai:eventeen)\ |
+    [Ee](?ai:ighteen)\ |
+    [Nn](?ai:ineteen)\ 
     )
 """
 
 # Numerals - 10, 20, 30 ... 90
 ten_to_ninety = r"""(?:
-    [Tt][Ee][Nn]\ |[Tt][Ww][Ee][Nn][Tt][Yy]\ |
-    [Tt][Hh][Ii][Rr][Tt][Yy]\ |
-    [Ff][Oo][Rr][Tt][Yy]\ |
-    [Ff][Oo][Uu][Rr][Tt][Yy]\ |
-    [Ff][Ii][Ff][Tt][Yy]\ |[Ss][Ii][Xx][Tt][Yy]\ |
-    [Ss][Ee][Vv][Ee][Nn][Tt][Yy]\ |
-    [Ee][Ii][Gg][Hh][Tt][Yy]\ |
-    [Nn][Ii][Nn][Ee][Tt][Yy]\ 
+    [Tt](?ai:en)\ |[Tt](?ai:wenty)\ |
+    [Tt](?ai:hirty)\ |
+    [Ff](?ai:orty)\ |
+    [Ff](?ai:ourty)\ |
+    [Ff](?ai:ifty)\ |[Ss](?ai:ixty)\ |
+    [Ss](?ai:eventy)\ |
+    [Ee](?ai:ighty)\ |
+    [Nn](?ai:inety)\ 
     )"""
 
 # One hundred
 hundred = r"""(?:
-    [Hh][Uu][Nn][Dd][Rr][Ee][Dd]\ 
+    [Hh](?ai:undred)\ 
     )"""
 
 # One thousand
 thousand = r"""(?:
-    [Tt][Hh][Oo][Uu][Ss][Aa][Nn][Dd]\ 
+    [Tt](?ai:housand)\ 
     )"""
 
 '''
@@ -75,7 +78,7 @@ Street number can be written 2 ways:
 '''
 street_number = r"""(?<![\.0-9])(?P<street_number>
                         (?:
-                            [Aa][Nn][Dd]\ 
+                            [Aa](?ai:nd)\ 
                             |
                             {thousand}
                             |
@@ -114,23 +117,23 @@ post_direction = r"""
                     (?P<post_direction>
                         (?:
                             # English
-                            [Nn][Oo][Rr][Tt][Hh]{d}|
-                            [Ss][Oo][Uu][Tt][Hh]{d}|
-                            [Ee][Aa][Ss][Tt]{d}|
-                            [Ww][Ee][Ss][Tt]{d}|
-                            [Nn][Oo][Rr][Tt][Hh][Ee][Aa][Ss][Tt]{d}|
-                            [Nn][Oo][Rr][Tt][Hh][Ww][Ee][Ss][Tt]{d}|
-                            [Ss][Oo][Uu][Tt][Hh][Ee][Aa][Ss][Tt]{d}|
-                            [Ss][Oo][Uu][Tt][Hh][Ww][Ee][Ss][Tt]{d}|
+                            [Nn](?ai:orth){d}|
+                            [Ss](?ai:outh){d}|
+                            [Ee](?ai:ast){d}|
+                            [Ww](?ai:est){d}|
+                            [Nn](?ai:ortheast){d}|
+                            [Nn](?ai:orthwest){d}|
+                            [Ss](?ai:outheast){d}|
+                            [Ss](?ai:outhwest){d}|
                             # French
-                            [Ee][Ss][Tt]{d}|
-                            [Nn][Oo][Rr][Dd]{d}|
-                            [Nn][Oo][Rr][Dd]\-[Ee][Ss][Tt]{d}|
-                            [Nn][Oo][Rr][Dd]\-[Oo][Uu][Ee][Ss][Tt]{d}|
-                            [Ss][Uu][Dd]{d}|
-                            [Ss][Uu][Dd]\-[Ee][Ss][Tt]{d}|
-                            [Ss][Uu][Dd]\-[Oo][Uu][Ee][Ss][Tt]{d}|
-                            [Oo][Uu][Ee][Ss][Tt]{d}
+                            [Ee](?ai:st){d}|
+                            [Nn](?ai:ord){d}|
+                            [Nn](?ai:ord\-est){d}|
+                            [Nn](?ai:ord\-ouest){d}|
+                            [Ss](?ai:ud){d}|
+                            [Ss](?ai:ud\-est){d}|
+                            [Ss](?ai:ud\-ouest){d}|
+                            [Oo](?ai:uest){d}
                         )
                         |
                         (?:
@@ -154,166 +157,166 @@ post_direction = r"""
 # https://www.canadapost.ca/tools/pg/manual/PGaddress-e.asp#1385939
 street_type = r"""
             (?P<street_type>
-                [Aa][Bb][Bb][Ee][Yy]{div}|
-                [Aa][Cc][Rr][Ee][Ss]{div}|
-                [Aa][Ll][Ll][Éé][Ee]{div}|
-                [Aa][Ll][Ll][Ee][Yy]{div}|
-                [Aa][Uu][Tt][Oo][Rr][Oo][Uu][Tt][Ee]{div}|[Aa][Uu][Tt]{div}|
-                [Aa][Vv][Ee][Nn][Uu][Ee]{div}|[Aa][Vv][Ee]?{div}|
-                [Bb][Aa][Yy]{div}|
-                [Bb][Ee][Aa][Cc][Hh]{div}|
-                [Bb][Ee][Nn][Dd]{div}|
-                [Bb][Oo][Uu][Ll][Ee][Vv][Aa][Er][Dd]{div}|[Bb][Ll][Vv][Dd]{div}|[Bb][Oo][Uu][Ll]{div}|
+                [Aa](?ai:bbey){div}|
+                [Aa](?ai:cres){div}|
+                [Aa](?ai:llee){div}|
+                [Aa](?ai:lley){div}|
+                [Aa](?ai:utoroute){div}|[Aa](?ai:ut){div}|
+                [Aa](?ai:venue){div}|[Aa][Vv][Ee]?{div}|
+                [Bb](?ai:ay){div}|
+                [Bb](?ai:each){div}|
+                [Bb](?ai:end){div}|
+                [Bb](?ai:ouleva)[Er][Dd]{div}|[Bb](?ai:lvd){div}|[Bb](?ai:oul){div}|
                 # Broadway
-                [Bb][Rr][Oo][Aa][Dd][Ww][Aa][Yy]{div}|
-                [Bb][Yy]\-?[Pp][Aa][Ss][Ss]{div}|
-                [Bb][Yy][Ww][Aa][Yy]{div}|
-                [Cc][Aa][Mm][Pp][Uu][Ss]{div}|
-                [Cc][Aa][Pp][Ee]{div}|
-                [Cc][Aa][Rr][Rr][EéÉ]{div}|[Cc][Aa][Rr]{div}|
-                [Cc][Aa][Rr][Rr][Ee][Ff][Oo][Uu][Rr]{div}|[Cc][Aa][Rr][Re][Ee][Ff]{div}|
-                [Cc][Ee][Nn][Tt][Rr][Ee]{div}|[Cc][Tt][Rr]{div}|
-                [Cc][Ee][Rr][Cc][Ll][Ee]{div}|
-                [Cc][Hh][Aa][Ss][Ee]{div}|
-                [Cc][Hh][Ee][Mm][Ii][Nn]{div}|[Cc][Hh]{div}|
-                [Cc][Ii][Rr][Cc][Ll][Ee]{div}|[Cc][Ii][Rr]{div}|
-                [Cc][Ii][Rr][Cc][Uu][Ii][Tt]{div}|[Cc][Ii][Rr][Cc][Tt]{div}|
-                [Cc][Ll][Oo][Ss][Ee]{div}|
-                [Cc][Oo][Mm][Mm][Oo][Nn]{div}|
-                [Cc][Oo][Nn][Cc][Ee][Ss][Ss][Ii][Oo][Nn]{div}|[Cc][Oo][Nn][Cc]{div}|
-                [Cc][Oo][Rr][Nn][Ee][Rr][Ss]{div}|
-                [Cc][Ôô][Tt][Ee]{div}|
-                [Cc][Oo][Uu][Rr][Ss]{div}|
-                [Cc][Oo][Uu][Rr]{div}|
-                [Cc][Oo][Uu][Rr][Tt]{div}|[Cc][Rr][Tt]{div}|
-                [Cc][Oo][Vv][Ee]{div}|
-                [Cc][Rr][Ee][Ss][Cc][Ee][Nn][Tt]{div}|[Cc][Rr][Ee][Ss]{div}|
-                [Cc][Rr][Oo][Ii][Ss][Ss][Aa][Nn][Tt]{div}|[Cc][Rr][Oo][Ii][Ss]{div}|
-                [Cc][Rr][Oo][Ss][Ss][Ii][Nn][Gg]{div}|[Cc][Rr][Oo][Ss][Ss]{div}|
-                [Cc][Uu][Ll]\-[Dd][Ee]\-[Ss][Aa][Cc]{div}|[Cc][Dd][Ss]{div}|
-                [Dd][Aa][Ll][Ee]{div}|
-                [Dd][Ee][Ll][Ll]{div}|
-                [Dd][Ii][Vv][Ee][Rr][Ss][Ii][Oo][Nn]{div}|[Dd][Ii][Vv][Ee][Rr][Ss]{div}|
-                [Dd][Oo][Ww][Nn][Ss]{div}|
-                [Dd][Rr][Ii][Vv][Ee]{div}|[Dd][Rr]{div}|
-                [Ée][Cc][Hh][Aa][Nn][Gg][Ee][Uu][Rr]{div}|[Ée][Cc][Hh]{div}|
-                [Ee][Nn][Dd]{div}|
-                [Ee][Ss][Pp][Ll][Aa][Nn][Aa][Dd][Ee]{div}|[Ee][Ss][Pp][Ll]{div}|
-                [Ee][Ss][Tt][Aa][Tt][Ee][Ss]?{div}|
-                [Ee][Xx][Pp][Rr][Ee][Ss][Ss][Ww][Aa][Yy]{div}|[Ee][Xx][Pp][Yy]{div}|
-                [Ee][Xx][Tt][Ee][Nn][Ss][Ii][Oo][Nn]{div}|[Ee][Xx][Tt][Ee][Nn]{div}|
-                [Ff][Aa][Rr][Mm]{div}|
-                [Ff][Ii][Ee][Ll][Dd]{div}|
-                [Ff][Oo][Rr][Ee][Ss][Tt]{div}|
-                [Ff][Rr][Ee][Ee][Ww][Aa][Yy]{div}|[Ff][Ww][Yy]{div}|
-                [Ff][Rr][Oo][Nn][Tt]{div}|
-                [Gg][Aa][Rr][Dd][Ee][Nn][Ss]{div}|[Gg][Dd][Nn][Ss]{div}|
-                [Gg][Aa][Tt][Ee]{div}|
-                [Gg][Ll][Aa][Dd][Ee]{div}|
-                [Gg][Ll][Ee][Nn]{div}|
-                [Gg][Rr][Ee][Ee][Nn]{div}|
-                [Gg][Rr][Uo][Uu][Nn][Dd][Ss]{div}|[Gg][Rr][Nn][Dd][Ss]{div}|
-                [Gg][Rr][Oo][Vv][Ee]{div}|
-                [Hh][Aa][Rr][Bb][Oo][Uu][Rr]{div}|[Hh][Aa][Rr][Bb][Rr]{div}|
-                [Hh][Ee][Aa][Tt][Hh]{div}|
-                [Hh][Ee][Ii][Gg][Hh][Tt][Ss]{div}|[Hh][Tt][Ss]{div}|
-                [Hh][Ii][Gg][Hh][Ll][Aa][Nn][Dd][Ss]{div}|[Hh][Gg][Hh][Ll][Dd][Sd]{div}|
-                [Hh][Ii][Gg][Gh][Ww][Aa][Yy]{div}|[Hh][Ww][Yy]{div}|
-                [Hh][Ii][Ll][Ll]{div}|
-                [Hh][Oo][Ll][Ll][Oo][Ww]{div}|
-                [Îi][Ll][Ee]{div}|
-                [Ii][Mm][Pp][Aa][Ss][Ss][Ee]{div}|I[Mm][Pp]{div}|
-                [Ii][Nn][Ll][Ee][Tt]{div}|
-                [Ii][Ss][Ll][Aa][Nn][Dd]{div}|
-                [Kk][Ee][Yy]{div}|
-                [Kk][Nn][Oo][Ll][Ll]{div}|
-                [Ll][Aa][Nn][Dd][Ii][Nn][Gg]{div}|[Ll][Aa][Nn][Dd][Nn][Gg]{div}|
-                [Ll][Aa][Nn][Ee]{div}|
-                [Ll][Ii][Mm][Ii][Tt][Ss]{div}|[Ll][Mm][Tt][Ss]{div}|
-                [Ll][Ii][Nn][Ee]{div}|
-                [Ll][Ii][Nn][Kk]{div}|
-                [Ll][Oo][Oo][Kk][Oo][Uu][Tt]{div}|[Ll][Kk][Oo][Uu][Tt]{div}|
-                [Mm][Aa][Ii][Nn][Ww][Aa][Yy]{div}|
-                [Mm][Aa][Ll][Ll]{div}|
-                [Mm][Aa][Nn][Oo][Rr]{div}|
-                [Mm][Aa][Zz][Ee]{div}|
-                [Mm][Ee][Aa][Dd][Oo][Ww]{div}|
-                [Mm][Ee][Ww][Ss]{div}|
-                [Mm][Oo][Nn][Tt][Éé][Ee]{div}|
-                [Mm][Oo][Oo][Rr]{div}|
-                [Mm][Oo][Uu][Nn][Tt][Aa][Ii][Nn]{div}|[Mm][Tt][Nn]{div}|
-                [Mm][Oo][Uu][Nn][Tt]{div}|
-                [Oo][Rr][Cc][Hh][Aa][Rr][Dd]{div}|[Oo][Rr][Cc][Hh]{div}|
-                [Pp][Aa][Rr][Aa][Dd][Ee]{div}|
-                [Pp][Aa][Rr][Cc]{div}|
-                [Pp][Aa][Rr][Kk][Ww][Aa][Yy]{div}|[Pp][Kk][Yy]{div}|
-                [Pp][Aa][Rr][Kk]{div}|[Pp][Kk]{div}|
-                [Pp][Aa][Ss][Ss][Aa][Gg][Ee]{div}|[Pp][As][Ss][Ss]{div}|
-                [Pp][Aa][Tt][Hh]{div}|
-                [Pp][Aa][Tt][Hh][Ww][Aa][Yy]{div}|[Pp][Tt][Ww][Aa][Yy]{div}|
-                [Pp][Ii][Nn][Ee][Ss]{div}|
-                [Pp][Ll][Aa][Cc][Ee]{div}|[Pp][Ll]{div}|
-                [Pp][Ll][Aa][Tt][Ee][Aa][Uu]{div}|[Pp][Ll][Aa][Tt]{div}|
-                [Pp][Ll][Aa][Zz][Aa]{div}|
-                [Pp][Oo][Ii][Nn][Tt][Ee]{div}|
-                [Pp][Oo][Ii][Nn][Tt]{div}|[Pp][Tt]{div}|
-                [Pp][Oo][Rr][Tt]{div}|
-                [Pp][Rr][Ii][Vv][Aa][Tt][Ee]{div}|[Pp][Vv][Tt]{div}|
-                [Pp][Rr][Oo][Mm][Ee][Nn][Aa][Dd][Ee]{div}|[Pp][Rr][Oo][Mm]{div}|
-                [Qq][Uu][Aa][Ii]{div}|
-                [Qq][Uu][Aa][Yy]{div}|
-                [Rr][Aa][Mm][Pp]{div}|
-                [Rr][Aa][Nn][Gg][Ee]{div}|[Rr][Gg]{div}|
-                [Rr][Aa][Nn][Gg]{div}|
-                [Rr][Ii][Dd][Gg][Ee]{div}|
-                [Rr][Ii][Ss][Ee]{div}|
-                [Rr][Oo][Aa][Dd]{div}|[Rr][Dd]{div}|
-                [Rr][Oo][Nn][Dd]\-[Pp][Oo][Ii][Nn][Tt]{div}|[Rr][Dd][Pp][Tt]{div}|
-                [Rr][Oo][Uu][Tt][Ee]{div}|[Rr][Tt][Ee]{div}|
-                [Rr][Oo][Ww]{div}|
-                [Rr][Uu][Ee][Ll][Ll][Ee]{div}|[Rr][Ll][Ee]{div}|
-                [Rr][Uu][Ee]{div}|
-                [Rr][Uu][Nn]{div}|
-                [Ss][Ee][Nn][Tt][Ii][Ee][Rr]{div}|[Ss][Ee][Nn][Tt]{div}|
+                [Bb](?ai:roadway){div}|
+                [Bb][Yy]\-?[Pp](?ai:ass){div}|
+                [Bb](?ai:yway){div}|
+                [Cc](?ai:ampus){div}|
+                [Cc](?ai:ape){div}|
+                [Cc](?ai:arre){div}|[Cc](?ai:ar){div}|
+                [Cc](?ai:arrefour){div}|[Cc](?ai:ar)[Re][Ee][Ff]{div}|
+                [Cc](?ai:entre){div}|[Cc](?ai:tr){div}|
+                [Cc](?ai:ercle){div}|
+                [Cc](?ai:hase){div}|
+                [Cc](?ai:hemin){div}|[Cc][Hh]{div}|
+                [Cc](?ai:ircle){div}|[Cc](?ai:ir){div}|
+                [Cc](?ai:ircuit){div}|[Cc](?ai:irct){div}|
+                [Cc](?ai:lose){div}|
+                [Cc](?ai:ommon){div}|
+                [Cc](?ai:oncession){div}|[Cc](?ai:onc){div}|
+                [Cc](?ai:orners){div}|
+                [Cc](?ai:ote){div}|
+                [Cc](?ai:ours){div}|
+                [Cc](?ai:our){div}|
+                [Cc](?ai:ourt){div}|[Cc](?ai:rt){div}|
+                [Cc](?ai:ove){div}|
+                [Cc](?ai:rescent){div}|[Cc](?ai:res){div}|
+                [Cc](?ai:roissant){div}|[Cc](?ai:rois){div}|
+                [Cc](?ai:rossing){div}|[Cc](?ai:ross){div}|
+                [Cc](?ai:ul\-de\-sac){div}|[Cc](?ai:ds){div}|
+                [Dd](?ai:ale){div}|
+                [Dd](?ai:ell){div}|
+                [Dd](?ai:iversion){div}|[Dd](?ai:ivers){div}|
+                [Dd](?ai:owns){div}|
+                [Dd](?ai:rive){div}|[Dd][Rr]{div}|
+                [Ee](?ai:changeur){div}|[Ee][Cc][Hh]{div}|
+                [Ee](?ai:nd){div}|
+                [Ee](?ai:splanade){div}|[Ee](?ai:spl){div}|
+                [Ee](?ai:state)[Ss]?{div}|
+                [Ee](?ai:xpressway){div}|[Ee](?ai:xpy){div}|
+                [Ee](?ai:xtension){div}|[Ee](?ai:xten){div}|
+                [Ff](?ai:arm){div}|
+                [Ff](?ai:ield){div}|
+                [Ff](?ai:orest){div}|
+                [Ff](?ai:reeway){div}|[Ff](?ai:wy){div}|
+                [Ff](?ai:ront){div}|
+                [Gg](?ai:ardens){div}|[Gg](?ai:dns){div}|
+                [Gg](?ai:ate){div}|
+                [Gg](?ai:lade){div}|
+                [Gg](?ai:len){div}|
+                [Gg](?ai:reen){div}|
+                [Gg][Rr][Uo][Uu](?ai:nds){div}|[Gg](?ai:rnds){div}|
+                [Gg](?ai:rove){div}|
+                [Hh](?ai:arbour){div}|[Hh](?ai:arbr){div}|
+                [Hh](?ai:eath){div}|
+                [Hh](?ai:eights){div}|[Hh](?ai:ts){div}|
+                [Hh](?ai:ighlands){div}|[Hh](?ai:ghld)[Sd]{div}|
+                [Hh](?ai:ig)[Gh][Ww](?ai:ay){div}|[Hh](?ai:wy){div}|
+                [Hh](?ai:ill){div}|
+                [Hh](?ai:ollow){div}|
+                [Ii](?ai:le){div}|
+                [Ii](?ai:mpasse){div}|I[Mm][Pp]{div}|
+                [Ii](?ai:nlet){div}|
+                [Ii](?ai:sland){div}|
+                [Kk](?ai:ey){div}|
+                [Kk](?ai:noll){div}|
+                [Ll](?ai:anding){div}|[Ll](?ai:andng){div}|
+                [Ll](?ai:ane){div}|
+                [Ll](?ai:imits){div}|[Ll](?ai:mts){div}|
+                [Ll](?ai:ine){div}|
+                [Ll](?ai:ink){div}|
+                [Ll](?ai:ookout){div}|[Ll](?ai:kout){div}|
+                [Mm](?ai:ainway){div}|
+                [Mm](?ai:all){div}|
+                [Mm](?ai:anor){div}|
+                [Mm](?ai:aze){div}|
+                [Mm](?ai:eadow){div}|
+                [Mm](?ai:ews){div}|
+                [Mm](?ai:ontee){div}|
+                [Mm](?ai:oor){div}|
+                [Mm](?ai:ountain){div}|[Mm](?ai:tn){div}|
+                [Mm](?ai:ount){div}|
+                [Oo](?ai:rchard){div}|[Oo](?ai:rch){div}|
+                [Pp](?ai:arade){div}|
+                [Pp](?ai:arc){div}|
+                [Pp](?ai:arkway){div}|[Pp](?ai:ky){div}|
+                [Pp](?ai:ark){div}|[Pp][Kk]{div}|
+                [Pp](?ai:assage){div}|[Pp][As][Ss][Ss]{div}|
+                [Pp](?ai:ath){div}|
+                [Pp](?ai:athway){div}|[Pp](?ai:tway){div}|
+                [Pp](?ai:ines){div}|
+                [Pp](?ai:lace){div}|[Pp][Ll]{div}|
+                [Pp](?ai:lateau){div}|[Pp](?ai:lat){div}|
+                [Pp](?ai:laza){div}|
+                [Pp](?ai:ointe){div}|
+                [Pp](?ai:oint){div}|[Pp][Tt]{div}|
+                [Pp](?ai:ort){div}|
+                [Pp](?ai:rivate){div}|[Pp](?ai:vt){div}|
+                [Pp](?ai:romenade){div}|[Pp](?ai:rom){div}|
+                [Qq](?ai:uai){div}|
+                [Qq](?ai:uay){div}|
+                [Rr](?ai:amp){div}|
+                [Rr](?ai:ange){div}|[Rr][Gg]{div}|
+                [Rr](?ai:ang){div}|
+                [Rr](?ai:idge){div}|
+                [Rr](?ai:ise){div}|
+                [Rr](?ai:oad){div}|[Rr][Dd]{div}|
+                [Rr](?ai:ond\-point){div}|[Rr](?ai:dpt){div}|
+                [Rr](?ai:oute){div}|[Rr](?ai:te){div}|
+                [Rr](?ai:ow){div}|
+                [Rr](?ai:uelle){div}|[Rr](?ai:le){div}|
+                [Rr](?ai:ue){div}|
+                [Rr](?ai:un){div}|
+                [Ss](?ai:entier){div}|[Ss](?ai:ent){div}|
                 # Street
-                [Ss][Tt][Rr][Ee][Ee][Tt]{div}|[Ss][Tt](?![A-Za-z]){div}|
+                [Ss](?ai:treet){div}|[Ss][Tt](?![A-Za-z]){div}|
                 # Square
-                [Ss][Qq][Uu][Aa][Rr][Ee]{div}|[Ss][Qq]{div}|
-                [Ss][Uu][Bb][Dd][Ii][Vv][Ii][Ss][Ii][Oo][Nn]{div}|[Ss][Uu][Bb][Dd][Ii][Vv]{div}|
-                [Tt][Ee][Rr][Rr][Aa][Cc][Ee]{div}|[Tt][Ee][Re][Re]{div}|
-                [Tt][Ee][Rr][Rr][Aa][Ss][Ss][Ee]{div}|[Tt][Ss][Ss][Es]{div}|
-                [Tt][Hh][Ii][Cc][Kk][Ee][Tt]{div}|[Tt][Hh][Ii][Cc][Kk]{div}|
-                [Tt][Oo][Ww][Ee][Rr][Ss]{div}|
-                [Tt][Oo][Ww][Nn][Ll][Ii][Nn][Ee]{div}|[Tt][Ll][Ii][Nn][Ee]{div}|
-                [Tt][Rr][Aa][Ii][Ll]{div}|
-                [Tt][Uu][Rr][Nn][Aa][Bb][Oo][Uu][Tt]{div}|[Tt][Rr][Nn][Aa][Bb][Tt]{div}|
-                [Vv][Aa][Ll][Ee]{div}|
-                [Vv][Ii][Aa]{div}|
-                [Vv][Ii][Ee][Ww]{div}|
-                [Vv][Ii][Ll][Ll][Aa][Gg][Ee]{div}|[Vv][Ii][Ll][Ll][Gg][Ee]{div}|
-                [Vv][Ii][Ll][Ll][Aa][Ss]{div}|
-                [Vv][Ii][Ss][Tt][Aa]{div}|
-                [Vv][Oo][Ii][Ee]{div}|
-                [Ww][Aa][Ll][Lk]{div}|
-                [Ww][Aa][Yy]{div}|
-                [Ww][Hh][Aa][Rr][Ff]{div}|
-                [Ww][Oo][Oo][Dd]{div}|
-                [Ww][Yy][Nn][Dd]{div}
+                [Ss](?ai:quare){div}|[Ss][Qq]{div}|
+                [Ss](?ai:ubdivision){div}|[Ss](?ai:ubdiv){div}|
+                [Tt](?ai:errace){div}|[Tt][Ee][Re][Re]{div}|
+                [Tt](?ai:errasse){div}|[Tt](?ai:ss)[Es]{div}|
+                [Tt](?ai:hicket){div}|[Tt](?ai:hick){div}|
+                [Tt](?ai:owers){div}|
+                [Tt](?ai:ownline){div}|[Tt](?ai:line){div}|
+                [Tt](?ai:rail){div}|
+                [Tt](?ai:urnabout){div}|[Tt](?ai:rnabt){div}|
+                [Vv](?ai:ale){div}|
+                [Vv](?ai:ia){div}|
+                [Vv](?ai:iew){div}|
+                [Vv](?ai:illage){div}|[Vv](?ai:illge){div}|
+                [Vv](?ai:illas){div}|
+                [Vv](?ai:ista){div}|
+                [Vv](?ai:oie){div}|
+                [Ww](?ai:al)[Lk]{div}|
+                [Ww](?ai:ay){div}|
+                [Ww](?ai:harf){div}|
+                [Ww](?ai:ood){div}|
+                [Ww](?ai:ynd){div}
             )
             (?P<route_id>
                 [\(\ \,]{route_symbols}
-                [Rr][Oo][Uu][Tt][Ee]\ [A-Za-z0-9]+[\)\ \,]{route_symbols}
+                [Rr](?ai:oute)\ [A-Za-z0-9]{{1,64}}[\)\ \,]{route_symbols}
             )?
             """.format(div="[\.\ ,]{0,2}", route_symbols='{0,3}')
 
 floor = r"""
             (?P<floor>
                 (?:
-                \d+[A-Za-z]{0,2}\.?\ [Ff][Ll][Oo][Oo][Rr]\ 
+                \d{1,10}[A-Za-z]{0,2}\.?\ [Ff](?ai:loor)\ 
                 )
                 |
                 (?:
-                    [Ff][Ll][Oo][Oo][Rr]\ \d+[A-Za-z]{0,2}\ 
+                    [Ff](?ai:loor)\ \d{1,10}[A-Za-z]{0,2}\ 
                 )
             )
         """
@@ -321,9 +324,9 @@ floor = r"""
 building = r"""
             (?:
                 (?:
-                    (?:[Bb][Uu][Ii][Ll][Dd][Ii][Nn][Gg])
+                    (?:[Bb](?ai:uilding))
                     |
-                    (?:[Bb][Ll][Dd][Gg])
+                    (?:[Bb](?ai:ldg))
                 )
                 \ \d{0,2}[A-Za-z]?
             )
@@ -337,28 +340,28 @@ occupancy = r"""
                         # English
                         #
                         # Suite
-                        [Ss][Uu][Ii][Tt][Ee]\ |[Ss][Tt][Ee]\.?\ 
+                        [Ss](?ai:uite)\ |[Ss](?ai:te)\.?\ 
                         |
                         # Apartment
-                        [Aa][Pp][Tt]\.?\ |[Aa][Pp][Aa][Rr][Tt][Mm][Ee][Nn][Tt]\ 
+                        [Aa](?ai:pt)\.?\ |[Aa](?ai:partment)\ 
                         |
                         # Room
-                        [Rr][Oo][Oo][Mm]\ |[Rr][Mm]\.?\ 
+                        [Rr](?ai:oom)\ |[Rr][Mm]\.?\ 
                         |
                         # Unit
-                        [Uu][Nn][Ii][Tt]\ 
+                        [Uu](?ai:nit)\ 
                         |
                         #
                         # French
                         #
                         # Apartement
-                        [Aa][Pp][Aa][Rr][Tt][Ee][Mm][Ee][Nn][Tt]\ |A[Pp][Pp]\ 
+                        [Aa](?ai:partement)\ |A[Pp][Pp]\ 
                         |
                         # Bureau
-                        [Bb][Uu][Rr][Ee][Aa][Uu]\ 
+                        [Bb](?ai:ureau)\ 
                         |
                         # Unité
-                        [Uu][Nn][Ii][Tt][Éé]\ 
+                        [Uu](?ai:nite)\ 
                     )
                     (?:
                         [A-Za-z\#\&\-\d]{1,7}
@@ -374,19 +377,19 @@ occupancy = r"""
 po_box = r"""
             (?P<postal_box>
                 # English - PO Box 123
-                (?:[Pp]\.?\ ?[Oo]\.?\ [Bb][Oo][Xx]\ \d+)
+                (?:[Pp]\.?\ ?[Oo]\.?\ [Bb](?ai:ox)\ \d{1,10})
                 |
                 # French - B.P. 123
-                (?:[Bb]\.?\ [Pp]\.?\ \d+)
+                (?:[Bb]\.?\ [Pp]\.?\ \d{1,10})
                 |
                 # C.P. 123
-                (?:[Cc]\.?\ [Pp]\.?\ \d+)
+                (?:[Cc]\.?\ [Pp]\.?\ \d{1,10})
                 |
                 # Case postale 123
-                (?:[Cc]ase\ [Pp][Oo][Ss][Tt][Aa][Ll][Ee]\ \d+)
+                (?:[Cc]ase\ [Pp](?ai:ostale)\ \d{1,10})
                 |
                 # C.P. 123
-                (?:[Cc]\.[Pp]\.\ \d+)
+                (?:[Cc]\.[Pp]\.\ \d{1,10})
             )
         """
 
@@ -402,19 +405,19 @@ post_direction_b = re.sub('<([a-z\_]+)>', r'<\1_b>', post_direction)
 po_box_positive_lookahead = r"""
             (?=
                 # English - PO Box 123
-                (?:[Pp]\.?\ ?[Oo]\.?\ [Bb][Oo][Xx]\ \d+)
+                (?:[Pp]\.?\ ?[Oo]\.?\ [Bb](?ai:ox)\ \d{1,10})
                 |
                 # French - B.P. 123
-                (?:[Bb]\.?\ [Pp]\.?\ \d+)
+                (?:[Bb]\.?\ [Pp]\.?\ \d{1,10})
                 |
                 # C.P. 123
-                (?:[Cc]\.?\ [Pp]\.?\ \d+)
+                (?:[Cc]\.?\ [Pp]\.?\ \d{1,10})
                 |
                 # Case postale 123
-                (?:[Cc]ase\ [Pp][Oo][Ss][Tt][Aa][Ll][Ee]\ \d+)
+                (?:[Cc]ase\ [Pp](?ai:ostale)\ \d{1,10})
                 |
                 # C.P. 123
-                (?:[Cc]\.[Pp]\.\ \d+)
+                (?:[Cc]\.[Pp]\.\ \d{1,10})
                 |
                 (?:[\ \,])
             )
@@ -474,6 +477,13 @@ full_street = r"""
                 div='[\ ,]{1,2}',
                 )
 
+province_names = [
+    'Alberta', 'British Columbia', 'Manitoba', 'New Brunswick',
+    'Newfoundland and Labrador', 'Newfoundland & Labrador',
+    'Northwest Territories', 'Nova Scotia', 'Nunavut', 'Ontario',
+    'Prince Edward Island', 'Quebec', 'Saskatchewan', 'Yukon',
+]
+
 # region1 here is actually a "province"
 region1 = r"""
         (?P<region1>
@@ -486,39 +496,25 @@ region1 = r"""
             |
             (?:
                 # provinces full (English)
-                [Aa][Ll][Bb][Ee][Rr][Tt][Aa]|
-                [Bb][Rr][Ii][Tt][Ii][Ss][Hh]\ [Cc][Oo][Ll][Uu][Mm][Bb][Ii][Aa]|
-                [Mm][Aa][Nn][Ii][Tt][Oo][Bb][Aa]|
-                [Nn][Ee][Ww]\ [Bb][Rr][Uu][Nn][Ss][Ww][Ii][Cc][Kk]|
-                [Nn][Ee][Ww][Ff][Oo][Uu][Nn][Dd][Ll][Aa][Nn][Dd]\ 
-                [Aa][Nn][Dd]\ [Ll][Aa][Bb][Rr][Aa][Dd][Oo][Rr]|
-                [Nn][Ee][Ww][Ff][Oo][Uu][Nn][Dd][Ll][Aa][Nn][Dd]\ 
-                \&\ [Ll][Aa][Bb][Rr][Aa][Dd][Oo][Rr]|
-                [Nn][Oo][Rr][Tt][Hh][Ww][Ee][Ss][Tt]\ 
-                [Tt][Ee][Rr][Rr][Ii][Tt][Oo][Rr][Ii][Ee][Ss]|
-                [Nn][Oo][Vv][Aa]\ [Ss][Cc][Oo][Tt][Ii][Aa]|
-                [Nn][Uu][Nn][Aa][Vv][Uu][Tt]|
-                [Oo][Nn][Tt][Aa][Rr][Ii][Oo]|
-                [Pp][Rr][Ii][Nn][Cc][Ee]\ [Ee][Dd][Ww][Aa][Rr][Dd]\ 
-                [Ii][Ss][Ll][Aa][Nn][Dd]|
-                [Qq][Uu][Ee][Bb][Ee][Cc]|
-                [Ss][Aa][Ss][Kk][Aa][Tt][Cc][Hh][Ee][Ww][Aa][Nn]|
-                [Yy][Uu][Kk][Oo][Nn]|
+                {province_names}
+                |
                 # provinces full (French)
-                [Cc][Oo][Ll][Oo][Mm][Bb][Ii][Ee]\-
-                [Bb][Rr][Ii][Tt][Aa][Nn]{1,2}[Ii][Qq][Eu][Ee]|
-                [Nn][Oo][Uu][Vv][Ee][Aa][Uu]\-[Bb][Rr][Uu][Nn][Ss][Ww][Ii][Cc][Kk]|
-                [Tt][Ee][Rr][Rr][Ee]\-[Nn][Ee][Uu][Vv][Ee]\-
-                [Ee][Tt]\-[Ll][Aa][Bb][Rr][Aa][Dd][Oo][Rr]|
-                [Tt][Ee][Rr][Rr][Ii][Tt][Oo][Ii][Rr][Ee][Ss]\ [Dd][Uu]\ 
-                [Nn][Oo][Rr][Dd]\-[Oo][Uu][Ee][Ss][Tt]|
-                [Nn][Oo][Uu][Vv][Ee][Ll][Ll][Ee]\-[ÉéEe][Cc][Oo][Ss][Ss][Ee]|
-                [ÎîIi][Ll][Ee]\-[Dd][Uu]\-[Pp][Rr][Ii][Nn][Cc][Ee]\-
-                [ÉéEe][Dd][Oo][Uu][Aa][Rr][Dd]|
-                [Qq][Uu][Éé][Bb][Ee][Cc]
+                [Cc](?ai:olombie)\-
+                [Bb](?ai:rita)[Nn]{{1,2}}[Ii][Qq][Eu][Ee]|
+                [Nn](?ai:ouveau\-brunswick)|
+                [Tt](?ai:erre\-neuve)\-
+                [Ee](?ai:t\-labrador)|
+                [Tt](?ai:erritoires\ du)\ 
+                [Nn](?ai:ord\-ouest)|
+                [Nn](?ai:ouvelle\-ecosse)|
+                [Ii](?ai:le\-du\-prince)\-
+                [Ee](?ai:douard)
+                # Québec is the same as Quebec without accents
             )
         )
-        """
+        """.format(
+    province_names=utils.words_to_regex(province_names),
+)
 
 city = r"""
         (?P<city>
@@ -538,7 +534,7 @@ postal_code = r"""
 
 country = r"""
             (?:
-                [Cc][Aa][Nn][Aa][Dd][Aa]
+                [Cc](?ai:anada)
             )
             """
 
@@ -572,3 +568,20 @@ full_address = r"""
     postal_code_b=postal_code_b,
     postal_code_c=postal_code_c,
 )
+
+# every address contains a region, so matching is only tried near one
+address_anchor = region1
+
+# every address starts with a street number: digits or one of these words
+# followed by a space, so matching is only tried where one of them starts
+address_start_words = (
+    'and', 'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven',
+    'eight', 'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen',
+    'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty',
+    'thirty', 'forty', 'fourty', 'fifty', 'sixty', 'seventy', 'eighty',
+    'ninety', 'hundred', 'thousand',
+)
+
+# rules are written without accents and matched against text with accented
+# letters folded to ASCII ones, 'Québec' -> 'Quebec'
+address_fold_accents = True
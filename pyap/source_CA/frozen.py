@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+# Generated by 'python -m pyap.freeze CA' from
+# pyap/source_CA/data.py. Do not edit.
+
+fingerprint = 'ed4cfbd3'
+
+full_address = "\n                (?P<full_address>\n                    \n    (?:\n        # Format commonly used in French\n        (?P<full_street_b>\n\n            (?<![\\.0-9])(?P<street_number_b>\n                        (?:\n                            [Aa](?ai:nd)\\ \n                            |\n                            (?:\n    [Tt](?ai:housand)\\ \n    )\n                            |\n                            (?:\n    [Hh](?ai:undred)\\ \n    )\n                            |\n                            (?:\n    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n    [Ee](?ai:leven)\\ |\n    [Tt](?ai:welve)\\ |\n    [Tt](?ai:hirteen)\\ |\n    [Ff](?ai:ourteen)\\ |\n    [Ff](?ai:ifteen)\\ |\n    [Ss](?ai:ixteen)\\ |\n    [Ss](?ai:eventeen)\\ |\n    [Ee](?ai:ighteen)\\ |\n    [Nn](?ai:ineteen)\\ \n    )\n\n                            |\n                            (?:\n    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n    [Tt](?ai:hirty)\\ |\n    [Ff](?ai:orty)\\ |\n    [Ff](?ai:ourty)\\ |\n    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n    [Ss](?ai:eventy)\\ |\n    [Ee](?ai:ighty)\\ |\n    [Nn](?ai:inety)\\ \n    )\n                        ){1,5}\n                        |\n                        # 85th - 1190\n                        (?:\\d{1,5}(?:th)?\n                            (?:\\ ?\\-?\\ ?\\d{1,5}(?:th)?)?\\ \n                        )\n                        |\n                        # 45\n                        (?:\\d{1,5}(?=[\\ ,]))\n                    )\n                [\\ ,]{1,2}\n            \n            (?P<street_type_b>\n                [Aa](?ai:bbey)[\\.\\ ,]{0,2}|\n                [Aa](?ai:cres)[\\.\\ ,]{0,2}|\n                [Aa](?ai:llee)[\\.\\ ,]{0,2}|\n                [Aa](?ai:lley)[\\.\\ ,]{0,2}|\n                [Aa](?ai:utoroute)[\\.\\ ,]{0,2}|[Aa](?ai:ut)[\\.\\ ,]{0,2}|\n                [Aa](?ai:venue)[\\.\\ ,]{0,2}|[Aa][Vv][Ee]?[\\.\\ ,]{0,2}|\n                [Bb](?ai:ay)[\\.\\ ,]{0,2}|\n                [Bb](?ai:each)[\\.\\ ,]{0,2}|\n                [Bb](?ai:end)[\\.\\ ,]{0,2}|\n                [Bb](?ai:ouleva)[Er][Dd][\\.\\ ,]{0,2}|[Bb](?ai:lvd)[\\.\\ ,]{0,2}|[Bb](?ai:oul)[\\.\\ ,]{0,2}|\n                # Broadway\n                [Bb](?ai:roadway)[\\.\\ ,]{0,2}|\n                [Bb][Yy]\\-?[Pp](?ai:ass)[\\.\\ ,]{0,2}|\n                [Bb](?ai:yway)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ampus)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ape)[\\.\\ ,]{0,2}|\n                [Cc](?ai:arre)[\\.\\ ,]{0,2}|[Cc](?ai:ar)[\\.\\ ,]{0,2}|\n                [Cc](?ai:arrefour)[\\.\\ ,]{0,2}|[Cc](?ai:ar)[Re][Ee][Ff][\\.\\ ,]{0,2}|\n                [Cc](?ai:entre)[\\.\\ ,]{0,2}|[Cc](?ai:tr)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ercle)[\\.\\ ,]{0,2}|\n                [Cc](?ai:hase)[\\.\\ ,]{0,2}|\n                [Cc](?ai:hemin)[\\.\\ ,]{0,2}|[Cc][Hh][\\.\\ ,]{0,2}|\n                [Cc](?ai:ircle)[\\.\\ ,]{0,2}|[Cc](?ai:ir)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ircuit)[\\.\\ ,]{0,2}|[Cc](?ai:irct)[\\.\\ ,]{0,2}|\n                [Cc](?ai:lose)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ommon)[\\.\\ ,]{0,2}|\n                [Cc](?ai:oncession)[\\.\\ ,]{0,2}|[Cc](?ai:onc)[\\.\\ ,]{0,2}|\n                [Cc](?ai:orners)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ote)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ours)[\\.\\ ,]{0,2}|\n                [Cc](?ai:our)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ourt)[\\.\\ ,]{0,2}|[Cc](?ai:rt)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ove)[\\.\\ ,]{0,2}|\n                [Cc](?ai:rescent)[\\.\\ ,]{0,2}|[Cc](?ai:res)[\\.\\ ,]{0,2}|\n                [Cc](?ai:roissant)[\\.\\ ,]{0,2}|[Cc](?ai:rois)[\\.\\ ,]{0,2}|\n                [Cc](?ai:rossing)[\\.\\ ,]{0,2}|[Cc](?ai:ross)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ul\\-de\\-sac)[\\.\\ ,]{0,2}|[Cc](?ai:ds)[\\.\\ ,]{0,2}|\n                [Dd](?ai:ale)[\\.\\ ,]{0,2}|\n                [Dd](?ai:ell)[\\.\\ ,]{0,2}|\n                [Dd](?ai:iversion)[\\.\\ ,]{0,2}|[Dd](?ai:ivers)[\\.\\ ,]{0,2}|\n                [Dd](?ai:owns)[\\.\\ ,]{0,2}|\n                [Dd](?ai:rive)[\\.\\ ,]{0,2}|[Dd][Rr][\\.\\ ,]{0,2}|\n                [Ee](?ai:changeur)[\\.\\ ,]{0,2}|[Ee][Cc][Hh][\\.\\ ,]{0,2}|\n                [Ee](?ai:nd)[\\.\\ ,]{0,2}|\n                [Ee](?ai:splanade)[\\.\\ ,]{0,2}|[Ee](?ai:spl)[\\.\\ ,]{0,2}|\n                [Ee](?ai:state)[Ss]?[\\.\\ ,]{0,2}|\n                [Ee](?ai:xpressway)[\\.\\ ,]{0,2}|[Ee](?ai:xpy)[\\.\\ ,]{0,2}|\n                [Ee](?ai:xtension)[\\.\\ ,]{0,2}|[Ee](?ai:xten)[\\.\\ ,]{0,2}|\n                [Ff](?ai:arm)[\\.\\ ,]{0,2}|\n                [Ff](?ai:ield)[\\.\\ ,]{0,2}|\n                [Ff](?ai:orest)[\\.\\ ,]{0,2}|\n                [Ff](?ai:reeway)[\\.\\ ,]{0,2}|[Ff](?ai:wy)[\\.\\ ,]{0,2}|\n                [Ff](?ai:ront)[\\.\\ ,]{0,2}|\n                [Gg](?ai:ardens)[\\.\\ ,]{0,2}|[Gg](?ai:dns)[\\.\\ ,]{0,2}|\n                [Gg](?ai:ate)[\\.\\ ,]{0,2}|\n                [Gg](?ai:lade)[\\.\\ ,]{0,2}|\n                [Gg](?ai:len)[\\.\\ ,]{0,2}|\n                [Gg](?ai:reen)[\\.\\ ,]{0,2}|\n                [Gg][Rr][Uo][Uu](?ai:nds)[\\.\\ ,]{0,2}|[Gg](?ai:rnds)[\\.\\ ,]{0,2}|\n                [Gg](?ai:rove)[\\.\\ ,]{0,2}|\n                [Hh](?ai:arbour)[\\.\\ ,]{0,2}|[Hh](?ai:arbr)[\\.\\ ,]{0,2}|\n                [Hh](?ai:eath)[\\.\\ ,]{0,2}|\n                [Hh](?ai:eights)[\\.\\ ,]{0,2}|[Hh](?ai:ts)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ighlands)[\\.\\ ,]{0,2}|[Hh](?ai:ghld)[Sd][\\.\\ ,]{0,2}|\n                [Hh](?ai:ig)[Gh][Ww](?ai:ay)[\\.\\ ,]{0,2}|[Hh](?ai:wy)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ill)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ollow)[\\.\\ ,]{0,2}|\n                [Ii](?ai:le)[\\.\\ ,]{0,2}|\n                [Ii](?ai:mpasse)[\\.\\ ,]{0,2}|I[Mm][Pp][\\.\\ ,]{0,2}|\n                [Ii](?ai:nlet)[\\.\\ ,]{0,2}|\n                [Ii](?ai:sland)[\\.\\ ,]{0,2}|\n                [Kk](?ai:ey)[\\.\\ ,]{0,2}|\n                [Kk](?ai:noll)[\\.\\ ,]{0,2}|\n                [Ll](?ai:anding)[\\.\\ ,]{0,2}|[Ll](?ai:andng)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ane)[\\.\\ ,]{0,2}|\n                [Ll](?ai:imits)[\\.\\ ,]{0,2}|[Ll](?ai:mts)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ine)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ink)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ookout)[\\.\\ ,]{0,2}|[Ll](?ai:kout)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ainway)[\\.\\ ,]{0,2}|\n                [Mm](?ai:all)[\\.\\ ,]{0,2}|\n                [Mm](?ai:anor)[\\.\\ ,]{0,2}|\n                [Mm](?ai:aze)[\\.\\ ,]{0,2}|\n                [Mm](?ai:eadow)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ews)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ontee)[\\.\\ ,]{0,2}|\n                [Mm](?ai:oor)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ountain)[\\.\\ ,]{0,2}|[Mm](?ai:tn)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ount)[\\.\\ ,]{0,2}|\n                [Oo](?ai:rchard)[\\.\\ ,]{0,2}|[Oo](?ai:rch)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arade)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arc)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arkway)[\\.\\ ,]{0,2}|[Pp](?ai:ky)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ark)[\\.\\ ,]{0,2}|[Pp][Kk][\\.\\ ,]{0,2}|\n                [Pp](?ai:assage)[\\.\\ ,]{0,2}|[Pp][As][Ss][Ss][\\.\\ ,]{0,2}|\n                [Pp](?ai:ath)[\\.\\ ,]{0,2}|\n                [Pp](?ai:athway)[\\.\\ ,]{0,2}|[Pp](?ai:tway)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ines)[\\.\\ ,]{0,2}|\n                [Pp](?ai:lace)[\\.\\ ,]{0,2}|[Pp][Ll][\\.\\ ,]{0,2}|\n                [Pp](?ai:lateau)[\\.\\ ,]{0,2}|[Pp](?ai:lat)[\\.\\ ,]{0,2}|\n                [Pp](?ai:laza)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ointe)[\\.\\ ,]{0,2}|\n                [Pp](?ai:oint)[\\.\\ ,]{0,2}|[Pp][Tt][\\.\\ ,]{0,2}|\n                [Pp](?ai:ort)[\\.\\ ,]{0,2}|\n                [Pp](?ai:rivate)[\\.\\ ,]{0,2}|[Pp](?ai:vt)[\\.\\ ,]{0,2}|\n                [Pp](?ai:romenade)[\\.\\ ,]{0,2}|[Pp](?ai:rom)[\\.\\ ,]{0,2}|\n                [Qq](?ai:uai)[\\.\\ ,]{0,2}|\n                [Qq](?ai:uay)[\\.\\ ,]{0,2}|\n                [Rr](?ai:amp)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ange)[\\.\\ ,]{0,2}|[Rr][Gg][\\.\\ ,]{0,2}|\n                [Rr](?ai:ang)[\\.\\ ,]{0,2}|\n                [Rr](?ai:idge)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ise)[\\.\\ ,]{0,2}|\n                [Rr](?ai:oad)[\\.\\ ,]{0,2}|[Rr][Dd][\\.\\ ,]{0,2}|\n                [Rr](?ai:ond\\-point)[\\.\\ ,]{0,2}|[Rr](?ai:dpt)[\\.\\ ,]{0,2}|\n                [Rr](?ai:oute)[\\.\\ ,]{0,2}|[Rr](?ai:te)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ow)[\\.\\ ,]{0,2}|\n                [Rr](?ai:uelle)[\\.\\ ,]{0,2}|[Rr](?ai:le)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ue)[\\.\\ ,]{0,2}|\n                [Rr](?ai:un)[\\.\\ ,]{0,2}|\n                [Ss](?ai:entier)[\\.\\ ,]{0,2}|[Ss](?ai:ent)[\\.\\ ,]{0,2}|\n                # Street\n                [Ss](?ai:treet)[\\.\\ ,]{0,2}|[Ss][Tt](?![A-Za-z])[\\.\\ ,]{0,2}|\n                # Square\n                [Ss](?ai:quare)[\\.\\ ,]{0,2}|[Ss][Qq][\\.\\ ,]{0,2}|\n                [Ss](?ai:ubdivision)[\\.\\ ,]{0,2}|[Ss](?ai:ubdiv)[\\.\\ ,]{0,2}|\n                [Tt](?ai:errace)[\\.\\ ,]{0,2}|[Tt][Ee][Re][Re][\\.\\ ,]{0,2}|\n                [Tt](?ai:errasse)[\\.\\ ,]{0,2}|[Tt](?ai:ss)[Es][\\.\\ ,]{0,2}|\n                [Tt](?ai:hicket)[\\.\\ ,]{0,2}|[Tt](?ai:hick)[\\.\\ ,]{0,2}|\n                [Tt](?ai:owers)[\\.\\ ,]{0,2}|\n                [Tt](?ai:ownline)[\\.\\ ,]{0,2}|[Tt](?ai:line)[\\.\\ ,]{0,2}|\n                [Tt](?ai:rail)[\\.\\ ,]{0,2}|\n                [Tt](?ai:urnabout)[\\.\\ ,]{0,2}|[Tt](?ai:rnabt)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ale)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ia)[\\.\\ ,]{0,2}|\n                [Vv](?ai:iew)[\\.\\ ,]{0,2}|\n                [Vv](?ai:illage)[\\.\\ ,]{0,2}|[Vv](?ai:illge)[\\.\\ ,]{0,2}|\n                [Vv](?ai:illas)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ista)[\\.\\ ,]{0,2}|\n                [Vv](?ai:oie)[\\.\\ ,]{0,2}|\n                [Ww](?ai:al)[Lk][\\.\\ ,]{0,2}|\n                [Ww](?ai:ay)[\\.\\ ,]{0,2}|\n                [Ww](?ai:harf)[\\.\\ ,]{0,2}|\n                [Ww](?ai:ood)[\\.\\ ,]{0,2}|\n                [Ww](?ai:ynd)[\\.\\ ,]{0,2}\n            )\n            (?P<route_id_b>\n                [\\(\\ \\,]{0,3}\n                [Rr](?ai:oute)\\ [A-Za-z0-9]{1,64}[\\)\\ \\,]{0,3}\n            )?\n            [\\ ,]{1,2}\n            ((?P<street_name_b>\n                  \\w[\\w0-9\\'\\-\\ \\.]{0,30}?\n                 )\n               \n            (?=\n                # English - PO Box 123\n                (?:[Pp]\\.?\\ ?[Oo]\\.?\\ [Bb](?ai:ox)\\ \\d{1,10})\n                |\n                # French - B.P. 123\n                (?:[Bb]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # Case postale 123\n                (?:[Cc]ase\\ [Pp](?ai:ostale)\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.[Pp]\\.\\ \\d{1,10})\n                |\n                (?:[\\ \\,])\n            )\n        )?\\,?\\ ?\n            \n                    (?P<post_direction_b>\n                        (?:\n                            # English\n                            [Nn](?ai:orth)[\\ ,]|\n                            [Ss](?ai:outh)[\\ ,]|\n                            [Ee](?ai:ast)[\\ ,]|\n                            [Ww](?ai:est)[\\ ,]|\n                            [Nn](?ai:ortheast)[\\ ,]|\n                            [Nn](?ai:orthwest)[\\ ,]|\n                            [Ss](?ai:outheast)[\\ ,]|\n                            [Ss](?ai:outhwest)[\\ ,]|\n                            # French\n                            [Ee](?ai:st)[\\ ,]|\n                            [Nn](?ai:ord)[\\ ,]|\n                            [Nn](?ai:ord\\-est)[\\ ,]|\n                            [Nn](?ai:ord\\-ouest)[\\ ,]|\n                            [Ss](?ai:ud)[\\ ,]|\n                            [Ss](?ai:ud\\-est)[\\ ,]|\n                            [Ss](?ai:ud\\-ouest)[\\ ,]|\n                            [Oo](?ai:uest)[\\ ,]\n                        )\n                        |\n                        (?:\n                            # English\n                            NW[\\ ,]|NE[\\ ,]|SW[\\ ,]|SE[\\ ,]|\n                            # French (missing above)\n                            NO[\\ ,]|SO[\\ ,]\n                        )\n                        |\n                        (?:\n                            # English\n                            N[\\.\\ ]|S[\\.\\ ]|E[\\.\\ ]|W[\\.\\ ]|\n                            # French (missing above)\n                            O[\\.\\ ]\n                        )\n                    )\n                ?\\,?\\ ?\n            \n            (?P<postal_box_b>\n                # English - PO Box 123\n                (?:[Pp]\\.?\\ ?[Oo]\\.?\\ [Bb](?ai:ox)\\ \\d{1,10})\n                |\n                # French - B.P. 123\n                (?:[Bb]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # Case postale 123\n                (?:[Cc]ase\\ [Pp](?ai:ostale)\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.[Pp]\\.\\ \\d{1,10})\n            )\n        ?\\,?\\ ?\n        )\n        |\n        # Format commonly used in English\n        (?P<full_street>\n\n            (?<![\\.0-9])(?P<street_number>\n                        (?:\n                            [Aa](?ai:nd)\\ \n                            |\n                            (?:\n    [Tt](?ai:housand)\\ \n    )\n                            |\n                            (?:\n    [Hh](?ai:undred)\\ \n    )\n                            |\n                            (?:\n    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n    [Ee](?ai:leven)\\ |\n    [Tt](?ai:welve)\\ |\n    [Tt](?ai:hirteen)\\ |\n    [Ff](?ai:ourteen)\\ |\n    [Ff](?ai:ifteen)\\ |\n    [Ss](?ai:ixteen)\\ |\n    [Ss](?ai:eventeen)\\ |\n    [Ee](?ai:ighteen)\\ |\n    [Nn](?ai:ineteen)\\ \n    )\n\n                            |\n                            (?:\n    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n    [Tt](?ai:hirty)\\ |\n    [Ff](?ai:orty)\\ |\n    [Ff](?ai:ourty)\\ |\n    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n    [Ss](?ai:eventy)\\ |\n    [Ee](?ai:ighty)\\ |\n    [Nn](?ai:inety)\\ \n    )\n                        ){1,5}\n                        |\n                        # 85th - 1190\n                        (?:\\d{1,5}(?:th)?\n                            (?:\\ ?\\-?\\ ?\\d{1,5}(?:th)?)?\\ \n                        )\n                        |\n                        # 45\n                        (?:\\d{1,5}(?=[\\ ,]))\n                    )\n                \\,?\\ ?\n            (?P<street_name>\n                  \\w[\\w0-9\\'\\-\\ \\.]{0,30}?\n                 )\n              ?\\,?\\ ?\n            (?:(?<=[\\ \\,])\n            (?P<street_type>\n                [Aa](?ai:bbey)[\\.\\ ,]{0,2}|\n                [Aa](?ai:cres)[\\.\\ ,]{0,2}|\n                [Aa](?ai:llee)[\\.\\ ,]{0,2}|\n                [Aa](?ai:lley)[\\.\\ ,]{0,2}|\n                [Aa](?ai:utoroute)[\\.\\ ,]{0,2}|[Aa](?ai:ut)[\\.\\ ,]{0,2}|\n                [Aa](?ai:venue)[\\.\\ ,]{0,2}|[Aa][Vv][Ee]?[\\.\\ ,]{0,2}|\n                [Bb](?ai:ay)[\\.\\ ,]{0,2}|\n                [Bb](?ai:each)[\\.\\ ,]{0,2}|\n                [Bb](?ai:end)[\\.\\ ,]{0,2}|\n                [Bb](?ai:ouleva)[Er][Dd][\\.\\ ,]{0,2}|[Bb](?ai:lvd)[\\.\\ ,]{0,2}|[Bb](?ai:oul)[\\.\\ ,]{0,2}|\n                # Broadway\n                [Bb](?ai:roadway)[\\.\\ ,]{0,2}|\n                [Bb][Yy]\\-?[Pp](?ai:ass)[\\.\\ ,]{0,2}|\n                [Bb](?ai:yway)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ampus)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ape)[\\.\\ ,]{0,2}|\n                [Cc](?ai:arre)[\\.\\ ,]{0,2}|[Cc](?ai:ar)[\\.\\ ,]{0,2}|\n                [Cc](?ai:arrefour)[\\.\\ ,]{0,2}|[Cc](?ai:ar)[Re][Ee][Ff][\\.\\ ,]{0,2}|\n                [Cc](?ai:entre)[\\.\\ ,]{0,2}|[Cc](?ai:tr)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ercle)[\\.\\ ,]{0,2}|\n                [Cc](?ai:hase)[\\.\\ ,]{0,2}|\n                [Cc](?ai:hemin)[\\.\\ ,]{0,2}|[Cc][Hh][\\.\\ ,]{0,2}|\n                [Cc](?ai:ircle)[\\.\\ ,]{0,2}|[Cc](?ai:ir)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ircuit)[\\.\\ ,]{0,2}|[Cc](?ai:irct)[\\.\\ ,]{0,2}|\n                [Cc](?ai:lose)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ommon)[\\.\\ ,]{0,2}|\n                [Cc](?ai:oncession)[\\.\\ ,]{0,2}|[Cc](?ai:onc)[\\.\\ ,]{0,2}|\n                [Cc](?ai:orners)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ote)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ours)[\\.\\ ,]{0,2}|\n                [Cc](?ai:our)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ourt)[\\.\\ ,]{0,2}|[Cc](?ai:rt)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ove)[\\.\\ ,]{0,2}|\n                [Cc](?ai:rescent)[\\.\\ ,]{0,2}|[Cc](?ai:res)[\\.\\ ,]{0,2}|\n                [Cc](?ai:roissant)[\\.\\ ,]{0,2}|[Cc](?ai:rois)[\\.\\ ,]{0,2}|\n                [Cc](?ai:rossing)[\\.\\ ,]{0,2}|[Cc](?ai:ross)[\\.\\ ,]{0,2}|\n                [Cc](?ai:ul\\-de\\-sac)[\\.\\ ,]{0,2}|[Cc](?ai:ds)[\\.\\ ,]{0,2}|\n                [Dd](?ai:ale)[\\.\\ ,]{0,2}|\n                [Dd](?ai:ell)[\\.\\ ,]{0,2}|\n                [Dd](?ai:iversion)[\\.\\ ,]{0,2}|[Dd](?ai:ivers)[\\.\\ ,]{0,2}|\n                [Dd](?ai:owns)[\\.\\ ,]{0,2}|\n                [Dd](?ai:rive)[\\.\\ ,]{0,2}|[Dd][Rr][\\.\\ ,]{0,2}|\n                [Ee](?ai:changeur)[\\.\\ ,]{0,2}|[Ee][Cc][Hh][\\.\\ ,]{0,2}|\n                [Ee](?ai:nd)[\\.\\ ,]{0,2}|\n                [Ee](?ai:splanade)[\\.\\ ,]{0,2}|[Ee](?ai:spl)[\\.\\ ,]{0,2}|\n                [Ee](?ai:state)[Ss]?[\\.\\ ,]{0,2}|\n                [Ee](?ai:xpressway)[\\.\\ ,]{0,2}|[Ee](?ai:xpy)[\\.\\ ,]{0,2}|\n                [Ee](?ai:xtension)[\\.\\ ,]{0,2}|[Ee](?ai:xten)[\\.\\ ,]{0,2}|\n                [Ff](?ai:arm)[\\.\\ ,]{0,2}|\n                [Ff](?ai:ield)[\\.\\ ,]{0,2}|\n                [Ff](?ai:orest)[\\.\\ ,]{0,2}|\n                [Ff](?ai:reeway)[\\.\\ ,]{0,2}|[Ff](?ai:wy)[\\.\\ ,]{0,2}|\n                [Ff](?ai:ront)[\\.\\ ,]{0,2}|\n                [Gg](?ai:ardens)[\\.\\ ,]{0,2}|[Gg](?ai:dns)[\\.\\ ,]{0,2}|\n                [Gg](?ai:ate)[\\.\\ ,]{0,2}|\n                [Gg](?ai:lade)[\\.\\ ,]{0,2}|\n                [Gg](?ai:len)[\\.\\ ,]{0,2}|\n                [Gg](?ai:reen)[\\.\\ ,]{0,2}|\n                [Gg][Rr][Uo][Uu](?ai:nds)[\\.\\ ,]{0,2}|[Gg](?ai:rnds)[\\.\\ ,]{0,2}|\n                [Gg](?ai:rove)[\\.\\ ,]{0,2}|\n                [Hh](?ai:arbour)[\\.\\ ,]{0,2}|[Hh](?ai:arbr)[\\.\\ ,]{0,2}|\n                [Hh](?ai:eath)[\\.\\ ,]{0,2}|\n                [Hh](?ai:eights)[\\.\\ ,]{0,2}|[Hh](?ai:ts)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ighlands)[\\.\\ ,]{0,2}|[Hh](?ai:ghld)[Sd][\\.\\ ,]{0,2}|\n                [Hh](?ai:ig)[Gh][Ww](?ai:ay)[\\.\\ ,]{0,2}|[Hh](?ai:wy)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ill)[\\.\\ ,]{0,2}|\n                [Hh](?ai:ollow)[\\.\\ ,]{0,2}|\n                [Ii](?ai:le)[\\.\\ ,]{0,2}|\n                [Ii](?ai:mpasse)[\\.\\ ,]{0,2}|I[Mm][Pp][\\.\\ ,]{0,2}|\n                [Ii](?ai:nlet)[\\.\\ ,]{0,2}|\n                [Ii](?ai:sland)[\\.\\ ,]{0,2}|\n                [Kk](?ai:ey)[\\.\\ ,]{0,2}|\n                [Kk](?ai:noll)[\\.\\ ,]{0,2}|\n                [Ll](?ai:anding)[\\.\\ ,]{0,2}|[Ll](?ai:andng)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ane)[\\.\\ ,]{0,2}|\n                [Ll](?ai:imits)[\\.\\ ,]{0,2}|[Ll](?ai:mts)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ine)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ink)[\\.\\ ,]{0,2}|\n                [Ll](?ai:ookout)[\\.\\ ,]{0,2}|[Ll](?ai:kout)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ainway)[\\.\\ ,]{0,2}|\n                [Mm](?ai:all)[\\.\\ ,]{0,2}|\n                [Mm](?ai:anor)[\\.\\ ,]{0,2}|\n                [Mm](?ai:aze)[\\.\\ ,]{0,2}|\n                [Mm](?ai:eadow)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ews)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ontee)[\\.\\ ,]{0,2}|\n                [Mm](?ai:oor)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ountain)[\\.\\ ,]{0,2}|[Mm](?ai:tn)[\\.\\ ,]{0,2}|\n                [Mm](?ai:ount)[\\.\\ ,]{0,2}|\n                [Oo](?ai:rchard)[\\.\\ ,]{0,2}|[Oo](?ai:rch)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arade)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arc)[\\.\\ ,]{0,2}|\n                [Pp](?ai:arkway)[\\.\\ ,]{0,2}|[Pp](?ai:ky)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ark)[\\.\\ ,]{0,2}|[Pp][Kk][\\.\\ ,]{0,2}|\n                [Pp](?ai:assage)[\\.\\ ,]{0,2}|[Pp][As][Ss][Ss][\\.\\ ,]{0,2}|\n                [Pp](?ai:ath)[\\.\\ ,]{0,2}|\n                [Pp](?ai:athway)[\\.\\ ,]{0,2}|[Pp](?ai:tway)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ines)[\\.\\ ,]{0,2}|\n                [Pp](?ai:lace)[\\.\\ ,]{0,2}|[Pp][Ll][\\.\\ ,]{0,2}|\n                [Pp](?ai:lateau)[\\.\\ ,]{0,2}|[Pp](?ai:lat)[\\.\\ ,]{0,2}|\n                [Pp](?ai:laza)[\\.\\ ,]{0,2}|\n                [Pp](?ai:ointe)[\\.\\ ,]{0,2}|\n                [Pp](?ai:oint)[\\.\\ ,]{0,2}|[Pp][Tt][\\.\\ ,]{0,2}|\n                [Pp](?ai:ort)[\\.\\ ,]{0,2}|\n                [Pp](?ai:rivate)[\\.\\ ,]{0,2}|[Pp](?ai:vt)[\\.\\ ,]{0,2}|\n                [Pp](?ai:romenade)[\\.\\ ,]{0,2}|[Pp](?ai:rom)[\\.\\ ,]{0,2}|\n                [Qq](?ai:uai)[\\.\\ ,]{0,2}|\n                [Qq](?ai:uay)[\\.\\ ,]{0,2}|\n                [Rr](?ai:amp)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ange)[\\.\\ ,]{0,2}|[Rr][Gg][\\.\\ ,]{0,2}|\n                [Rr](?ai:ang)[\\.\\ ,]{0,2}|\n                [Rr](?ai:idge)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ise)[\\.\\ ,]{0,2}|\n                [Rr](?ai:oad)[\\.\\ ,]{0,2}|[Rr][Dd][\\.\\ ,]{0,2}|\n                [Rr](?ai:ond\\-point)[\\.\\ ,]{0,2}|[Rr](?ai:dpt)[\\.\\ ,]{0,2}|\n                [Rr](?ai:oute)[\\.\\ ,]{0,2}|[Rr](?ai:te)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ow)[\\.\\ ,]{0,2}|\n                [Rr](?ai:uelle)[\\.\\ ,]{0,2}|[Rr](?ai:le)[\\.\\ ,]{0,2}|\n                [Rr](?ai:ue)[\\.\\ ,]{0,2}|\n                [Rr](?ai:un)[\\.\\ ,]{0,2}|\n                [Ss](?ai:entier)[\\.\\ ,]{0,2}|[Ss](?ai:ent)[\\.\\ ,]{0,2}|\n                # Street\n                [Ss](?ai:treet)[\\.\\ ,]{0,2}|[Ss][Tt](?![A-Za-z])[\\.\\ ,]{0,2}|\n                # Square\n                [Ss](?ai:quare)[\\.\\ ,]{0,2}|[Ss][Qq][\\.\\ ,]{0,2}|\n                [Ss](?ai:ubdivision)[\\.\\ ,]{0,2}|[Ss](?ai:ubdiv)[\\.\\ ,]{0,2}|\n                [Tt](?ai:errace)[\\.\\ ,]{0,2}|[Tt][Ee][Re][Re][\\.\\ ,]{0,2}|\n                [Tt](?ai:errasse)[\\.\\ ,]{0,2}|[Tt](?ai:ss)[Es][\\.\\ ,]{0,2}|\n                [Tt](?ai:hicket)[\\.\\ ,]{0,2}|[Tt](?ai:hick)[\\.\\ ,]{0,2}|\n                [Tt](?ai:owers)[\\.\\ ,]{0,2}|\n                [Tt](?ai:ownline)[\\.\\ ,]{0,2}|[Tt](?ai:line)[\\.\\ ,]{0,2}|\n                [Tt](?ai:rail)[\\.\\ ,]{0,2}|\n                [Tt](?ai:urnabout)[\\.\\ ,]{0,2}|[Tt](?ai:rnabt)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ale)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ia)[\\.\\ ,]{0,2}|\n                [Vv](?ai:iew)[\\.\\ ,]{0,2}|\n                [Vv](?ai:illage)[\\.\\ ,]{0,2}|[Vv](?ai:illge)[\\.\\ ,]{0,2}|\n                [Vv](?ai:illas)[\\.\\ ,]{0,2}|\n                [Vv](?ai:ista)[\\.\\ ,]{0,2}|\n                [Vv](?ai:oie)[\\.\\ ,]{0,2}|\n                [Ww](?ai:al)[Lk][\\.\\ ,]{0,2}|\n                [Ww](?ai:ay)[\\.\\ ,]{0,2}|\n                [Ww](?ai:harf)[\\.\\ ,]{0,2}|\n                [Ww](?ai:ood)[\\.\\ ,]{0,2}|\n                [Ww](?ai:ynd)[\\.\\ ,]{0,2}\n            )\n            (?P<route_id>\n                [\\(\\ \\,]{0,3}\n                [Rr](?ai:oute)\\ [A-Za-z0-9]{1,64}[\\)\\ \\,]{0,3}\n            )?\n            )\\,?\\ ?\n            \n                    (?P<post_direction>\n                        (?:\n                            # English\n                            [Nn](?ai:orth)[\\ ,]|\n                            [Ss](?ai:outh)[\\ ,]|\n                            [Ee](?ai:ast)[\\ ,]|\n                            [Ww](?ai:est)[\\ ,]|\n                            [Nn](?ai:ortheast)[\\ ,]|\n                            [Nn](?ai:orthwest)[\\ ,]|\n                            [Ss](?ai:outheast)[\\ ,]|\n                            [Ss](?ai:outhwest)[\\ ,]|\n                            # French\n                            [Ee](?ai:st)[\\ ,]|\n                            [Nn](?ai:ord)[\\ ,]|\n                            [Nn](?ai:ord\\-est)[\\ ,]|\n                            [Nn](?ai:ord\\-ouest)[\\ ,]|\n                            [Ss](?ai:ud)[\\ ,]|\n                            [Ss](?ai:ud\\-est)[\\ ,]|\n                            [Ss](?ai:ud\\-ouest)[\\ ,]|\n                            [Oo](?ai:uest)[\\ ,]\n                        )\n                        |\n                        (?:\n                            # English\n                            NW[\\ ,]|NE[\\ ,]|SW[\\ ,]|SE[\\ ,]|\n                            # French (missing above)\n                            NO[\\ ,]|SO[\\ ,]\n                        )\n                        |\n                        (?:\n                            # English\n                            N[\\.\\ ]|S[\\.\\ ]|E[\\.\\ ]|W[\\.\\ ]|\n                            # French (missing above)\n                            O[\\.\\ ]\n                        )\n                    )\n                ?\\,?\\ ?\n            \n            (?P<floor>\n                (?:\n                \\d{1,10}[A-Za-z]{0,2}\\.?\\ [Ff](?ai:loor)\\ \n                )\n                |\n                (?:\n                    [Ff](?ai:loor)\\ \\d{1,10}[A-Za-z]{0,2}\\ \n                )\n            )\n        ?\\,?\\ ?\n\n            (?P<building_id>\n                \n            (?:\n                (?:\n                    (?:[Bb](?ai:uilding))\n                    |\n                    (?:[Bb](?ai:ldg))\n                )\n                \\ \\d{0,2}[A-Za-z]?\n            )\n            \n            )?\\,?\\ ?\n\n            (?P<occupancy>\n                \n            (?:\n                (?:\n                    (?:\n                        #\n                        # English\n                        #\n                        # Suite\n                        [Ss](?ai:uite)\\ |[Ss](?ai:te)\\.?\\ \n                        |\n                        # Apartment\n                        [Aa](?ai:pt)\\.?\\ |[Aa](?ai:partment)\\ \n                        |\n                        # Room\n                        [Rr](?ai:oom)\\ |[Rr][Mm]\\.?\\ \n                        |\n                        # Unit\n                        [Uu](?ai:nit)\\ \n                        |\n                        #\n                        # French\n                        #\n                        # Apartement\n                        [Aa](?ai:partement)\\ |A[Pp][Pp]\\ \n                        |\n                        # Bureau\n                        [Bb](?ai:ureau)\\ \n                        |\n                        # Unité\n                        [Uu](?ai:nite)\\ \n                    )\n                    (?:\n                        [A-Za-z\\#\\&\\-\\d]{1,7}\n                    )?\n                )\n                |\n                (?:\n                    \\#[0-9]{,3}[A-Za-z]{1}\n                )\n            )\\ ?\n            \n            )?\\,?\\ ?\n\n            \n            (?P<postal_box>\n                # English - PO Box 123\n                (?:[Pp]\\.?\\ ?[Oo]\\.?\\ [Bb](?ai:ox)\\ \\d{1,10})\n                |\n                # French - B.P. 123\n                (?:[Bb]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.?\\ [Pp]\\.?\\ \\d{1,10})\n                |\n                # Case postale 123\n                (?:[Cc]ase\\ [Pp](?ai:ostale)\\ \\d{1,10})\n                |\n                # C.P. 123\n                (?:[Cc]\\.[Pp]\\.\\ \\d{1,10})\n            )\n        ?\n        )\n    ) [\\, ]{,2}\n                    \n        (?P<city>\n            (?<=[\\, ])[A-z]{1}(?![0-9]) # city second char should not be number\n            [\\w\\ \\-\\'\\.]{2,20}?(?=[\\, ])\n        )\n         [\\, ]{,2}\n                    (?:\n            (?P<postal_code_c>\n                (?:\n                    [ABCEGHJKLMNPRSTVXY]\\d[ABCEGHJKLMNPRSTVWXYZ]\\ ?\n                    \\d[ABCEGHJKLMNPRSTVWXYZ]\\d\n                )\n            )\n             [\\, ]{,2})?\n                    \\(?\n        (?P<region1>\n            (?:\n                # province abbreviations (English)\n                A\\.?B\\.?|B\\.?C\\.?|M\\.?B\\.?|N\\.?B\\.?|N\\.?L\\.?|\n                N\\.?T\\.?|N\\.?S\\.?|N\\.?U\\.?|O\\.?N\\.?|P\\.?E\\.?|\n                Q\\.?C\\.?|S\\.?K\\.?|Y\\.?T\\.?\n            )\n            |\n            (?:\n                # provinces full (English)\n                (?:[Aa](?ai:lberta)|[Bb](?ai:ritish\\ columbia)|[Mm](?ai:anitoba)|[Nn](?:[Ee][Ww](?:\\ (?ai:brunswick)|[Ff](?ai:oundland\\ )(?:\\&(?ai:\\ labrador)|[Aa](?ai:nd\\ labrador)))|[Oo](?:[Rr](?ai:thwest\\ territories)|[Vv](?ai:a\\ scotia))|[Uu](?ai:navut))|[Oo](?ai:ntario)|[Pp](?ai:rince\\ edward\\ island)|[Qq](?ai:uebec)|[Ss](?ai:askatchewan)|[Yy](?ai:ukon))\n                |\n                # provinces full (French)\n                [Cc](?ai:olombie)\\-\n                [Bb](?ai:rita)[Nn]{1,2}[Ii][Qq][Eu][Ee]|\n                [Nn](?ai:ouveau\\-brunswick)|\n                [Tt](?ai:erre\\-neuve)\\-\n                [Ee](?ai:t\\-labrador)|\n                [Tt](?ai:erritoires\\ du)\\ \n                [Nn](?ai:ord\\-ouest)|\n                [Nn](?ai:ouvelle\\-ecosse)|\n                [Ii](?ai:le\\-du\\-prince)\\-\n                [Ee](?ai:douard)\n                # Québec is the same as Quebec without accents\n            )\n        )\n        [\\)\\.]? [\\, ]{,2}\n                    (?:\n                        (?:\n                            \n            (?P<postal_code>\n                (?:\n                    [ABCEGHJKLMNPRSTVXY]\\d[ABCEGHJKLMNPRSTVWXYZ]\\ ?\n                    \\d[ABCEGHJKLMNPRSTVWXYZ]\\d\n                )\n            )\n            ? [\\, ]{,2} \n            (?:\n                [Cc](?ai:anada)\n            )\n            ? \n                            (?:[\\, ]{,2} \n            (?P<postal_code_b>\n                (?:\n                    [ABCEGHJKLMNPRSTVXY]\\d[ABCEGHJKLMNPRSTVWXYZ]\\ ?\n                    \\d[ABCEGHJKLMNPRSTVWXYZ]\\d\n                )\n            )\n            )?\n                        )\n                    )\n                )\n                "
+
+address_anchor = '\n        (?P<region1>\n            (?:\n                # province abbreviations (English)\n                A\\.?B\\.?|B\\.?C\\.?|M\\.?B\\.?|N\\.?B\\.?|N\\.?L\\.?|\n                N\\.?T\\.?|N\\.?S\\.?|N\\.?U\\.?|O\\.?N\\.?|P\\.?E\\.?|\n                Q\\.?C\\.?|S\\.?K\\.?|Y\\.?T\\.?\n            )\n            |\n            (?:\n                # provinces full (English)\n                (?:[Aa](?ai:lberta)|[Bb](?ai:ritish\\ columbia)|[Mm](?ai:anitoba)|[Nn](?:[Ee][Ww](?:\\ (?ai:brunswick)|[Ff](?ai:oundland\\ )(?:\\&(?ai:\\ labrador)|[Aa](?ai:nd\\ labrador)))|[Oo](?:[Rr](?ai:thwest\\ territories)|[Vv](?ai:a\\ scotia))|[Uu](?ai:navut))|[Oo](?ai:ntario)|[Pp](?ai:rince\\ edward\\ island)|[Qq](?ai:uebec)|[Ss](?ai:askatchewan)|[Yy](?ai:ukon))\n                |\n                # provinces full (French)\n                [Cc](?ai:olombie)\\-\n                [Bb](?ai:rita)[Nn]{1,2}[Ii][Qq][Eu][Ee]|\n                [Nn](?ai:ouveau\\-brunswick)|\n                [Tt](?ai:erre\\-neuve)\\-\n                [Ee](?ai:t\\-labrador)|\n                [Tt](?ai:erritoires\\ du)\\ \n                [Nn](?ai:ord\\-ouest)|\n                [Nn](?ai:ouvelle\\-ecosse)|\n                [Ii](?ai:le\\-du\\-prince)\\-\n                [Ee](?ai:douard)\n                # Québec is the same as Quebec without accents\n            )\n        )\n        '
+
+address_start_words = ('and', 'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty', 'thirty', 'forty', 'fourty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety', 'hundred', 'thousand')
+
+address_fold_accents = True
@@ -44,9 +44,9 @@ https://atkinsbookshelf.wordpress.com/tag/longest-street-name-in-us/
 street_name = r"""(?P<street_name>[a-zA-Z0-9À-ÿ\ \.]{3,40})"""
 
 # Regexp for matching street type
-import string
 import re
-from unidecode import unidecode
+
+from .. import utils
 
 street_type_list = [
     "Allée", 'ALL',
@@ -77,34 +77,24 @@ street_type_list = [
     'Ruelle',
 ]
 
+def street_type_char_to_regex(char):
+    """Converts a character of a street type into a regex"""
+    if char in " '-":
+        return "[ '-]?"
+    return re.escape(char)
+
+
 def street_type_list_to_regex(street_type_list):
     """Converts a list of street types into a regex"""
-    street_types = '|'.join(set(street_type_list)).lower()
-    
-    for letter in string.ascii_lowercase:
-        street_types = street_types.replace(letter, '[{upper}{lower}]'.format(upper=letter.upper(), lower=letter))
-        
-    for letter in 'éèêëçîïàâäôöùûüÿ':
-        street_types = street_types.replace(
-            letter, 
-            '[{upper}{lower}{upper_norm}{lower_norm}]'.format(
-                upper=letter.upper(), 
-                lower=letter, 
-                upper_norm=unidecode(letter).upper(),
-                lower_norm=unidecode(letter).lower()
-            )
-        )
-        
-    street_types = re.sub(r"[ '-]", "[ '-]?", street_types)
-
+    # Text is matched with accents folded (see address_fold_accents),
+    # so street types are written without them too
+    street_type_list = [utils.fold_accents(street_type)
+                        for street_type in street_type_list]
     # Use \b to check that there are word boundaries before and after the street type
     # Optionally match zero to two of " ", ",", or "." after the street name
-        
-    street_types = street_types.replace('|', r'\b{div}|\b')
-    street_types = r'\b' + street_types + r'\b{div}'
-    
-    
-    return street_types.format(
+    return r'\b{street_types}\b{div}'.format(
+        street_types=utils.words_to_regex(
+            street_type_list, char_regex=street_type_char_to_regex),
         div=r'[\.\ ,]{0,2}',
     )
 
@@ -135,64 +125,44 @@ postal_code = r"""
                 )
                 """
 
-def commune_list_to_regex(street_type_list):
-    """Converts a list of street types into a regex"""
-    
-    special_cases = {
-        'e' : 'éèêëÉÈÊË',
-        'c' : 'Ç',
-        'i' : 'îïÎÏ',
-        'a' : 'àâäÀÂÄ',
-        'o' : 'ôöùÔÖÙ',
-        'u' : 'ûüÛÜ',
-        'y' : 'Ÿ'
-    }
-    
-    street_types = '|'.join(set(street_type_list)).lower()
-    
-    for letter in string.ascii_lowercase:
-        street_types = street_types.replace(
-            letter, 
-            '[{upper}{lower}{special_cases}]'.format(
-                upper=letter.upper(), 
-                lower=letter,
-                special_cases=special_cases.get(letter, '')
-            )
-        )
-        
-    street_types = re.sub(r"[ '-]", "[ '-]?", street_types)
-
-    # Use \b to check that there are word boundaries before and after the street type
-    # Optionally match zero to two of " ", ",", or "." after the street name
-        
-    street_types = street_types.replace('|', r'\b{div}|\b')
-    street_types = r'\b' + street_types + r'\b{div}'
-    
-    
-    return street_types.format(
-        div=r'[\.\ ,]{0,2}',
-    )
-
-import pandas as pd 
+# Any run of up to seven words, like "Saint-Martin-d'Hères" or
+# "Lyon 03": communes are looked up in the gazetteer after matching
+# rather than spelled out in the rules.
+commune = r"""
+                (?P<commune>
+                    [^\W\d_]{1,64}(?:[\ '\-]{1,3}[^\W\d_]{1,64}){0,6}(?:\ \d{1,2})?
+                )
+                """
 
+# communes.bin is built from the official list of postal codes
 # https://www.data.gouv.fr/fr/datasets/base-officielle-des-codes-postaux/
-codes_postal_df = pd.read_csv('codes_postsal.csv', sep=';' , encoding='latin-1')
-communes = codes_postal_df.Nom_de_la_commune.tolist()
+# with 'python -m pyap.gazetteer pyap/source_FR/codes_postal.csv
+# Nom_de_la_commune pyap/source_FR/communes.bin ";" latin-1'
+address_gazetteers = {
+    'commune': {'path': 'communes.bin'},
+}
+
+# rules are written without accents and matched against text with accented
+# letters folded to ASCII ones, 'Allée' -> 'Allee'
+address_fold_accents = True
 
 
 full_address = r"""
     (?P<full_address>
         {full_street} 
         {part_divider}? {postal_code} 
-        {part_divider}? {communes} 
+        {part_divider}? {commune} 
     )  # end full_address
 """.format(
     full_street=full_street,
     part_divider=part_divider,
     postal_code=postal_code,
-    communes = commune_list_to_regex(communes)
+    commune=commune,
 )
 
+# every address contains a postal code, so matching is only tried near one
+address_anchor = postal_code
+
 
 
 # add not appt / app
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+# Generated by 'python -m pyap.freeze FR' from
+# pyap/source_FR/data.py. Do not edit.
+
+fingerprint = '7c5ff7ec'
+
+full_address = "\n    (?P<full_address>\n        \n        (?:\n            (?P<full_street>                \n                (?:\n                    (?: (?P<street_number>(?:\\d{1,5})(?: [\\ \\t]{1,3} )?) (?: [\\ \\t]{1,3} ) )\n                    |\n                    (?! \\d{} ) \n                    \n                )?\n                (?:(?: [\\ \\t]{1,3} ) \\b(?:[Aa](?:[Ll][Ll](?:[Ee][Ee])?|[Vv](?:[Ee](?ai:nue))?)|[Bb](?:[Oo](?ai:ulevard)|[Dd])|[Cc](?:[Cc](?ai:aa)|[Ee](?ai:ntre)(?:[ '-]?(?ai:commercial))?|[Hh](?ai:em)|[Tt](?ai:re))|[Ii][Mm](?:[Mm](?:[Ee](?ai:uble)[Ss]?)?|[Pp](?:[Aa](?ai:sse))?)|[Ll](?:[Ii](?ai:eu)(?:[ '-]?(?ai:dit)|[Dd](?ai:itlotissement))|[Oo][Tt]|[Dd])|[Mm](?ai:ontee)|[Pp](?:[Aa][Ss](?:[Ss](?ai:age))?|[Ll](?:[Aa](?ai:ce))?)|[Rr](?:[Ee][Ss](?:[Ii](?ai:dence))?|[Oo](?ai:nd)(?:[ '-]?(?ai:point)|[Pp](?ai:oint))|[Pp](?ai:troute)|[Tt][Ee]|[Uu](?ai:elle))|[Ss](?:[Ee](?ai:nt)(?:[Ii](?ai:er))?|[Qq](?:[Uu](?ai:are))?)|[Vv](?:[Ii](?ai:llage)|[Ll](?ai:ge))|[Zz](?:[Aa][CDcd]?|[Ii](?ai:chemin)|[Oo](?ai:ne[ '-]?)(?:[Dd](?ai:[ '-]?activite)(?:[ '-]?(?:[Cc](?ai:oncerte)|[Dd](?ai:iffere)))?|[Ii](?ai:ndustrielle))))\\b[\\.\\ ,]{0,2} (?: [\\ \\t]{1,3} )?)? \n                (?:(?P<street_name>[a-zA-Z0-9À-ÿ\\ \\.]{3,40}) )\n            )\n        )  # end full_street\n \n        (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )? \n                (?P<postal_code>\n                    (?:\\d{5})\n                )\n                 \n        (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )? \n                (?P<commune>\n                    [^\\W\\d_]{1,64}(?:[\\ '\\-]{1,3}[^\\W\\d_]{1,64}){0,6}(?:\\ \\d{1,2})?\n                )\n                 \n    )  # end full_address\n"
+
+address_anchor = '\n                (?P<postal_code>\n                    (?:\\d{5})\n                )\n                '
+
+address_gazetteers = {'commune': {'path': 'communes.bin'}}
+
+address_fold_accents = True
@@ -16,55 +16,56 @@
 
 
 '''Numerals from one to nine
-Note: here and below we use syntax like '[Oo][Nn][Ee]'
-instead of '(one)(?i)' to match 'One' or 'oNe' because
-Python Regexps don't seem to support turning On/Off
-case modes for subcapturing groups.
+Note: here and below we use syntax like '[Oo](?ai:ne)' to match
+'One' or 'oNe'. Scoped '(?ai:...)' groups keep the patterns short,
+while the first letter stays a character class, which re checks
+before trying an alternative. The 'a' flag folds ASCII letters only,
+as the classes do: 'ſ' or the Kelvin sign are no 's' or 'k'.
 '''
 zero_to_nine = r"""
                                 (?:
-                                    [Zz][Ee][Rr][Oo]\ |[Oo][Nn][Ee]\ |[Tt][Ww][Oo]\ |
-                                    [Tt][Hh][Rr][Ee][Ee]\ |[Ff][Oo][Uu][Rr]\ |
-                                    [Ff][Ii][Vv][Ee]\ |[Ss][Ii][Xx]\ |
-                                    [Ss][Ee][Vv][Ee][Nn]\ |[Ee][Ii][Gg][Hh][Tt]\ |
-                                    [Nn][Ii][Nn][Ee]\ |[Tt][Ee][Nn]\ |
-                                    [Ee][Ll][Ee][Vv][Ee][Nn]\ |
-                                    [Tt][Ww][Ee][Ll][Vv][Ee]\ |
-                                    [Tt][Hh][Ii][Rr][Tt][Ee][Ee][Nn]\ |
-                                    [Ff][Oo][Uu][Rr][Tt][Ee][Ee][Nn]\ |
-                                    [Ff][Ii][Ff][Tt][Ee][Ee][Nn]\ |
-                                    [Ss][Ii][Xx][Tt][Ee][Ee][Nn]\ |
-                                    [Ss][Ee][Vv][Ee][Nn][Tt][Ee][Ee][Nn]\ |
-                                    [Ee][Ii][Gg][Hh][Tt][Ee][Ee][Nn]\ |
-                                    [Nn][Ii][Nn][Ee][Tt][Ee][Ee][Nn]\ 
+                                    [Zz](?ai:ero)\ |[Oo](?ai:ne)\ |[Tt](?ai:wo)\ |
+                                    [Tt](?ai:hree)\ |[Ff](?ai:our)\ |
+                                    [Ff](?ai:ive)\ |[Ss](?ai:ix)\ |
+                                    [Ss](?ai:even)\ |[Ee](?ai:ight)\ |
+                                    [Nn](?ai:ine)\ |[Tt](?ai:en)\ |
+                                    [Ee](?ai:leven)\ |
+                                    [Tt](?ai:welve)\ |
+                                    [Tt](?ai:hirteen)\ |
+                                    [Ff](?ai:ourteen)\ |
+                                    [Ff](?ai:ifteen)\ |
+                                    [Ss](?ai:ixteen)\ |
+                                    [Ss](?ai:eventeen)\ |
+                                    [Ee](?ai:ighteen)\ |
+                                    [Nn](?ai:ineteen)\ 
                                 )
 """
 
 # Numerals - 10, 20, 30 ... 90
 ten_to_ninety = r"""
                                 (?:
-                                    [Tt][Ee][Nn]\ |[Tt][Ww][Ee][Nn][Tt][Yy]\ |
-                                    [Tt][Hh][Ii][Rr][Tt][Yy]\ |
-                                    [Ff][Oo][Rr][Tt][Yy]\ |
-                                    [Ff][Oo][Uu][Rr][Tt][Yy]\ |
-                                    [Ff][Ii][Ff][Tt][Yy]\ |[Ss][Ii][Xx][Tt][Yy]\ |
-                                    [Ss][Ee][Vv][Ee][Nn][Tt][Yy]\ |
-                                    [Ee][Ii][Gg][Hh][Tt][Yy]\ |
-                                    [Nn][Ii][Nn][Ee][Tt][Yy]\ 
+                                    [Tt](?ai:en)\ |[Tt](?ai:wenty)\ |
+                                    [Tt](?ai:hirty)\ |
+                                    [Ff](?ai:orty)\ |
+                                    [Ff](?ai:ourty)\ |
+                                    [Ff](?ai:ifty)\ |[Ss](?ai:ixty)\ |
+                                    [Ss](?ai:eventy)\ |
+                                    [Ee](?ai:ighty)\ |
+                                    [Nn](?ai:inety)\ 
                                 )
 """
 
 # One hundred
 hundred = r"""
                                 (?:
-                                    [Hh][Uu][Nn][Dd][Rr][Ee][Dd]\ 
+                                    [Hh](?ai:undred)\ 
                                 )
 """
 
 # One thousand
 thousand = r"""
                                 (?:
-                                    [Tt][Hh][Oo][Uu][Ss][Aa][Nn][Dd]\ 
+                                    [Tt](?ai:housand)\ 
                                 )
 """
 
@@ -84,16 +85,16 @@ street_number = r"""
                     (?P<street_number>
                         (?:
                             (?:
-                                [Nn][Uu][Mm][Bb][Ee][Rr]|
+                                [Nn](?ai:umber)|
                                 [Nn][RrOo]\.?|
-                                [Nn][Uu][Mm]\.?|
+                                [Nn](?ai:um)\.?|
                                 #
                             )
                             {space}?
                         )?
                         (?:
                             (?:
-                                [Aa][Nn][Dd]\ 
+                                [Aa](?ai:nd)\ 
                                 |
                                 {thousand}
                                 |
@@ -141,10 +142,10 @@ street_name = r"""
 post_direction = r"""
                     (?P<post_direction>
                         (?:
-                            [Nn][Oo][Rr][Tt][Hh]\ |
-                            [Ss][Oo][Uu][Tt][Hh]\ |
-                            [Ee][Aa][Ss][Tt]\ |
-                            [Ww][Ee][Ss][Tt]\ 
+                            [Nn](?ai:orth)\ |
+                            [Ss](?ai:outh)\ |
+                            [Ee](?ai:ast)\ |
+                            [Ww](?ai:est)\ 
                         )
                         |
                         (?:
@@ -162,51 +163,51 @@ street_type = r"""
                     (?:
                         (?P<street_type>
                             # Street
-                            [Ss][Tt][Rr][Ee][Ee][Tt]|S[Tt]\.?(?![A-Za-z])|
+                            [Ss](?ai:treet)|S[Tt]\.?(?![A-Za-z])|
                             # Boulevard
-                            [Bb][Oo][Uu][Ll][Ee][Vv][Aa][Rr][Dd]|[Bb][Ll][Vv][Dd]\.?|
+                            [Bb](?ai:oulevard)|[Bb](?ai:lvd)\.?|
                             # Highway
-                            [Hh][Ii][Gg][Hh][Ww][Aa][Yy]|H[Ww][Yy]\.?|
+                            [Hh](?ai:ighway)|H[Ww][Yy]\.?|
                             # Broadway
-                            [Bb][Rr][Oo][Aa][Dd][Ww][Aa][Yy]|
+                            [Bb](?ai:roadway)|
                             # Freeway
-                            [Ff][Rr][Ee][Ee][Ww][Aa][Yy]|
+                            [Ff](?ai:reeway)|
                             # Causeway
-                            [Cc][Aa][Uu][Ss][Ee][Ww][Aa][Yy]|C[Ss][Ww][Yy]\.?|
+                            [Cc](?ai:auseway)|C[Ss][Ww][Yy]\.?|
                             # Expressway
-                            [Ee][Xx][Pp][Rr][Ee][Ss][Ss][Ww][Aa][Yy]|
+                            [Ee](?ai:xpressway)|
                             # Way
-                            [Ww][Aa][Yy]|
+                            [Ww](?ai:ay)|
                             # Walk
-                            [Ww][Aa][Ll][Kk]|
+                            [Ww](?ai:alk)|
                             # Lane
-                            [Ll][Aa][Nn][Ee]|L[Nn]\.?|
+                            [Ll](?ai:ane)|L[Nn]\.?|
                             # Road
-                            [Rr][Oo][Aa][Dd]|R[Dd]\.?|
+                            [Rr](?ai:oad)|R[Dd]\.?|
                             # Avenue
-                            [Aa][Vv][Ee][Nn][Uu][Ee]|A[Vv][Ee]\.?|
+                            [Aa](?ai:venue)|A[Vv][Ee]\.?|
                             # Circle
-                            [Cc][Ii][Rr][Cc][Ll][Ee]|C[Ii][Rr]\.?|
+                            [Cc](?ai:ircle)|C[Ii][Rr]\.?|
                             # Cove
-                            [Cc][Oo][Vv][Ee]|C[Vv]\.?|
+                            [Cc](?ai:ove)|C[Vv]\.?|
                             # Drive
-                            [Dd][Rr][Ii][Vv][Ee]|D[Rr]\.?|
+                            [Dd](?ai:rive)|D[Rr]\.?|
                             # Parkway
-                            [Pp][Aa][Rr][Kk][Ww][Aa][Yy]|P[Kk][Ww][Yy]\.?|
+                            [Pp](?ai:arkway)|P[Kk][Ww][Yy]\.?|
                             # Park
-                            [Pp][Aa][Rr][Kk]|
+                            [Pp](?ai:ark)|
                             # Court
-                            [Cc][Oo][Uu][Rr][Tt]|C[Tt]\.?|
+                            [Cc](?ai:ourt)|C[Tt]\.?|
                             # Square
-                            [Ss][Qq][Uu][Aa][Rr][Ee]|S[Qq]\.?|
+                            [Ss](?ai:quare)|S[Qq]\.?|
                             # Loop
-                            [Ll][Oo][Oo][Pp]|L[Pp]\.?|
+                            [Ll](?ai:oop)|L[Pp]\.?|
                             # Place
-                            [Pp][Ll][Aa][Cc][Ee]|P[Ll]\.?|
+                            [Pp](?ai:lace)|P[Ll]\.?|
                             # Parade
-                            [Pp][Aa][Rr][Aa][Dd][Ee]|P[Ll]\.?|
+                            [Pp](?ai:arade)|P[Ll]\.?|
                             # Estate
-                            [Ee][Ss][Tt][Aa][Tt][Ee]
+                            [Ee](?ai:state)
                         )
                         (?P<route_id>)
                     )  # end street_type
@@ -217,11 +218,11 @@ street_type = r"""
 floor = r"""
                     (?P<floor>
                         (?:
-                        \d+[A-Za-z]{0,2}\.?\ [Ff][Ll][Oo][Oo][Rr]\ 
+                        \d{1,10}[A-Za-z]{0,2}\.?\ [Ff](?ai:loor)\ 
                         )
                         |
                         (?:
-                            [Ff][Ll][Oo][Oo][Rr]\ \d+[A-Za-z]{0,2}\ 
+                            [Ff](?ai:loor)\ \d{1,10}[A-Za-z]{0,2}\ 
                         )
                     )  # end floor
 """
@@ -229,14 +230,14 @@ floor = r"""
 building = r"""
                     (?P<building_id>
                         (?:
-                            (?:[Bb][Uu][Ii][Ll][Dd][Ii][Nn][Gg])
+                            (?:[Bb](?ai:uilding))
                             |
-                            (?:[Bb][Ll][Dd][Gg])
+                            (?:[Bb](?ai:ldg))
                         )
                         \ 
                         (?:
                             (?:
-                                [Aa][Nn][Dd]\ 
+                                [Aa](?ai:nd)\ 
                                 |
                                 {thousand}
                                 |
@@ -263,19 +264,19 @@ occupancy = r"""
                         (?:
                             (?:
                                 # Suite
-                                [Ss][Uu][Ii][Tt][Ee]|[Ss][Tt][Ee]\.?
+                                [Ss](?ai:uite)|[Ss](?ai:te)\.?
                                 |
                                 # Studio
-                                [Ss][Tt][Uu][Dd][Ii][Oo]|[Ss][Tt][UuDd]\.?
+                                [Ss](?ai:tudio)|[Ss][Tt][UuDd]\.?
                                 |
                                 # Apartment
-                                [Aa][Pp][Tt]\.?|[Aa][Pp][Aa][Rr][Tt][Mm][Ee][Nn][Tt]
+                                [Aa](?ai:pt)\.?|[Aa](?ai:partment)
                                 |
                                 # Room
-                                [Rr][Oo][Oo][Mm]|[Rr][Mm]\.?
+                                [Rr](?ai:oom)|[Rr][Mm]\.?
                                 |
                                 # Flat
-                                [Ff][Ll][Aa][Tt]
+                                [Ff](?ai:lat)
                                 |
                                 \#
                             )
@@ -292,7 +293,7 @@ occupancy = r"""
 
 po_box = r"""
                     (?:
-                        [Pp]\.? {space}? [Oo]\.? {space}? ([Bb][Oo][Xx]{space}?)?\d+
+                        [Pp]\.? {space}? [Oo]\.? {space}? ([Bb](?ai:ox){space}?)?\d{{1,10}}
                     )
 """.format(
     space=space_pattern,
@@ -354,18 +355,18 @@ city = r"""
 postal_code = r"""
         (?P<postal_code>
             (?:
-                (?:[gG][iI][rR] {0,}0[aA]{2})|
+                (?:[Gg](?ai:ir)?0[aA]{2})|
                 (?:
                     (?:
-                        [aA][sS][cC][nN]|
-                        [sS][tT][hH][lL]|
-                        [tT][dD][cC][uU]|
-                        [bB][bB][nN][dD]|
-                        [bB][iI][qQ][qQ]|
-                        [fF][iI][qQ][qQ]|
-                        [pP][cC][rR][nN]|
-                        [sS][iI][qQ][qQ]|
-                        [iT][kK][cC][aA]
+                        [Aa](?ai:scn)|
+                        [Ss](?ai:thl)|
+                        [Tt](?ai:dcu)|
+                        [Bb](?ai:bnd)|
+                        [Bb](?ai:iqq)|
+                        [Ff](?ai:iqq)|
+                        [Pp](?ai:crn)|
+                        [Ss](?ai:iqq)|
+                        [iT][Kk](?ai:ca)
                     )
                     \ {0,}1[zZ]{2}
                 )|
@@ -385,14 +386,14 @@ postal_code = r"""
 
 country = r"""
         (?P<country>
-            (?:[Tt][Hh][Ee]\ *)?[Uu][Nn][Ii][Tt][Ee][Dd]\ *[Kk][Ii][Nn][Gg][Dd][Oo][Mm]\ *[Oo][Ff]\ *(?:[Gg][Rr][Ee][Aa][Tt]\ *)?[Bb][Rr][Ii][Tt][Aa][Ii][Nn](?:\ *[Aa][Nn][Dd]\ *[Nn][Oo][Rr][Tt][Hh][Ee][Rr][Nn]\ *[Ii][Rr][Ee][Ll][Aa][Nn][Dd])?|
-            (?:[Gg][Rr][Ee][Aa][Tt]\ *)?[Bb][Rr][Ii][Tt][Aa][Ii][Nn](?:\ *[Aa][Nn][Dd]\ *[Nn][Oo][Rr][Tt][Hh][Ee][Rr][Nn]\ *[Ii][Rr][Ee][Ll][Aa][Nn][Dd])?|
-            (?:[Tt][Hh][Ee]\ *)?[Uu][Nn][Ii][Tt][Ee][Dd]\ *[Kk][Ii][Nn][Gg][Dd][Oo][Mm]|
-            (?:[Nn][Oo][Rr][Tt][Hh][Ee][Rr][Nn]\ *)?[Ii][Rr][Ee][Ll][Aa][Nn][Dd]|
-            [Ee][Nn][Gg][Ll][Aa][Nn][Dd]|
-            [Ss][Cc][Oo][Tt][Ll][Aa][Nn][Dd]|
-            [Ww][Aa][Ll][Ee][Ss]|
-            [Cc][Yy][Mm][Rr][Uu]|
+            (?:[Tt](?ai:he)\ *)?[Uu](?ai:nited)\ *[Kk](?ai:ingdom)\ *[Oo][Ff]\ *(?:[Gg](?ai:reat)\ *)?[Bb](?ai:ritain)(?:\ *[Aa](?ai:nd)\ *[Nn](?ai:orthern)\ *[Ii](?ai:reland))?|
+            (?:[Gg](?ai:reat)\ *)?[Bb](?ai:ritain)(?:\ *[Aa](?ai:nd)\ *[Nn](?ai:orthern)\ *[Ii](?ai:reland))?|
+            (?:[Tt](?ai:he)\ *)?[Uu](?ai:nited)\ *[Kk](?ai:ingdom)|
+            (?:[Nn](?ai:orthern)\ *)?[Ii](?ai:reland)|
+            [Ee](?ai:ngland)|
+            [Ss](?ai:cotland)|
+            [Ww](?ai:ales)|
+            [Cc](?ai:ymru)|
             [Gg][Bb]|
             [Uu][Kk]|  
             [Nn]\.?\ *[Ii]\.?
@@ -415,3 +416,6 @@ full_address = r"""
     country=country,
     postal_code=postal_code,
 )
+
+# every address contains a postcode, so matching is only tried near one
+address_anchor = postal_code
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+# Generated by 'python -m pyap.freeze GB' from
+# pyap/source_GB/data.py. Do not edit.
+
+fingerprint = '71f4854d'
+
+full_address = "\n    (?P<full_address>\n        \n        (?:\n            (?P<full_street>\n    \n                (?:\n                    \n                    (?:\n                        [Pp]\\.? (?: [\\ \\t]{1,3} )? [Oo]\\.? (?: [\\ \\t]{1,3} )? ([Bb](?ai:ox)(?: [\\ \\t]{1,3} )?)?\\d{1,10}\n                    )\n (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )?  # TODO: maybe remove the '?' on the part_dividers is mismatch address parts \n                )?\n                (?:\n                    \n                    (?P<floor>\n                        (?:\n                        \\d{1,10}[A-Za-z]{0,2}\\.?\\ [Ff](?ai:loor)\\ \n                        )\n                        |\n                        (?:\n                            [Ff](?ai:loor)\\ \\d{1,10}[A-Za-z]{0,2}\\ \n                        )\n                    )  # end floor\n (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )?\n                )?\n                (?:\n                    \n                    (?P<occupancy>\n                        (?:\n                            (?:\n                                # Suite\n                                [Ss](?ai:uite)|[Ss](?ai:te)\\.?\n                                |\n                                # Studio\n                                [Ss](?ai:tudio)|[Ss][Tt][UuDd]\\.?\n                                |\n                                # Apartment\n                                [Aa](?ai:pt)\\.?|[Aa](?ai:partment)\n                                |\n                                # Room\n                                [Rr](?ai:oom)|[Rr][Mm]\\.?\n                                |\n                                # Flat\n                                [Ff](?ai:lat)\n                                |\n                                \\#\n                            )\n                            (?: [\\ \\t]{1,3} )?\n                            (?:\n                                [A-Za-z\\#\\&\\-\\d]{1,7}\n                            )?\n                        )\n                        (?: [\\ \\t]{1,3} )?\n                    )  # end occupancy\n (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )?\n                )?\n                (?:\n                    \n                    (?P<building_id>\n                        (?:\n                            (?:[Bb](?ai:uilding))\n                            |\n                            (?:[Bb](?ai:ldg))\n                        )\n                        \\ \n                        (?:\n                            (?:\n                                [Aa](?ai:nd)\\ \n                                |\n                                \n                                (?:\n                                    [Tt](?ai:housand)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Hh](?ai:undred)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n                                    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n                                    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n                                    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n                                    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n                                    [Ee](?ai:leven)\\ |\n                                    [Tt](?ai:welve)\\ |\n                                    [Tt](?ai:hirteen)\\ |\n                                    [Ff](?ai:ourteen)\\ |\n                                    [Ff](?ai:ifteen)\\ |\n                                    [Ss](?ai:ixteen)\\ |\n                                    [Ss](?ai:eventeen)\\ |\n                                    [Ee](?ai:ighteen)\\ |\n                                    [Nn](?ai:ineteen)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n                                    [Tt](?ai:hirty)\\ |\n                                    [Ff](?ai:orty)\\ |\n                                    [Ff](?ai:ourty)\\ |\n                                    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n                                    [Ss](?ai:eventy)\\ |\n                                    [Ee](?ai:ighty)\\ |\n                                    [Nn](?ai:inety)\\ \n                                )\n\n                            ){1,5}\n                            |\n                            \\d{0,4}[A-Za-z]?\n                        )\n                        \\ ?\n                    )  # end building_id\n (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )?\n                )?\n                \n                (?:\n                    (?: \n                    (?P<street_number>\n                        (?:\n                            (?:\n                                [Nn](?ai:umber)|\n                                [Nn][RrOo]\\.?|\n                                [Nn](?ai:um)\\.?|\n                                #\n                            )\n                            (?: [\\ \\t]{1,3} )?\n                        )?\n                        (?:\n                            (?:\n                                [Aa](?ai:nd)\\ \n                                |\n                                \n                                (?:\n                                    [Tt](?ai:housand)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Hh](?ai:undred)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n                                    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n                                    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n                                    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n                                    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n                                    [Ee](?ai:leven)\\ |\n                                    [Tt](?ai:welve)\\ |\n                                    [Tt](?ai:hirteen)\\ |\n                                    [Ff](?ai:ourteen)\\ |\n                                    [Ff](?ai:ifteen)\\ |\n                                    [Ss](?ai:ixteen)\\ |\n                                    [Ss](?ai:eventeen)\\ |\n                                    [Ee](?ai:ighteen)\\ |\n                                    [Nn](?ai:ineteen)\\ \n                                )\n\n                                |\n                                \n                                (?:\n                                    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n                                    [Tt](?ai:hirty)\\ |\n                                    [Ff](?ai:orty)\\ |\n                                    [Ff](?ai:ourty)\\ |\n                                    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n                                    [Ss](?ai:eventy)\\ |\n                                    [Ee](?ai:ighty)\\ |\n                                    [Nn](?ai:inety)\\ \n                                )\n\n                            ){1,5}\n                            |\n                            (?:\n                                \\d{1,5} \n                                (?: (?: [\\ \\t]{1,3} )? [A-Za-z] (?![A-Za-z\\d]]) )? \n                                (?!\\d)\n                                (?:(?: [\\ \\t]{1,3} )?\\-(?: [\\ \\t]{1,3} )?\\d{1,5} (?: (?: [\\ \\t]{1,3} )? [A-Za-z] (?![A-Za-z\\d]) )? )?\n                            )\n                        )\n                        (?: [\\ \\t]{1,3} )?\n                    )  # end street_number\n (?: [\\ \\t]{1,3} ) )\n                    |\n                    (?! \\d{} ) \n                    \n                )?\n                (?:\n                    (?P<street_name>\n                        (?(street_number)           # If street_number has been found, then digits can\n                            [a-zA-Z0-9\\ \\.]{3,31}   # be in the street otherwise no digits are allowed.\n                            |                       # This aims to prevent street_name matching everything before the\n                            [a-zA-Z\\ \\.]{3,31}      # address as well as the number.\n                        )\n                    )\n )\n                (?:(?: [\\ \\t]{1,3} ) \n                    (?:\n                        (?P<street_type>\n                            # Street\n                            [Ss](?ai:treet)|S[Tt]\\.?(?![A-Za-z])|\n                            # Boulevard\n                            [Bb](?ai:oulevard)|[Bb](?ai:lvd)\\.?|\n                            # Highway\n                            [Hh](?ai:ighway)|H[Ww][Yy]\\.?|\n                            # Broadway\n                            [Bb](?ai:roadway)|\n                            # Freeway\n                            [Ff](?ai:reeway)|\n                            # Causeway\n                            [Cc](?ai:auseway)|C[Ss][Ww][Yy]\\.?|\n                            # Expressway\n                            [Ee](?ai:xpressway)|\n                            # Way\n                            [Ww](?ai:ay)|\n                            # Walk\n                            [Ww](?ai:alk)|\n                            # Lane\n                            [Ll](?ai:ane)|L[Nn]\\.?|\n                            # Road\n                            [Rr](?ai:oad)|R[Dd]\\.?|\n                            # Avenue\n                            [Aa](?ai:venue)|A[Vv][Ee]\\.?|\n                            # Circle\n                            [Cc](?ai:ircle)|C[Ii][Rr]\\.?|\n                            # Cove\n                            [Cc](?ai:ove)|C[Vv]\\.?|\n                            # Drive\n                            [Dd](?ai:rive)|D[Rr]\\.?|\n                            # Parkway\n                            [Pp](?ai:arkway)|P[Kk][Ww][Yy]\\.?|\n                            # Park\n                            [Pp](?ai:ark)|\n                            # Court\n                            [Cc](?ai:ourt)|C[Tt]\\.?|\n                            # Square\n                            [Ss](?ai:quare)|S[Qq]\\.?|\n                            # Loop\n                            [Ll](?ai:oop)|L[Pp]\\.?|\n                            # Place\n                            [Pp](?ai:lace)|P[Ll]\\.?|\n                            # Parade\n                            [Pp](?ai:arade)|P[Ll]\\.?|\n                            # Estate\n                            [Ee](?ai:state)\n                        )\n                        (?P<route_id>)\n                    )  # end street_type\n (?: [\\ \\t]{1,3} )?)? \n            )\n        )  # end full_street\n \n        (?: (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} ) \n        (?P<city>\n            [A-Za-z]{1}[a-zA-Z0-9\\ \\.\\-']{1,35}\n        )  # end city\n )?\n        (?: (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} ) \n        (?P<region1>\n            [A-Za-z]{1}[a-zA-Z0-9\\ \\.\\-']{1,35}\n        )  # end region1 \n )?\n        (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} )? \n        (?P<postal_code>\n            (?:\n                (?:[Gg](?ai:ir)?0[aA]{2})|\n                (?:\n                    (?:\n                        [Aa](?ai:scn)|\n                        [Ss](?ai:thl)|\n                        [Tt](?ai:dcu)|\n                        [Bb](?ai:bnd)|\n                        [Bb](?ai:iqq)|\n                        [Ff](?ai:iqq)|\n                        [Pp](?ai:crn)|\n                        [Ss](?ai:iqq)|\n                        [iT][Kk](?ai:ca)\n                    )\n                    \\ {0,}1[zZ]{2}\n                )|\n                (?:\n                    (?:\n                        (?:[a-pr-uwyzA-PR-UWYZ][a-hk-yxA-HK-XY]?[0-9][0-9]?)|\n                        (?:\n                            (?:[a-pr-uwyzA-PR-UWYZ][0-9][a-hjkstuwA-HJKSTUW])|\n                            (?:[a-pr-uwyzA-PR-UWYZ][a-hk-yA-HK-Y][0-9][abehmnprv-yABEHMNPRV-Y])\n                        )\n                    )\n                    \\ {0,}[0-9][abd-hjlnp-uw-zABD-HJLNP-UW-Z]{2}\n                )\n            )\n        )  # end postal_code\n \n        (?: (?: [\\,\\ \\.\\-]{0,3}\\,[\\,\\ \\.\\-]{0,3} ) \n        (?P<country>\n            (?:[Tt](?ai:he)\\ *)?[Uu](?ai:nited)\\ *[Kk](?ai:ingdom)\\ *[Oo][Ff]\\ *(?:[Gg](?ai:reat)\\ *)?[Bb](?ai:ritain)(?:\\ *[Aa](?ai:nd)\\ *[Nn](?ai:orthern)\\ *[Ii](?ai:reland))?|\n            (?:[Gg](?ai:reat)\\ *)?[Bb](?ai:ritain)(?:\\ *[Aa](?ai:nd)\\ *[Nn](?ai:orthern)\\ *[Ii](?ai:reland))?|\n            (?:[Tt](?ai:he)\\ *)?[Uu](?ai:nited)\\ *[Kk](?ai:ingdom)|\n            (?:[Nn](?ai:orthern)\\ *)?[Ii](?ai:reland)|\n            [Ee](?ai:ngland)|\n            [Ss](?ai:cotland)|\n            [Ww](?ai:ales)|\n            [Cc](?ai:ymru)|\n            [Gg][Bb]|\n            [Uu][Kk]|  \n            [Nn]\\.?\\ *[Ii]\\.?\n        )  # end country\n )?\n    )  # end full_address\n"
+
+address_anchor = '\n        (?P<postal_code>\n            (?:\n                (?:[Gg](?ai:ir)?0[aA]{2})|\n                (?:\n                    (?:\n                        [Aa](?ai:scn)|\n                        [Ss](?ai:thl)|\n                        [Tt](?ai:dcu)|\n                        [Bb](?ai:bnd)|\n                        [Bb](?ai:iqq)|\n                        [Ff](?ai:iqq)|\n                        [Pp](?ai:crn)|\n                        [Ss](?ai:iqq)|\n                        [iT][Kk](?ai:ca)\n                    )\n                    \\ {0,}1[zZ]{2}\n                )|\n                (?:\n                    (?:\n                        (?:[a-pr-uwyzA-PR-UWYZ][a-hk-yxA-HK-XY]?[0-9][0-9]?)|\n                        (?:\n                            (?:[a-pr-uwyzA-PR-UWYZ][0-9][a-hjkstuwA-HJKSTUW])|\n                            (?:[a-pr-uwyzA-PR-UWYZ][a-hk-yA-HK-Y][0-9][abehmnprv-yABEHMNPRV-Y])\n                        )\n                    )\n                    \\ {0,}[0-9][abd-hjlnp-uw-zABD-HJLNP-UW-Z]{2}\n                )\n            )\n        )  # end postal_code\n'
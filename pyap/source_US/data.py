@@ -14,52 +14,53 @@
     :license: MIT, see LICENSE for more details.
 """
 
-import string
+from .. import utils
 
 
 '''Numerals from one to nine
-Note: here and below we use syntax like '[Oo][Nn][Ee]'
-instead of '(one)(?i)' to match 'One' or 'oNe' because
-Python Regexps don't seem to support turning On/Off
-case modes for subcapturing groups.
+Note: here and below we use syntax like '[Oo](?ai:ne)' to match
+'One' or 'oNe'. Scoped '(?ai:...)' groups keep the patterns short,
+while the first letter stays a character class, which re checks
+before trying an alternative. The 'a' flag folds ASCII letters only,
+as the classes do: 'ſ' or the Kelvin sign are no 's' or 'k'.
 '''
 zero_to_nine = r"""(?:
-    [Zz][Ee][Rr][Oo]\ |[Oo][Nn][Ee]\ |[Tt][Ww][Oo]\ |
-    [Tt][Hh][Rr][Ee][Ee]\ |[Ff][Oo][Uu][Rr]\ |
-    [Ff][Ii][Vv][Ee]\ |[Ss][Ii][Xx]\ |
-    [Ss][Ee][Vv][Ee][Nn]\ |[Ee][Ii][Gg][Hh][Tt]\ |
-    [Nn][Ii][Nn][Ee]\ |[Tt][Ee][Nn]\ |
-    [Ee][Ll][Ee][Vv][Ee][Nn]\ |
-    [Tt][Ww][Ee][Ll][Vv][Ee]\ |
-    [Tt][Hh][Ii][Rr][Tt][Ee][Ee][Nn]\ |
-    [Ff][Oo][Uu][Rr][Tt][Ee][Ee][Nn]\ |
-    [Ff][Ii][Ff][Tt][Ee][Ee][Nn]\ |
-    [Ss][Ii][Xx][Tt][Ee][Ee][Nn]\ |
-    [Ss][Ee][Vv][Ee][Nn][Tt][Ee][Ee][Nn]\ |
-    [Ee][Ii][Gg][Hh][Tt][Ee][Ee][Nn]\ |
-    [Nn][Ii][Nn][Ee][Tt][Ee][Ee][Nn]\ 
+    [Zz](?ai:ero)\ |[Oo](?ai:ne)\ |[Tt](?ai:wo)\ |
+    [Tt](?ai:hree)\ |[Ff](?ai:our)\ |
+    [Ff](?ai:ive)\ |[Ss](?ai:ix)\ |
+    [Ss](?ai:even)\ |[Ee](?ai:ight)\ |
+    [Nn](?ai:ine)\ |[Tt](?ai:en)\ |
+    [Ee](?ai:leven)\ |
+    [Tt](?ai:welve)\ |
+    [Tt](?ai:hirteen)\ |
+    [Ff](?ai:ourteen)\ |
+    [Ff](?ai:ifteen)\ |
+    [Ss](?ai:ixteen)\ |
+    [Ss](?ai:eventeen)\ |
+    [Ee](?ai:ighteen)\ |
+    [Nn](?ai:ineteen)\ 
     )"""
 
 # Numerals - 10, 20, 30 ... 90
 ten_to_ninety = r"""(?:
-    [Tt][Ee][Nn]\ |[Tt][Ww][Ee][Nn][Tt][Yy]\ |
-    [Tt][Hh][Ii][Rr][Tt][Yy]\ |
-    [Ff][Oo][Rr][Tt][Yy]\ |
-    [Ff][Oo][Uu][Rr][Tt][Yy]\ |
-    [Ff][Ii][Ff][Tt][Yy]\ |[Ss][Ii][Xx][Tt][Yy]\ |
-    [Ss][Ee][Vv][Ee][Nn][Tt][Yy]\ |
-    [Ee][Ii][Gg][Hh][Tt][Yy]\ |
-    [Nn][Ii][Nn][Ee][Tt][Yy]\ 
+    [Tt](?ai:en)\ |[Tt](?ai:wenty)\ |
+    [Tt](?ai:hirty)\ |
+    [Ff](?ai:orty)\ |
+    [Ff](?ai:ourty)\ |
+    [Ff](?ai:ifty)\ |[Ss](?ai:ixty)\ |
+    [Ss](?ai:eventy)\ |
+    [Ee](?ai:ighty)\ |
+    [Nn](?ai:inety)\ 
     )"""
 
 # One hundred
 hundred = r"""(?:
-    [Hh][Uu][Nn][Dd][Rr][Ee][Dd]\ 
+    [Hh](?ai:undred)\ 
     )"""
 
 # One thousand
 thousand = r"""(?:
-    [Tt][Hh][Oo][Uu][Ss][Aa][Nn][Dd]\ 
+    [Tt](?ai:housand)\ 
     )"""
 
 '''
@@ -73,7 +74,7 @@ Street number can be written 2 ways:
 '''
 street_number = r"""(?P<street_number>
                         (?:
-                            [Aa][Nn][Dd]\ 
+                            [Aa](?ai:nd)\ 
                             |
                             {thousand}
                             |
@@ -109,10 +110,10 @@ street_name = r"""(?P<street_name>
 post_direction = r"""
                     (?P<post_direction>
                         (?:
-                            [Nn][Oo][Rr][Tt][Hh]\ |
-                            [Ss][Oo][Uu][Tt][Hh]\ |
-                            [Ee][Aa][Ss][Tt]\ |
-                            [Ww][Ee][Ss][Tt]\ 
+                            [Nn](?ai:orth)\ |
+                            [Ss](?ai:outh)\ |
+                            [Ee](?ai:ast)\ |
+                            [Ww](?ai:est)\ 
                         )
                         |
                         (?:
@@ -225,15 +226,10 @@ street_type_list = [
 
 def street_type_list_to_regex(street_type_list):
     """Converts a list of street types into a regex"""
-    street_types = '|'.join(set(street_type_list)).lower()
-    for letter in string.ascii_lowercase:
-        street_types = street_types.replace(letter, '[{upper}{lower}]'.format(upper=letter.upper(), lower=letter))
-
     # Use \b to check that there are word boundaries before and after the street type
     # Optionally match zero to two of " ", ",", or "." after the street name
-    street_types = street_types.replace('|', r'\b{div}|\b')
-    street_types = r'\b' + street_types + r'\b{div}'
-    return street_types.format(
+    return r'\b{street_types}\b{div}'.format(
+        street_types=utils.words_to_regex(street_type_list),
         div=r'[\.\ ,]{0,2}',
     )
 
@@ -246,7 +242,7 @@ street_type = r"""
                 )
                 (?P<route_id>
                     [\(\ \,]{route_symbols}
-                    [Rr][Oo][Uu][Tt][Ee]\ [A-Za-z0-9]+[\)\ \,]{route_symbols}
+                    [Rr](?ai:oute)\ [A-Za-z0-9]{{1,64}}[\)\ \,]{route_symbols}
                 )?
             )
 """.format(
@@ -257,11 +253,11 @@ street_type = r"""
 floor = r"""
             (?P<floor>
                 (?:
-                \d+[A-Za-z]{0,2}\.?\ [Ff][Ll][Oo][Oo][Rr]\ 
+                \d{1,10}[A-Za-z]{0,2}\.?\ [Ff](?ai:loor)\ 
                 )
                 |
                 (?:
-                    [Ff][Ll][Oo][Oo][Rr]\ \d+[A-Za-z]{0,2}\ 
+                    [Ff](?ai:loor)\ \d{1,10}[A-Za-z]{0,2}\ 
                 )
             )
         """
@@ -269,14 +265,14 @@ floor = r"""
 building = r"""
             (?P<building_id>
                 (?:
-                    (?:[Bb][Uu][Ii][Ll][Dd][Ii][Nn][Gg])
+                    (?:[Bb](?ai:uilding))
                     |
-                    (?:[Bb][Ll][Dd][Gg])
+                    (?:[Bb](?ai:ldg))
                 )
                 \ 
                 (?:
                     (?:
-                        [Aa][Nn][Dd]\ 
+                        [Aa](?ai:nd)\ 
                         |
                         {thousand}
                         |
@@ -303,13 +299,13 @@ occupancy = r"""
                     (?:
                         (?:
                             # Suite
-                            [Ss][Uu][Ii][Tt][Ee]\ |[Ss][Tt][Ee]\.?\ 
+                            [Ss](?ai:uite)\ |[Ss](?ai:te)\.?\ 
                             |
                             # Apartment
-                            [Aa][Pp][Tt]\.?\ |[Aa][Pp][Aa][Rr][Tt][Mm][Ee][Nn][Tt]\ 
+                            [Aa](?ai:pt)\.?\ |[Aa](?ai:partment)\ 
                             |
                             # Room
-                            [Rr][Oo][Oo][Mm]\ |[Rr][Mm]\.?\ 
+                            [Rr](?ai:oom)\ |[Rr][Mm]\.?\ 
                         )
                         (?:
                             [A-Za-z\#\&\-\d]{1,7}
@@ -325,7 +321,7 @@ occupancy = r"""
 
 po_box = r"""
             (?:
-                [Pp]\.?\ ?[Oo]\.?\ [Bb][Oo][Xx]\ \d+
+                [Pp]\.?\ ?[Oo]\.?\ [Bb](?ai:ox)\ \d{1,10}
             )
         """
 
@@ -351,82 +347,46 @@ full_street = r"""
                 po_box=po_box,
                 )
 
+# states abbreviations
+state_abbreviations = [
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL', 'GA', 'HI',
+    'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN',
+    'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH',
+    'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA',
+    'WV', 'WI', 'WY',
+    # unincorporated & commonwealth territories
+    'AS', 'GU', 'MP', 'PR', 'VI',
+]
+
+# states full
+state_names = [
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado',
+    'Connecticut', 'Delaware', 'District of Columbia', 'Florida', 'Georgia',
+    'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky',
+    'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan',
+    'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada',
+    'New Hampshire', 'New Jersey', 'New Mexico', 'New York',
+    'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon',
+    'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota',
+    'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington',
+    'West Virginia', 'Wisconsin', 'Wyoming',
+    # unincorporated & commonwealth territories
+    'American Samoa', 'Guam', 'Northern Mariana Islands', 'Puerto Rico',
+    'Virgin Islands',
+]
+
 # region1 is actually a "state"
 region1 = r"""
         (?P<region1>
-            (?:
-                # states abbreviations
-                AL|AK|AZ|AR|CA|CO|CT|DE|DC|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|
-                MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|
-                VA|WA|WV|WI|WY|
-                # unincorporated & commonwealth territories
-                AS|GU|MP|PR|VI
-            )
+            {state_abbreviations}
             |
-            (?:
-                # states full
-                [Aa][Ll][Aa][Bb][Aa][Mm][Aa]|
-                [Aa][Ll][Aa][Ss][Kk][Aa]|
-                [Aa][Rr][Ii][Zz][Oo][Nn][Aa]|
-                [Aa][Rr][Kk][Aa][Nn][Ss][Aa][Ss]|
-                [Cc][Aa][Ll][Ii][Ff][Oo][Rr][Nn][Ii][Aa]|
-                [Cc][Oo][Ll][Oo][Rr][Aa][Dd][Oo]|
-                [Cc][Oo][Nn][Nn][Ee][Cc][Tt][Ii][Cc][Uu][Tt]|
-                [Dd][Ee][Ll][Aa][Ww][Aa][Rr][Ee]|
-                [Dd][Ii][Ss][Tt][Rr][Ii][Cc][Tt]\ [Oo][Ff]\ 
-                [Cc][Oo][Ll][Uu][Mm][Bb][Ii][Aa]|
-                [Ff][Ll][Oo][Rr][Ii][Dd][Aa]|
-                [Gg][Ee][Oo][Rr][Gg][Ii][Aa]|
-                [Hh][Aa][Ww][Aa][Ii][Ii]|
-                [Ii][Dd][Aa][Hh][Oo]|
-                [Ii][Ll][Ll][Ii][Nn][Oo][Ii][Ss]|
-                [Ii][Nn][Dd][Ii][Aa][Nn][Aa]|
-                [Ii][Oo][Ww][Aa]|
-                [Kk][Aa][Nn][Ss][Aa][Ss]|
-                [Kk][Ee][Nn][Tt][Uu][Cc][Kk][Yy]|
-                [Ll][Oo][Uu][Ii][Ss][Ii][Aa][Nn][Aa]|
-                [Mm][Aa][Ii][Nn][Ee]|
-                [Mm][Aa][Rr][Yy][Ll][Aa][Nn][Dd]|
-                [Mm][Aa][Ss][Ss][Aa][Cc][Hh][Uu][Ss][Ee][Tt][Tt][Ss]|
-                [Mm][Ii][Cc][Hh][Ii][Gg][Aa][Nn]|
-                [Mm][Ii][Nn][Nn][Ee][Ss][Oo][Tt][Aa]|
-                [Mm][Ii][Ss][Ss][Ii][Ss][Ss][Ii][Pp][Pp][Ii]|
-                [Mm][Ii][Ss][Ss][Oo][Uu][Rr][Ii]|
-                [Mm][Oo][Nn][Tt][Aa][Nn][Aa]|
-                [Nn][Ee][Bb][Rr][Aa][Ss][Kk][Aa]|
-                [Nn][Ee][Vv][Aa][Dd][Aa]|
-                [Nn][Ee][Ww]\ [Hh][Aa][Mm][Pp][Ss][Hh][Ii][Rr][Ee]|
-                [Nn][Ee][Ww]\ [Jj][Ee][Rr][Ss][Ee][Yy]|
-                [Nn][Ee][Ww]\ [Mm][Ee][Xx][Ii][Cc][Oo]|
-                [Nn][Ee][Ww]\ [Yy][Oo][Rr][Kk]|
-                [Nn][Oo][Rr][Tt][Hh]\ [Cc][Aa][Rr][Oo][Ll][Ii][Nn][Aa]|
-                [Nn][Oo][Rr][Tt][Hh]\ [Dd][Aa][Kk][Oo][Tt][Aa]|
-                [Oo][Hh][Ii][Oo]|
-                [Oo][Kk][Ll][Aa][Hh][Oo][Mm][Aa]|
-                [Oo][Rr][Ee][Gg][Oo][Nn]|
-                [Pp][Ee][Nn][Nn][Ss][Yy][Ll][Vv][Aa][Nn][Ii][Aa]|
-                [Rr][Hh][Oo][Dd][Ee]\ [Ii][Ss][Ll][Aa][Nn][Dd]|
-                [Ss][Oo][Uu][Tt][Hh]\ [Cc][Aa][Rr][Oo][Ll][Ii][Nn][Aa]|
-                [Ss][Oo][Uu][Tt][Hh]\ [Dd][Aa][Kk][Oo][Tt][Aa]|
-                [Tt][Ee][Nn][Nn][Ee][Ss][Ss][Ee][Ee]|
-                [Tt][Ee][Xx][Aa][Ss]|
-                [Uu][Tt][Aa][Hh]|
-                [Vv][Ee][Rr][Mm][Oo][Nn][Tt]|
-                [Vv][Ii][Rr][Gg][Ii][Nn][Ii][Aa]|
-                [Ww][Aa][Ss][Hh][Ii][Nn][Gg][Tt][Oo][Nn]|
-                [Ww][Ee][Ss][Tt]\ [Vv][Ii][Rr][Gg][Ii][Nn][Ii][Aa]|
-                [Ww][Ii][Ss][Cc][Oo][Nn][Ss][Ii][Nn]|
-                [Ww][Yy][Oo][Mm][Ii][Nn][Gg]|
-                # unincorporated & commonwealth territories
-                [Aa][Mm][Ee][Rr][Ii][Cc][Aa][Nn]\ [Ss][Aa][Mm][Oo][Aa]
-                |[Gg][Uu][Aa][Mm]|
-                [Nn][Oo][Rr][Tt][Hh][Ee][Rr][Nn]\ [Mm][Aa][Rr][Ii][Aa][Nn][Aa]\ 
-                [Ii][Ss][Ll][Aa][Nn][Dd][Ss]|
-                [Pp][Uu][Ee][Rr][Tt][Oo]\ [Rr][Ii][Cc][Oo]|
-                [Vv][Ii][Rr][Gg][Ii][Nn]\ [Ii][Ss][Ll][Aa][Nn][Dd][Ss]
-            )
+            {state_names}
         )
-        """
+        """.format(
+    state_abbreviations=utils.words_to_regex(state_abbreviations,
+                                             ignore_case=False),
+    state_names=utils.words_to_regex(state_names),
+)
 
 # TODO: doesn't catch cities containing French characters
 city = r"""
@@ -444,7 +404,7 @@ postal_code = r"""
 country = r"""
             (?:
                 [Uu]\.?[Ss]\.?[Aa]\.?|
-                [Uu][Nn][Ii][Tt][Ee][Dd]\ [Ss][Tt][Aa][Tt][Ee][Ss](?:\ [Oo][Ff]\ [Aa][Mm][Ee][Rr][Ii][Cc][Aa])?
+                [Uu](?ai:nited\ states)(?:\ [Oo](?ai:f\ america))?
             )
             """
 
@@ -465,3 +425,16 @@ full_address = r"""
     country=country,
     postal_code=postal_code,
 )
+
+# every address contains a region, so matching is only tried near one
+address_anchor = region1
+
+# every address starts with a street number: digits or one of these words
+# followed by a space, so matching is only tried where one of them starts
+address_start_words = (
+    'and', 'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven',
+    'eight', 'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen',
+    'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty',
+    'thirty', 'forty', 'fourty', 'fifty', 'sixty', 'seventy', 'eighty',
+    'ninety', 'hundred', 'thousand',
+)
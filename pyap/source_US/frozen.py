@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# Generated by 'python -m pyap.freeze US' from
+# pyap/source_US/data.py. Do not edit.
+
+fingerprint = '8bcca79e'
+
+full_address = "\n                (?P<full_address>\n                    \n    (?:\n        (?P<full_street>\n            (?P<street_number>\n                        (?:\n                            [Aa](?ai:nd)\\ \n                            |\n                            (?:\n    [Tt](?ai:housand)\\ \n    )\n                            |\n                            (?:\n    [Hh](?ai:undred)\\ \n    )\n                            |\n                            (?:\n    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n    [Ee](?ai:leven)\\ |\n    [Tt](?ai:welve)\\ |\n    [Tt](?ai:hirteen)\\ |\n    [Ff](?ai:ourteen)\\ |\n    [Ff](?ai:ifteen)\\ |\n    [Ss](?ai:ixteen)\\ |\n    [Ss](?ai:eventeen)\\ |\n    [Ee](?ai:ighteen)\\ |\n    [Nn](?ai:ineteen)\\ \n    )\n                            |\n                            (?:\n    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n    [Tt](?ai:hirty)\\ |\n    [Ff](?ai:orty)\\ |\n    [Ff](?ai:ourty)\\ |\n    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n    [Ss](?ai:eventy)\\ |\n    [Ee](?ai:ighty)\\ |\n    [Nn](?ai:inety)\\ \n    )\n                        ){1,5}\n                        |\n                        (?:\\d{1,5}\n                            (?:\\ ?\\-?\\ ?\\d{1,5})?\\ \n                        )\n                    )\n                \n            (?P<street_name>\n                  [a-zA-Z0-9\\ \\.]{3,31}  # Seems like the longest US street is\n                                         # 'Northeast Kentucky Industrial Parkway'\n                                         # https://atkinsbookshelf.wordpress.com/tag/longest-street-name-in-us/\n                 )\n              ?\\,?\\ ?\n            (?:[\\ \\,]\n            (?:\n                (?P<street_type>\n                    \\b(?:[Aa](?:[Ll](?:[Ll](?:[Ee][EYey]|[Yy])|[Yy])|[Nn](?:[Ee][Xx]|[Nn](?:[Ee][Xx]|[Xx])|[Xx])|[Rr][Cc](?:[Aa](?ai:de))?|[Vv](?:[Ee](?:[Nn](?:[Uu][Ee]?)?)?|[Nn](?:[Uu][Ee])?)?)|[Bb](?:[Aa](?ai:yo)[OUou]|[Cc][Hh]|[Ee](?:[Aa](?ai:ch)|[Nn][Dd])|[Gg][Ss]?|[Ll](?:[Ff][Ss]?|[Uu][Ff](?:[Ff][Ss]?)?|[Vv][Dd])|[Nn][Dd]|[Oo](?:[Tt](?:[Tt](?:[Oo][Mm]|[Mm]))?|[Uu][Ll](?:[Ee](?ai:vard)|[Vv])?)|[Rr](?:[Aa](?ai:nch)|[Dd](?ai:ge)|[Ii](?ai:dge)|[Kk][Ss]?|[Nn](?ai:ch)|[Oo](?:[Aa](?ai:dway)|[Oo][Kk][Ss]?)|[Gg])?|[Tt][Mm]|[Uu](?ai:rg)[Ss]?|[Yy](?:[Pp](?:[Aa](?:[Ss][Ss]?)?|[Ss])?|[Uu]))|[Cc](?:[Aa](?:[Mm][Pp]|[Nn][Yy](?:[Oo][Nn]|[Nn])|[Pp][Ee]|[Uu][Ss](?:[Ee](?ai:way)|[Ww][Aa]))|[Ee][Nn](?:[Tt](?:[Ee][Rr][Ss]?|[Rr][Ee]?)?)?|[Ii][Rr](?:[Cc](?:[Ll](?:[Ee][Ss]?)?)?|[Ss])?|[Ll](?:[Ff][Ss]?|[Ii](?ai:ff)[Ss]?|[Uu][Bb]|[Bb])|[Mm](?:[Nn][Ss]?|[Pp])|[Nn](?:[Tt](?:[Ee][Rr]|[Rr])|[Yy][Nn])|[Oo](?:[Mm](?ai:mon)[Ss]?|[Rr](?:[Nn](?ai:er)[Ss]?|[Ss])?|[Uu][Rr](?:[Ss][Ee]|[Tt][Ss]?)|[Vv][Ee][Ss]?)|[Pp][Ee]?|[Rr](?:[Cc][Ll][Ee]?|[Ee](?:[Ee][Kk]|[Ss](?:[Cc](?ai:ent)|[Tt])?)|[Oo](?ai:ss)(?:[Ii](?ai:ng)|[Rr](?ai:oad)[Ss]?)|[Ss](?:[Ee](?:[Nn][Tt])?|[Nn][Tt]|[Ss](?ai:ng)|[Tt])|[Kk])|[Ss](?ai:wy)|[Tt](?:[Rr][Ss]?|[Ss])?|[Uu](?ai:rv)[Ee]?|[Vv][Ss]?|[Yy][Nn])|[Dd](?:[Aa](?:[Ll][Ee]|[Mm])|[Ii][Vv](?:[Ii](?ai:de))?|[Rr](?:[Ii][Vv](?:[Ee][Ss]?)?|[SVsv])?|[Vv][Dd]?|[LMlm])|[Ee](?:[Ss][Tt](?:[Aa](?ai:te)[Ss]?|[Ss])?|[Xx](?:[Pp](?:[Rr](?:[Ee](?ai:ss)(?:[Ww](?ai:ay))?)?|[WYwy])?|[Tt](?:[Ee](?ai:nsion)[Ss]?|[Nn](?:[Ss][Nn])?|[Ss])?))|[Ff](?:[Aa](?ai:ll)[Ss]?|[Ee](?ai:rry)|[Ii](?ai:eld)[Ss]?|[Ll](?:[Aa][Tt][Ss]?|[Dd][Ss]?|[Tt][Ss]?|[Ss])|[Oo][Rr](?:[Dd][Ss]?|[Ee](?ai:st)[Ss]?|[Gg](?:[Ee][Ss]?)?|[Kk][Ss]?|[Tt])|[Rr](?:[Dd][Ss]?|[Ee](?ai:ew)(?:[Aa][Yy]|[Yy])|[Gg][Ss]?|[Kk][Ss]?|[Rr][Yy]|[Ss][Tt]|[Ww](?:[Aa][Yy]|[Yy])|[TYty])|[Ww][Yy]|[Tt])|[Gg](?:[Aa](?:[Rr][Dd](?:[Ee][Nn][Ss]?|[Nn])|[Tt](?:[Ee][Ww](?:[Aa][Yy]|[Yy])|[Ww](?ai:ay)))|[Dd][Nn][Ss]?|[Ll](?:[Ee][Nn][Ss]?|[Nn][Ss]?)|[Rr](?:[Dd](?:[Ee][Nn]|[Nn][Ss]?)|[Ee](?ai:en)[Ss]?|[Nn][Ss]?|[Oo][Vv](?:[Ee][Ss]?)?|[Vv][Ss]?)|[Tt][Ww](?:[Aa][Yy]|[Yy]))|[Hh](?:[Aa](?:[Rr][Bb](?:[Oo][Rr][Ss]?|[Rr])?|[Vv](?ai:en))|[Bb][Rr][Ss]?|[Ee](?ai:ights)|[Ii](?:[Gg](?ai:hw)(?:[Aa][Yy]|[Yy])|[Ll][Ll][Ss]?|[Ww](?:[Aa][Yy]|[Yy]))|[Ll](?:[Ll][Ww]|[Ss])?|[Oo][Ll](?:[Ll](?ai:ow)[Ss]?|[Ww][Ss]?)|[Rr](?ai:bor)|[Tt][Ss]?|[Vv][Nn]|[Ww](?:[Aa][Yy]|[Yy]))|[Ii](?:[Nn][Ll](?:[Ee][Tt]|[Tt])|[Ss](?:[Ll](?:[Aa](?ai:nd)[Ss]?|[Ee][Ss]?|[Nn][Dd][Ss]?)|[Ss])?)|[Jj](?:[Cc][Tt](?:[Ii](?ai:on)|[Nn][Ss]?|[Ss])?|[Uu](?ai:nct)(?:[Ii](?ai:on)[Ss]?|[Oo][Nn]|[Nn]))|[Kk](?:[Ee][Yy][Ss]?|[Nn](?:[Ll][Ss]?|[Oo][Ll](?:[Ll][Ss]?)?)|[Yy][Ss]?)|[Ll](?:[Aa](?:[Kk][Ee][Ss]?|[Nn](?:[Dd](?:[Ii](?ai:ng))?|[Ee]))|[Cc][Kk][Ss]?|[Dd][Gg][Ee]?|[Gg][Tt][Ss]?|[Ii](?ai:ght)[Ss]?|[Kk][Ss]?|[Nn](?:[Dd](?:[Nn][Gg]|[Gg]))?|[Oo](?:[Aa][Ff]|[Cc][Kk][Ss]?|[Dd][Gg][Ee]?|[Oo][Pp][Ss]?)|[FPfp])|[Mm](?:[Aa](?:[Ll][Ll]|[Nn](?ai:or)[Ss]?)|[Dd][Ww][Ss]?|[Ee](?:[Aa](?ai:dow)[Ss]?|[Dd](?ai:ows)|[Ww][Ss])|[Ii](?:[Ll][Ll][Ss]?|[Ss][Ss](?:[Ii](?ai:on)|[Nn]))|[Ll][Ss]?|[Nn](?:[Rr][Ss]?|[Tt](?:[Aa](?ai:in)|[Nn][Ss]?)?)|[Oo](?:[Tt](?ai:orway)|[Uu](?ai:nt)(?:[Aa](?ai:in)[Ss]?|[Ii][Nn])?)|[Ss](?:[Ss][Nn]|[Nn])|[Tt](?:[Ii][Nn]|[Nn][Ss]?|[Ww][Yy])?)|[Nn](?:[Cc][Kk]|[Ee](?ai:ck))|[Oo](?:[Pp](?ai:as)|[Rr](?ai:ch)(?:[Aa](?ai:rd)|[Rr][Dd])?|[Vv](?:[Aa][Ll]|[Ee](?ai:rpass)|[Ll]))|[Pp](?:[Aa](?:[Rr][Kk](?:[Ww](?:[Aa][Yy][Ss]?|[Yy])|[Ss])?|[Ss][Ss](?:[Aa](?ai:ge))?|[Tt][Hh][Ss]?)|[Ii](?:[Kk][Ee][Ss]?|[Nn][Ee][Ss]?)|[Kk](?:[Ww](?:[Aa][Yy]|[Yy][Ss]?)|[Yy])|[Ll](?:[Aa](?:[Cc][Ee]|[Ii][Nn][Ss]?|[Zz][Aa])|[Nn][Ss]?|[Zz][Aa]?)?|[Nn][Ee][Ss]?|[Oo](?:[Ii](?ai:nt)[Ss]?|[Rr][Tt][Ss]?)|[Rr](?:[Aa](?ai:irie)|[Tt][Ss]?|[KRkr])?|[Ss](?ai:ge)|[Tt][Ss]?)|[Rr](?:[Aa](?:[Dd](?:[Ii](?:[Aa][Ll]|[Ee][Ll])|[Ll])?|[Mm][Pp]|[Nn](?ai:ch)(?:[Ee][Ss])?|[Pp](?ai:id)[Ss]?)|[Dd](?:[Gg][ESes]?|[Ss])?|[Ee](?ai:st)|[Ii](?:[Dd](?ai:ge)[Ss]?|[Vv](?:[Ee][Rr]|[Rr])?)|[Nn](?ai:ch)[Ss]?|[Oo](?:[Aa][Dd][Ss]?|[Uu](?ai:te)|[Ww])|[Pp][Dd][Ss]?|[Ss][Tt]|[Tt][Ee]|[Uu][ENen]|[Vv][Rr])|[Ss](?:[Hh](?:[Ll][Ss]?|[Oo](?:[Aa](?:[Ll][Ss]?|[Rr][Ss]?)|[Rr][Ee][Ss]?)|[Rr][Ss]?)|[Kk](?:[Ww][Yy]|[Yy](?ai:way))|[Mm][Tt]|[Pp](?:[Gg][Ss]?|[Nn][Gg][Ss]?|[Rr](?:[Ii](?ai:ng)[Ss]?|[Nn][Gg][Ss]?)|[Uu][Rr][Ss]?)|[Qq](?:[Rr][ESes]?|[Uu](?:[Aa](?ai:re)[Ss]?)?|[Ss])?|[Tt](?:[Aa](?:[Tt](?:[Ii](?ai:on)|[Nn]))?|[Rr](?:[Aa](?:[Vv](?:[Ee][Nn](?:[Uu][Ee])?|[Nn])?)?|[Ee](?:[Aa][Mm]|[Ee][Tt][Ss]?|[Mm][Ee])|[Vv][Nn](?:[Uu][Ee])?|[MTmt])?|[NSns])?|[Uu][Mm](?:[Ii][Tt][Tt]?|[Mm](?ai:it)))|[Tt](?:[Ee][Rr](?:[Rr](?:[Aa](?ai:ce))?)?|[Hh](?ai:roughway)|[Pp](?ai:ke)|[Rr](?:[Aa](?:[Cc](?:[Ee][Ss]?|[Kk][Ss]?)|[Ff](?ai:ficway)|[Ii][Ll](?:[Ee][Rr]|[Ss])?|[Kk])|[Cc][Ee]|[Ff][Yy]|[Kk][Ss]?|[Ll](?:[Rr][Ss]?|[Ss])?|[Nn](?ai:pk)|[Ww][Yy])|[Uu](?:[Nn](?:[Ee][Ll]|[Ll][Ss]?|[Nn](?:[Ee][Ll][Ss]?|[Ll]))|[Rr](?ai:np)(?:[Ii](?ai:ke)|[Kk])))|[Uu](?:[Nn](?:[Dd](?ai:erpass)|[Ii](?ai:on)[Ss]?|[Ss])?|[Pp](?ai:as))|[Vv](?:[Aa](?ai:ll)(?:[Ee][Yy][Ss]?|[Yy])|[Dd](?ai:ct)|[Ii](?:[Aa](?:[Dd](?:[Cc][Tt]|[Uu](?ai:ct)))?|[Ee][Ww][Ss]?|[Ll][Ll](?:[Aa][Gg](?:[Ee][Ss]?)?|[Ii](?ai:age)|[EGeg])?|[Ss](?:[Tt][Aa]?)?)|[Ll](?:[Gg][Ss]?|[Ll][Yy]|[Yy][Ss]?)?|[Ss][Tt][Aa]?|[Ww][Ss]?)|[Ww](?:[Aa](?:[Ll](?:[Kk][Ss]?|[Ll])|[Yy][Ss]?)|[Ee](?ai:ll)[Ss]?|[Ll][Ss]?|[Yy])|[Xx](?:[Ii](?ai:ng)|[Rr][Dd][Ss]?))\\b[\\.\\ ,]{0,2}\n                )\n                (?P<route_id>\n                    [\\(\\ \\,]{0,3}\n                    [Rr](?ai:oute)\\ [A-Za-z0-9]{1,64}[\\)\\ \\,]{0,3}\n                )?\n            )\n)\\,?\\ ?\n            \n                    (?P<post_direction>\n                        (?:\n                            [Nn](?ai:orth)\\ |\n                            [Ss](?ai:outh)\\ |\n                            [Ee](?ai:ast)\\ |\n                            [Ww](?ai:est)\\ \n                        )\n                        |\n                        (?:\n                            NW\\ |NE\\ |SW\\ |SE\\ \n                        )\n                        |\n                        (?:\n                            N\\.?\\ |S\\.?\\ |E\\.?\\ |W\\.?\\ \n                        )\n                    )\n                ?\\,?\\ ?\n            \n            (?P<floor>\n                (?:\n                \\d{1,10}[A-Za-z]{0,2}\\.?\\ [Ff](?ai:loor)\\ \n                )\n                |\n                (?:\n                    [Ff](?ai:loor)\\ \\d{1,10}[A-Za-z]{0,2}\\ \n                )\n            )\n        ?\\,?\\ ?\n            \n            (?P<building_id>\n                (?:\n                    (?:[Bb](?ai:uilding))\n                    |\n                    (?:[Bb](?ai:ldg))\n                )\n                \\ \n                (?:\n                    (?:\n                        [Aa](?ai:nd)\\ \n                        |\n                        (?:\n    [Tt](?ai:housand)\\ \n    )\n                        |\n                        (?:\n    [Hh](?ai:undred)\\ \n    )\n                        |\n                        (?:\n    [Zz](?ai:ero)\\ |[Oo](?ai:ne)\\ |[Tt](?ai:wo)\\ |\n    [Tt](?ai:hree)\\ |[Ff](?ai:our)\\ |\n    [Ff](?ai:ive)\\ |[Ss](?ai:ix)\\ |\n    [Ss](?ai:even)\\ |[Ee](?ai:ight)\\ |\n    [Nn](?ai:ine)\\ |[Tt](?ai:en)\\ |\n    [Ee](?ai:leven)\\ |\n    [Tt](?ai:welve)\\ |\n    [Tt](?ai:hirteen)\\ |\n    [Ff](?ai:ourteen)\\ |\n    [Ff](?ai:ifteen)\\ |\n    [Ss](?ai:ixteen)\\ |\n    [Ss](?ai:eventeen)\\ |\n    [Ee](?ai:ighteen)\\ |\n    [Nn](?ai:ineteen)\\ \n    )\n                        |\n                        (?:\n    [Tt](?ai:en)\\ |[Tt](?ai:wenty)\\ |\n    [Tt](?ai:hirty)\\ |\n    [Ff](?ai:orty)\\ |\n    [Ff](?ai:ourty)\\ |\n    [Ff](?ai:ifty)\\ |[Ss](?ai:ixty)\\ |\n    [Ss](?ai:eventy)\\ |\n    [Ee](?ai:ighty)\\ |\n    [Nn](?ai:inety)\\ \n    )\n                    ){1,5}\n                    |\n                    \\d{0,4}[A-Za-z]?\n                )\n                \\ ?\n            )\n            ?\\,?\\ ?\n            \n            (?P<occupancy>\n                (?:\n                    (?:\n                        (?:\n                            # Suite\n                            [Ss](?ai:uite)\\ |[Ss](?ai:te)\\.?\\ \n                            |\n                            # Apartment\n                            [Aa](?ai:pt)\\.?\\ |[Aa](?ai:partment)\\ \n                            |\n                            # Room\n                            [Rr](?ai:oom)\\ |[Rr][Mm]\\.?\\ \n                        )\n                        (?:\n                            [A-Za-z\\#\\&\\-\\d]{1,7}\n                        )?\n                    )\n                    |\n                    (?:\n                        \\#[0-9]{,3}[A-Za-z]{1}\n                    )\n                )\\ ?\n            )\n            ?\\,?\\ ?\n            \n            (?:\n                [Pp]\\.?\\ ?[Oo]\\.?\\ [Bb](?ai:ox)\\ \\d{1,10}\n            )\n        ?\n        )\n    ) [\\, ]{,2}\n                    \n        (?P<city>\n            [A-Za-z]{1}[a-zA-Z\\ \\-\\'\\.]{2,20}\n        )\n         [\\, ]{,2}\n                    \n        (?P<region1>\n            (?:A[KLRSZ]|C[AOT]|D[CE]|FL|G[AU]|HI|I[ADLN]|K[SY]|LA|M[ADEINOPST]|N[CDEHJMVY]|O[HKR]|P[AR]|RI|S[CD]|T[NX]|UT|V[AIT]|W[AIVY])\n            |\n            (?:[Aa](?:[Ll][Aa](?:[Bb](?ai:ama)|[Ss](?ai:ka))|[Mm](?ai:erican\\ samoa)|[Rr](?:[Ii](?ai:zona)|[Kk](?ai:ansas)))|[Cc](?:[Aa](?ai:lifornia)|[Oo](?:[Ll](?ai:orado)|[Nn](?ai:necticut)))|[Dd](?:[Ee](?ai:laware)|[Ii](?ai:strict\\ of\\ columbia))|[Ff](?ai:lorida)|[Gg](?:[Ee](?ai:orgia)|[Uu](?ai:am))|[Hh](?ai:awaii)|[Ii](?:[Dd](?ai:aho)|[Ll](?ai:linois)|[Nn](?ai:diana)|[Oo](?ai:wa))|[Kk](?:[Aa](?ai:nsas)|[Ee](?ai:ntucky))|[Ll](?ai:ouisiana)|[Mm](?:[Aa](?:[Ii](?ai:ne)|[Rr](?ai:yland)|[Ss](?ai:sachusetts))|[Ii](?:[Cc](?ai:higan)|[Nn](?ai:nesota)|[Ss][Ss](?:[Ii](?ai:ssippi)|[Oo](?ai:uri)))|[Oo](?ai:ntana))|[Nn](?:[Ee](?:[Bb](?ai:raska)|[Vv](?ai:ada)|[Ww]\\ (?:[Hh](?ai:ampshire)|[Jj](?ai:ersey)|[Mm](?ai:exico)|[Yy](?ai:ork)))|[Oo](?ai:rth)(?:\\ (?:[Cc](?ai:arolina)|[Dd](?ai:akota))|[Ee](?ai:rn\\ mariana\\ islands)))|[Oo](?:[Hh](?ai:io)|[Kk](?ai:lahoma)|[Rr](?ai:egon))|[Pp](?:[Ee](?ai:nnsylvania)|[Uu](?ai:erto\\ rico))|[Rr](?ai:hode\\ island)|[Ss](?ai:outh\\ )(?:[Cc](?ai:arolina)|[Dd](?ai:akota))|[Tt][Ee](?:[Nn](?ai:nessee)|[Xx](?ai:as))|[Uu](?ai:tah)|[Vv](?:[Ee](?ai:rmont)|[Ii](?ai:rgin)(?:\\ (?ai:islands)|[Ii][Aa]))|[Ww](?:[Aa](?ai:shington)|[Ee](?ai:st\\ virginia)|[Ii](?ai:sconsin)|[Yy](?ai:oming)))\n        )\n         [\\, ]{,2}\n                    (?:\n                        (?:\n            (?P<postal_code>\n                (?:\\d{5}(?:\\-\\d{4})?)\n            )\n            ?(\\ ?,?\n            (?:\n                [Uu]\\.?[Ss]\\.?[Aa]\\.?|\n                [Uu](?ai:nited\\ states)(?:\\ [Oo](?ai:f\\ america))?\n            )\n            )?)\n                    )\n                )\n                "
+
+address_anchor = '\n        (?P<region1>\n            (?:A[KLRSZ]|C[AOT]|D[CE]|FL|G[AU]|HI|I[ADLN]|K[SY]|LA|M[ADEINOPST]|N[CDEHJMVY]|O[HKR]|P[AR]|RI|S[CD]|T[NX]|UT|V[AIT]|W[AIVY])\n            |\n            (?:[Aa](?:[Ll][Aa](?:[Bb](?ai:ama)|[Ss](?ai:ka))|[Mm](?ai:erican\\ samoa)|[Rr](?:[Ii](?ai:zona)|[Kk](?ai:ansas)))|[Cc](?:[Aa](?ai:lifornia)|[Oo](?:[Ll](?ai:orado)|[Nn](?ai:necticut)))|[Dd](?:[Ee](?ai:laware)|[Ii](?ai:strict\\ of\\ columbia))|[Ff](?ai:lorida)|[Gg](?:[Ee](?ai:orgia)|[Uu](?ai:am))|[Hh](?ai:awaii)|[Ii](?:[Dd](?ai:aho)|[Ll](?ai:linois)|[Nn](?ai:diana)|[Oo](?ai:wa))|[Kk](?:[Aa](?ai:nsas)|[Ee](?ai:ntucky))|[Ll](?ai:ouisiana)|[Mm](?:[Aa](?:[Ii](?ai:ne)|[Rr](?ai:yland)|[Ss](?ai:sachusetts))|[Ii](?:[Cc](?ai:higan)|[Nn](?ai:nesota)|[Ss][Ss](?:[Ii](?ai:ssippi)|[Oo](?ai:uri)))|[Oo](?ai:ntana))|[Nn](?:[Ee](?:[Bb](?ai:raska)|[Vv](?ai:ada)|[Ww]\\ (?:[Hh](?ai:ampshire)|[Jj](?ai:ersey)|[Mm](?ai:exico)|[Yy](?ai:ork)))|[Oo](?ai:rth)(?:\\ (?:[Cc](?ai:arolina)|[Dd](?ai:akota))|[Ee](?ai:rn\\ mariana\\ islands)))|[Oo](?:[Hh](?ai:io)|[Kk](?ai:lahoma)|[Rr](?ai:egon))|[Pp](?:[Ee](?ai:nnsylvania)|[Uu](?ai:erto\\ rico))|[Rr](?ai:hode\\ island)|[Ss](?ai:outh\\ )(?:[Cc](?ai:arolina)|[Dd](?ai:akota))|[Tt][Ee](?:[Nn](?ai:nessee)|[Xx](?ai:as))|[Uu](?ai:tah)|[Vv](?:[Ee](?ai:rmont)|[Ii](?ai:rgin)(?:\\ (?ai:islands)|[Ii][Aa]))|[Ww](?:[Aa](?ai:shington)|[Ee](?ai:st\\ virginia)|[Ii](?ai:sconsin)|[Yy](?ai:oming)))\n        )\n        '
+
+address_start_words = ('and', 'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen', 'twenty', 'thirty', 'forty', 'fourty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety', 'hundred', 'thousand')
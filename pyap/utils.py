@@ -11,6 +11,7 @@
 """
 
 import re
+import unicodedata
 from .packages import six
 
 DEFAULT_FLAGS = re.VERBOSE | re.UNICODE
@@ -47,24 +48,361 @@ if six.PY2:
             flags=flags
         ))
 
+    def iterfind(regex, string, flags=DEFAULT_FLAGS):
+        '''Utility function for lazy re.finditer '''
+        if isinstance(string, str):
+            string = unicode(string, 'utf-8')
+        return re.finditer(
+            unicode(regex, 'utf-8'),
+            string,
+            flags=flags
+        )
+
     def unicode_str(string):
         '''Return Unicode string'''
         return unicode(string, 'utf-8')
 
 elif six.PY3:
 
+    def compile(regex, flags=DEFAULT_FLAGS):
+        '''Returns compiled regex; already compiled patterns
+        are returned as is (their own flags are kept)
+        '''
+        if isinstance(regex, re.Pattern):
+            return regex
+        return re.compile(regex, flags)
+
     def match(regex, string, flags=DEFAULT_FLAGS):
         '''Utility function for re.match '''
-        return re.match(regex, string, flags=flags)
+        return compile(regex, flags).match(string)
 
     def findall(regex, string, flags=DEFAULT_FLAGS):
         '''Utility function for re.findall '''
-        return re.findall(regex, string, flags=flags)
+        return compile(regex, flags).findall(string)
 
     def finditer(regex, string, flags=DEFAULT_FLAGS):
         '''Utility function for re.finditer '''
-        return list(re.finditer(regex, string, flags=flags))
+        return list(compile(regex, flags).finditer(string))
+
+    def iterfind(regex, string, flags=DEFAULT_FLAGS):
+        '''Utility function for lazy re.finditer '''
+        return compile(regex, flags).finditer(string)
 
     def unicode_str(string):
         '''Return Unicode string'''
         return string
+
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# longest run of whitespace and commas in normalized text, which
+# replaces every such run by ', ' or ' ' (see parser.NORMALIZE)
+NORMALIZED_RUN = 2
+
+
+def max_width(regex, flags=DEFAULT_FLAGS):
+    '''Returns the longest span of normalized text a match of regex can
+    inspect, counting lookaheads as consumed text, or None when there is
+    no such bound. Unbounded repeats of whitespace and commas are
+    bounded by NORMALIZED_RUN, any other unbounded repeat is not.
+    '''
+    if not isinstance(regex, sre_parse.SubPattern):
+        if hasattr(regex, 'pattern'):
+            regex, flags = regex.pattern, regex.flags
+        regex = sre_parse.parse(regex, flags)
+    return _width(regex)
+
+
+def _width(subpattern):
+    c = sre_constants
+    width = 0
+    for op, av in subpattern:
+        if op in (c.LITERAL, c.NOT_LITERAL, c.ANY, c.IN):
+            item = 1
+        elif op is c.SUBPATTERN:
+            item = _width(av[-1])
+        elif op is c.BRANCH:
+            item = 0
+            for branch in av[1]:
+                branch = _width(branch)
+                if branch is None:
+                    return None
+                item = max(item, branch)
+        elif op in (c.MAX_REPEAT, c.MIN_REPEAT) or \
+                op is getattr(c, 'POSSESSIVE_REPEAT', None):
+            low, high, repeated = av
+            if high == c.MAXREPEAT:
+                if not _spaces_only(repeated):
+                    return None
+                item = NORMALIZED_RUN
+            else:
+                item = _width(repeated)
+                item = None if item is None else high * item
+        elif op in (c.ASSERT, c.ASSERT_NOT):
+            direction, item = av
+            item = _width(item) if direction > 0 else 0
+        elif op is c.GROUPREF_EXISTS:
+            group, yes, no = av
+            item = _width(yes)
+            other = _width(no) if no else 0
+            item = None if None in (item, other) else max(item, other)
+        elif op is getattr(c, 'ATOMIC_GROUP', None):
+            item = _width(av)
+        elif op is c.GROUPREF:
+            return None
+        else:
+            item = 0
+        if item is None:
+            return None
+        width += item
+    return width
+
+
+def _spaces_only(subpattern):
+    '''Returns True when subpattern only matches whitespace and commas'''
+    c = sre_constants
+
+    def space(code):
+        return chr(code).isspace() or chr(code) == ','
+
+    for op, av in subpattern:
+        if op is c.LITERAL:
+            if not space(av):
+                return False
+        elif op is c.IN:
+            for kind, value in av:
+                if kind is c.LITERAL and space(value):
+                    continue
+                if kind is c.CATEGORY and value in (
+                        c.CATEGORY_SPACE, c.CATEGORY_UNI_SPACE):
+                    continue
+                return False
+        elif op is c.SUBPATTERN:
+            if not _spaces_only(av[-1]):
+                return False
+        elif op is c.BRANCH:
+            if not all(_spaces_only(branch) for branch in av[1]):
+                return False
+        elif op in (c.MAX_REPEAT, c.MIN_REPEAT) or \
+                op is getattr(c, 'POSSESSIVE_REPEAT', None):
+            if not _spaces_only(av[2]):
+                return False
+        elif op is not c.AT:
+            return False
+    return True
+
+
+def referenced_groups(regex, flags=DEFAULT_FLAGS):
+    '''Returns names of groups used by conditionals like '(?(name)...)'
+    or backreferences like '(?P=name)' in regex
+    '''
+    parsed = sre_parse.parse(regex, flags)
+    state = getattr(parsed, 'state', None) or parsed.pattern
+    names = dict((index, name) for name, index in state.groupdict.items())
+    found = set()
+
+    def walk(subpattern):
+        for op, av in subpattern:
+            if op is sre_constants.GROUPREF_EXISTS:
+                found.add(av[0])
+            elif op is sre_constants.GROUPREF:
+                found.add(av)
+            items = av if isinstance(av, (tuple, list)) else (av,)
+            for item in items:
+                if isinstance(item, list):
+                    walk_all(item)
+                elif isinstance(item, sre_parse.SubPattern):
+                    walk(item)
+
+    def walk_all(items):
+        for item in items:
+            if isinstance(item, sre_parse.SubPattern):
+                walk(item)
+
+    walk(parsed)
+    return set(names[index] for index in found if index in names)
+
+
+def strip_groups(regex, flags=DEFAULT_FLAGS):
+    '''Turns capturing groups of regex into non-capturing ones, except
+    groups referenced by conditionals or backreferences. The resulting
+    regex matches exactly the same text but doesn't record groups.
+    '''
+    keep = referenced_groups(regex, flags)
+    verbose = flags & re.VERBOSE
+    out = []
+    i = 0
+    n = len(regex)
+    while i < n:
+        char = regex[i]
+        if char == '\\':
+            out.append(regex[i:i + 2])
+            i += 2
+        elif char == '[':
+            # character class: copy until its closing bracket
+            end = i + 1
+            if regex.startswith('^', end):
+                end += 1
+            if regex.startswith(']', end):
+                end += 1
+            while end < n and regex[end] != ']':
+                end += 2 if regex[end] == '\\' else 1
+            out.append(regex[i:end + 1])
+            i = end + 1
+        elif char == '#' and verbose:
+            end = regex.find('\n', i)
+            end = n if end < 0 else end
+            out.append(regex[i:end])
+            i = end
+        elif regex.startswith('(?(', i):
+            # conditional: the group name must stay as it is
+            end = regex.index(')', i + 3)
+            out.append(regex[i:end + 1])
+            i = end + 1
+        elif char == '(' and not regex.startswith('?', i + 1):
+            out.append('(?:')
+            i += 1
+        elif char == '(' and regex.startswith('?P<', i + 1):
+            end = regex.index('>', i)
+            if regex[i + 4:end] in keep:
+                out.append(regex[i:end + 1])
+            else:
+                out.append('(?:')
+            i = end + 1
+        else:
+            out.append(char)
+            i += 1
+    return ''.join(out)
+
+
+def binary(regex, flags=DEFAULT_FLAGS):
+    '''Returns regex and flags matching UTF-8 encoded bytes the way
+    regex matches text. Only regexes written with ASCII characters can
+    be converted (ValueError otherwise); \\d, \\s, \\w and \\b then
+    only know ASCII characters.
+    '''
+    return regex.encode('ascii'), flags & ~re.UNICODE
+
+
+def words_to_regex(words, ignore_case=True, char_regex=re.escape):
+    '''Compiles a list of words into a regex matching any of them.
+
+    Words sharing a prefix share its regex, so 'St', 'Sta' and 'Station'
+    become 'St(?:a(?:tion)?)?': the prefix is tested once and the longest
+    word is tried first. The result doesn't depend on the order of words.
+    char_regex converts a single character to regex; with ignore_case
+    words match in any case, the first letter of every alternative being
+    written as a '[Xx]' class and the rest as a '(?ai:...)' group,
+    which like the class only folds ASCII letters.
+    '''
+    trie = {}
+    for word in words:
+        if ignore_case:
+            word = word.lower()
+        node = trie
+        for char in word:
+            node = node.setdefault(char_regex(char), {})
+        node[''] = {}
+    return _trie_regex(trie, ignore_case, True)
+
+
+def _trie_regex(node, ignore_case, root=False):
+    branches = []
+    letters = []
+    for token in sorted(key for key in node if key):
+        chain = [token]
+        child = node[token]
+        # a run of characters without branches is written as one literal
+        while len(child) == 1 and '' not in child:
+            (token, child), = child.items()
+            chain.append(token)
+        if len(chain) == 1 and len(child) == 1 and len(token) == 1:
+            # words ending with a single different character
+            letters.append(token)
+            continue
+        branches.append(_case_regex(chain[:1], ignore_case) +
+                        _case_regex(chain[1:], ignore_case) +
+                        _trie_regex(child, ignore_case))
+    if len(letters) > 1:
+        if ignore_case:
+            letters += [letter.upper() for letter in letters
+                        if len(letter.upper()) == 1]
+        branches.append('[' + ''.join(sorted(set(letters))) + ']')
+    elif letters:
+        branches.append(_case_regex(letters, ignore_case))
+    regex = '|'.join(branches)
+    if '' in node and not root:
+        # a shorter word ends here: the longer ones are tried first
+        if not regex:
+            return ''
+        if letters and len(branches) == 1:
+            return regex + '?'
+        return '(?:' + regex + ')?'
+    if len(branches) > 1:
+        return '(?:' + regex + ')'
+    return regex
+
+
+def _case_regex(tokens, ignore_case):
+    regex = ''.join(tokens)
+    if not ignore_case or regex.lower() == regex.upper():
+        return regex
+    # a single letter or class of letters becomes a class of both cases
+    letters = regex[1:-1] if regex[:1] == '[' and regex[-1:] == ']' \
+        else regex
+    if len(tokens) == 1 and (len(letters) == 1 or letters.isalpha()):
+        cases = set(letters.upper() + letters.lower())
+        if len(cases) == 2 * len(set(letters)) and \
+                len(letters.upper()) == len(letters):
+            return '[' + ''.join(sorted(cases)) + ']'
+    if not regex.isascii():
+        # the 'a' flag doesn't fold other letters, they become classes
+        if len(tokens) > 1:
+            return ''.join(_case_regex([token], ignore_case)
+                           for token in tokens)
+        return '(?i:' + regex + ')'
+    return '(?ai:' + regex + ')'
+
+
+# accented Latin letters mapped to their ASCII base letters,
+# built on the first use of fold_accents
+_accents = None
+
+# Latin-1 Supplement, Latin Extended-A and B
+_ACCENTED = re.compile(u'[\u00c0-\u024f]')
+
+
+def _accents_table():
+    table = {}
+    for code in range(0xC0, 0x250):
+        char = chr(code)
+        base = u''.join(part for part in unicodedata.normalize('NFKD', char)
+                        if not unicodedata.combining(part))
+        if len(base) == 1 and base.isascii() and base != char:
+            table[char] = base
+    return table
+
+
+def _fold_accent(match):
+    char = match.group()
+    return _accents.get(char, char)
+
+
+def fold_accents(text):
+    '''Returns text with accented Latin letters replaced by their ASCII
+    base letters, e.g. 'Québec' -> 'Quebec'. Every character is replaced
+    by exactly one, so positions in the result are positions in text.
+    '''
+    global _accents
+    if text.isascii():
+        return text
+    if _accents is None:
+        _accents = _accents_table()
+    # accented letters are few even in French text, replacing them one
+    # by one is faster than str.translate going through every character
+    return _ACCENTED.sub(_fold_accent, text)
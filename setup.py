@@ -17,21 +17,22 @@ setup(name='pyap',
       author='Vladimir Goncharov',
       author_email='vladimarius@gmail.com',
       license='MIT',
-      packages=['pyap', 'pyap.packages', 'pyap.source_CA', 'pyap.source_US', 'pyap.source_GB'],
+      packages=['pyap', 'pyap.packages', 'pyap.source_CA', 'pyap.source_US', 'pyap.source_GB',
+                'pyap.source_FR'],
+      package_data={'pyap.source_FR': ['communes.bin']},
       download_url='https://github.com/vladimarius/pyap',
       zip_safe=False,
+      python_requires='>=3.7',
+      extras_require={'regex': ['regex'], 're2': ['google-re2'],
+                      'hyperscan': ['hyperscan']},
       classifiers=[
           'Intended Audience :: Developers',
           'Development Status :: 4 - Beta',
           'License :: OSI Approved :: MIT License',
           'Natural Language :: English',
           'Programming Language :: Python',
-          'Programming Language :: Python :: 2.7',
           'Programming Language :: Python :: 3',
-          'Programming Language :: Python :: 3.1',
-          'Programming Language :: Python :: 3.2',
-          'Programming Language :: Python :: 3.3',
-          'Programming Language :: Python :: 3.4',
+          'Programming Language :: Python :: 3 :: Only',
           'Topic :: Software Development :: Libraries',
           'Topic :: Scientific/Engineering :: Information Analysis',
           'Topic :: Utilities'
@@ -2,11 +2,23 @@
 
 """ Test for parser classes """
 
+import io
 import re
+import mmap
+import asyncio
+import threading
+import importlib
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 import pyap as ap
 from pyap import parser
 from pyap import address
+from pyap import utils
+from pyap import registry
+from pyap import freeze
+from pyap import gazetteer
+from pyap import engines
+from pyap import multi
 from pyap import exceptions as e
 
 
@@ -18,6 +30,68 @@ def test_api_parse():
         "225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062"
 
 
+def test_api_parse_shares_parser():
+    registry.clear()
+    ap.parse('No address here', country='US')
+    ap.parse('No address here', country='us')
+    stats = registry.stats()
+    assert stats['parser_misses'] == 1
+    assert stats['parser_hits'] == 1
+    assert stats['rules_misses'] == 1
+    assert 'US' in stats['compile_time']
+    assert registry.get_parser(country='US') is \
+        registry.get_parser(country='US')
+
+
+def test_shared_parser_read_only():
+    shared = registry.get_parser(country='US')
+    for name in ('two_stage', 'prefilter', 'fold_accents', 'country'):
+        with pytest.raises(AttributeError):
+            setattr(shared, name, False)
+    with pytest.raises(AttributeError):
+        del shared.country
+    assert shared.two_stage is parser.AddressParser.two_stage
+    assert ap.parse('225 E. John Carpenter Freeway, Irving, Texas 75062',
+                    country='US')
+
+
+def test_registry_compiles_outside_lock(monkeypatch):
+    registry.clear()
+    registry.get_rules('CA')
+    compiling = threading.Event()
+    release = threading.Event()
+    load_rules = registry.load_rules
+
+    def slow_load_rules(country, *args):
+        compiling.set()
+        release.wait(10)
+        return load_rules(country, *args)
+
+    monkeypatch.setattr(registry, 'load_rules', slow_load_rules)
+    thread = threading.Thread(target=registry.get_rules, args=('US',))
+    thread.start()
+    try:
+        assert compiling.wait(10)
+        # a slow compile doesn't hold up lookups of other countries
+        lookup = threading.Thread(target=registry.get_rules, args=('CA',))
+        lookup.start()
+        lookup.join(5)
+        assert not lookup.is_alive()
+    finally:
+        release.set()
+        thread.join()
+    assert registry.stats()['rules_misses'] == 2
+
+
+def test_registry_compiles_rules_once():
+    registry.clear()
+    first = parser.AddressParser(country='US')
+    second = parser.AddressParser(country='US')
+    assert first._rules is second._rules
+    assert registry.stats()['rules_misses'] == 1
+    assert registry.stats()['rules_hits'] == 1
+
+
 def test_address_class_init():
     addr = address.Address(
         state='USA ',
@@ -39,6 +113,30 @@ def test_address_class_init():
     assert str(addr) == 'Street 1b CityVille USA'
 
 
+def test_address_from_spans():
+    text = 'xx 1 Main St, Town xx'
+    addr = address.Address.from_spans(
+        text, ('full_address', 'street', 'city', 'floor', 'country_id'),
+        [3, 18, 3, 13, 13, 18, -1, -1], ('US',))
+    # parts are only built when read, then kept as attributes
+    assert addr._data is None
+    assert addr.street == '1 Main St'
+    assert vars(addr) == addr.as_dict()
+    assert addr.__getattribute__('city') == 'Town'
+    assert addr.floor is None
+    assert str(addr) == '1 Main St, Town'
+    assert addr.as_dict() == {
+        'full_address': '1 Main St, Town',
+        'street': '1 Main St',
+        'city': 'Town',
+        'floor': None,
+        'country_id': 'US'}
+    assert addr.as_dict() is addr.as_dict()
+    assert addr.city == 'Town'
+    with pytest.raises(AttributeError):
+        addr.state
+
+
 def test_no_country_selected_exception():
     with pytest.raises(e.NoCountrySelected):
         ap = parser.AddressParser()
@@ -58,14 +156,283 @@ def test_normalize_string():
     assert ap._normalize_string(raw_string) == clean_string
 
 
-def test_combine_results():
+def _legacy_normalize_string(text):
+    '''Multi-pass normalizer the single-pass one must reproduce'''
+    conversion = [
+        (r'\r*(\n\r*)+', ', '),
+        (r'\s*(\,\s*)+', ', '),
+        (r'\s+', ' '),
+    ]
+    for find, replace in conversion:
+        text = re.sub(find, replace, text, flags=re.UNICODE)
+    for dash in u'‐‑‒–—―':
+        text = text.replace(dash, '-')
+    return text
+
+
+@pytest.mark.parametrize("raw_string", [
+    """\n The  quick      \t, brown fox      jumps over the lazy dog,
+    ‐ ‑ ‒ – — ―
+    """,
+    "",
+    " ",
+    "\t",
+    "a\r\rb",
+    "a\r\n\r\nb",
+    "a ,\t, ,b",
+    "a\u00a0\u3000b,",
+    ",,, a \n",
+    "225 E. John Carpenter Freeway,\nSuite 1500 Irving, Texas 75062",
+])
+def test_normalize_string_matches_legacy(raw_string):
+    assert parser.AddressParser._normalize_string(raw_string) == \
+        _legacy_normalize_string(raw_string)
+
+
+@pytest.mark.parametrize("raw_string", [
+    u'a  b\n\n\tc ,, d\u2014e',
+    u' \n lead and trail \t\n',
+    u'plain text',
+])
+def test_normalize_string_offsets(raw_string):
+    offsets = parser.OffsetMap()
+    clean = parser.AddressParser._normalize_string(raw_string, offsets)
+    assert clean == parser.AddressParser._normalize_string(raw_string)
+    # every character kept from the original maps back onto itself
+    for position, char in enumerate(clean):
+        original = offsets.original(position)
+        if char not in u' ,-':
+            assert raw_string[original] == char
+    assert offsets.original(len(clean)) == len(raw_string)
+
+
+def test_iter_parse():
     ap = parser.AddressParser(country='US')
-    raw_dict = {
-        'test_one': None,
-        'test_one_a': 1,
-        'test_two': None,
-        'test_two_b': 2}
-    assert ap._combine_results(raw_dict) == {'test_one': 1, 'test_two': 2}
+    test_address = "xxx 225 E. John Carpenter Freeway, " +\
+        "Suite 1500 Irving, Texas 75062 xxx " +\
+        "1827 Union St, San Francisco, CA 94123"
+    results = ap.iter_parse(test_address)
+    assert not isinstance(results, list)
+    first = next(results)
+    assert first.full_address == \
+        "225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062"
+    assert [a.as_dict() for a in [first] + list(results)] == \
+        [a.as_dict() for a in ap.parse(test_address)]
+    assert list(ap.iter_parse('No address here')) == []
+
+
+def test_utils_iterfind():
+    matches = utils.iterfind(r'\d+', 'a 1 b 22')
+    assert not isinstance(matches, list)
+    assert [m.group() for m in matches] == ['1', '22']
+
+
+def test_rules_field_table():
+    rules = registry.CountryRules(
+        'XX', r'(?P<code_b>\d)?(?P<code>[a-z])?(?P<code_c>\d)?(?P<rest>.*)')
+    assert rules.keys == ('code', 'rest') + registry.EXTRA_KEYS
+    match = rules.pattern.match('1b2 tail')
+    assert rules.field_spans(match) == [2, 3, 3, 8]
+    match = rules.pattern.match('b tail')
+    assert rules.field_spans(match) == [0, 1, 1, 6]
+    match = rules.pattern.match(' tail')
+    assert rules.field_spans(match) == [-1, -1, 0, 5]
+    rules = registry.CountryRules(
+        'XX', r'(?P<one>x)?(?P<one_a>1)(?P<two>y)?(?P<two_b>2)')
+    assert rules.keys[:2] == ('one', 'two')
+    assert rules.field_spans(rules.pattern.match('12')) == [0, 1, 1, 2]
+
+
+def test_utils_strip_groups():
+    regex = r"""(?P<number>\d+)\ (street)?
+                \ (?(number)[a-z]{2,}|[A-Z]+)  # name (of [ street])
+                (?P<unit>[(](?P<apt>\d)[)])?"""
+    stripped = utils.strip_groups(regex)
+    pattern = re.compile(stripped, utils.DEFAULT_FLAGS)
+    assert list(pattern.groupindex) == ['number']
+    assert pattern.groups == 1
+    assert '[(]' in stripped and '(of [ street])' in stripped
+    assert pattern.match('12 street main(4)').group() == '12 street main(4)'
+
+
+def test_utils_max_width():
+    assert utils.max_width(r'\d{1,5}\ [A-Z]{2}(?=\ \d{5})') == 14
+    # whitespace runs are short in normalized text
+    assert utils.max_width(r'a[\s,]*(?:\ ,)+b') == 2 + 2 * utils.NORMALIZED_RUN
+    assert utils.max_width(r'\d+\ TX') is None
+    assert utils.max_width(r'(?:\d{1,3}|[a-z]*)\ ') is None
+
+
+def test_utils_words_to_regex():
+    words = ['Street', 'St', 'Sta', 'Station', 'Ave', 'Av', 'N.E.', 'NW']
+    regex = utils.words_to_regex(words)
+    assert regex == utils.words_to_regex(sorted(words, reverse=True))
+    pattern = re.compile(regex + '$', utils.DEFAULT_FLAGS)
+    for word in words + ['STREET', 'station', 'n.e.']:
+        assert pattern.match(word)
+    for word in ['Stre', 'Avenue', 'N E', 'S']:
+        assert not pattern.match(word)
+    # the longest word is tried first
+    assert re.match(regex, 'Stations').group() == 'Station'
+    assert utils.words_to_regex(['AL', 'AK', 'CA'], ignore_case=False) == \
+        '(?:A[KL]|CA)'
+    # only ASCII letters fold to ASCII, other letters keep their cases
+    pattern = re.compile(utils.words_to_regex([u'Québec', u'Straße']) + '$',
+                         utils.DEFAULT_FLAGS)
+    for word in [u'QUÉBEC', u'québec', u'STRAßE']:
+        assert pattern.match(word)
+    for word in [u'qu\u0130bec', u'\u017ftraße', u'STRASSE']:
+        assert not pattern.match(word)
+
+
+def test_utils_fold_accents():
+    text = u'Île-du-Prince-Édouard, Montréal (Québec) œuvre'
+    folded = utils.fold_accents(text)
+    assert folded == u'Ile-du-Prince-Edouard, Montreal (Quebec) œuvre'
+    # positions are kept so that matches on folded text fit the original
+    assert len(folded) == len(text)
+    assert utils.fold_accents(u'plain') == u'plain'
+
+
+def test_parser_fold_accents_option():
+    text = u'225 Main St, Écorse, MI 48229'
+    assert ap.parse(text, country='US') == []
+    folding = parser.AddressParser(country='US', fold_accents=True)
+    for found in (folding.parse(text), folding.parse(text.encode('utf-8')),
+                  multi.parse(text, ['US'], fold_accents=True)):
+        assert [a.city for a in found] == [u'Écorse']
+
+
+def test_gazetteer_lookup(tmp_path):
+    path = tmp_path / 'communes.csv'
+    path.write_bytes(u'#Code;Nom\n1;L ABERGEMENT CLEMENCIAT\n2;PARIS 01\n'
+                     u'3;ST ÉTIENNE\n4\n'.encode('latin-1'))
+    known = gazetteer.Gazetteer.from_csv(
+        str(path), 'Nom', delimiter=';', encoding='latin-1')
+    assert len(known) == 3
+    assert u"L'Abergement-Clémenciat" in known
+    assert u'st-etienne' in known
+    assert u'Paris' not in known
+    assert known.longest_prefix(u'Paris 01 bis') == len(u'Paris 01')
+    assert known.longest_prefix(u'St Étienne, France') == len(u'St Étienne')
+    assert known.longest_prefix(u'Paris') == 0
+
+    table = str(tmp_path / 'communes.bin')
+    known.save(table)
+    mapped = gazetteer.load(table)
+    assert isinstance(mapped.names, gazetteer.NameTable)
+    assert sorted(mapped.names) == sorted(known.names)
+    assert mapped.max_words == known.max_words == 3
+    assert u'St-Étienne' in mapped
+    assert u'St' not in mapped and u'zzz' not in mapped
+    assert mapped.longest_prefix(u'Paris 01 bis') == len(u'Paris 01')
+
+
+def test_fr_communes_looked_up():
+    ap = parser.AddressParser(country='FR')
+    addresses = ap.parse(u'12 rue de la Paix, 75002, Paris 02 avant lundi')
+    assert [a.commune for a in addresses] == [u'Paris 02']
+    assert ap.parse(u'12 rue de la Paix, 75002, Nullepart du tout') == []
+
+
+def test_rules_gazetteer_validation():
+    rules = registry.CountryRules(
+        'XX', r'(?P<number>\d+)\ (?P<city>[^\W\d_]+(?:\ [^\W\d_]+){0,3})',
+        gazetteers={'city': gazetteer.Gazetteer(['Le Mans', 'Laval'])})
+    text = u'1 le mans sarthe, 2 Rennes, 3 Laval'
+    for two_stage in (True, False):
+        found = [m.group() for m in rules.finditer(text, 0, two_stage)]
+        assert found == ['1 le mans', '3 Laval']
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB', 'FR'])
+def test_frozen_rules_up_to_date(country):
+    # fails after changing the rules: run 'python -m pyap.freeze'
+    frozen = importlib.import_module('pyap.source_%s.frozen' % country)
+    data = importlib.import_module('pyap.source_%s.data' % country)
+    assert frozen.fingerprint == freeze.fingerprint(country)
+    for name in freeze.FROZEN_NAMES:
+        assert getattr(frozen, name, None) == getattr(data, name, None)
+    assert freeze.up_to_date(country)
+    assert registry.load_data(country) is frozen
+
+
+def test_stale_frozen_rules_reported(monkeypatch, capsys):
+    assert freeze.main(['--check', 'US']) == 0
+    monkeypatch.setattr(freeze, 'fingerprint', lambda country: 'changed')
+    assert freeze.main(['--check', 'us']) == 1
+    assert 'source_US' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_two_stage_matches_single_pass(country):
+    rules = registry.get_rules(country)
+    text = parser.AddressParser._normalize_string(STREAM_TEXT)
+    expected = [m.groupdict() for m in rules.pattern.finditer(text)]
+    assert expected
+    found = [m.groupdict() for m in rules.finditer(text, two_stage=True)]
+    assert found == expected
+    ap = parser.AddressParser(country=country, two_stage=True)
+    single = parser.AddressParser(country=country)
+    assert not single.two_stage
+    assert [a.as_dict() for a in ap.parse(STREAM_TEXT)] == \
+        [a.as_dict() for a in single.parse(STREAM_TEXT)]
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_rules_finditer_floor(country):
+    rules = registry.get_rules(country)
+    text = parser.AddressParser._normalize_string(STREAM_TEXT)
+    expected = [m.span() for m in rules.finditer(text)]
+    assert expected
+    assert [m.span() for m in rules.finditer(
+        text, floor=lambda anchor: 0)] == expected
+    # matches starting before the last one are left out
+    last = expected[-1][0]
+    assert [m.span() for m in rules.finditer(
+        text, floor=lambda anchor: last)] == expected[-1:]
+
+
+@pytest.mark.parametrize("country", ['US', 'CA'])
+def test_rules_start_positions(country):
+    rules = registry.get_rules(country)
+    data = __import__('pyap.source_%s.data' % country, fromlist=['data'])
+    text = parser.AddressParser._normalize_string(
+        STREAM_TEXT + u' Thousand Seventy 85th 4 and alone often ' +
+        u' '.join(data.address_start_words).upper() + u' 7,8')
+    number = re.compile(
+        '(?=' + utils.strip_groups(data.street_number) + ')',
+        utils.DEFAULT_FLAGS)
+    expected = set(m.start() for m in number.finditer(text))
+    assert expected
+    starts = registry.CountryRules(
+        country, data.full_address,
+        start_words=data.address_start_words).start_positions(text)
+    assert expected <= set(starts)
+    assert starts == sorted(starts)
+    # near anchors only
+    assert set(rules.start_positions(text)) <= set(starts)
+    for pos in (100, starts[3], starts[3] + 1):
+        assert rules.start_positions(text, pos) == \
+            [start for start in rules.start_positions(text) if start >= pos]
+
+
+@pytest.mark.parametrize("country,tail", [
+    ('US', u' Main Street, Austin, TX 78701'),
+    ('CA', u' Main Street, Calgary, Alberta T2P3E6')])
+def test_start_index_non_ascii(country, tail):
+    # start words with letters swapped for non-ASCII look-alikes the
+    # rules and the index must both accept or both reject
+    variants = {u's': u'\u017f', u'i': u'\u0131', u'I': u'\u0130',
+                u'k': u'\u212a', u'e': u'\xe9'}
+    words = registry.load_data(country).address_start_words
+    text = u'\n'.join(
+        u''.join(variants.get(char, char) for char in word) + tail +
+        u' or ' + word.upper() + tail for word in words)
+    indexed = parser.AddressParser(country=country)
+    plain = parser.AddressParser(country=country, prefilter=False)
+    assert [a.as_dict() for a in indexed.parse(text)] == \
+        [a.as_dict() for a in plain.parse(text)]
 
 
 def test_parse_address():
@@ -82,5 +449,338 @@ def test_parse_address():
         "Suite 1500 Irving, Texas 75062 xxx"
 
     addresses = ap.parse(test_address)
+    # the address keeps the matched text, not the whole document
+    assert addresses[0]._text == \
+        "225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062"
     assert addresses[0].full_address == \
         "225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062"
+
+
+def test_address_parser_pool():
+    documents = [
+        "xxx 225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062",
+        "No address here",
+        "1111, 101-3RD STREET SW, CALGARY, ALBERTA T2P3E6 and "
+        "1827 Union St, San Francisco, CA 94123",
+    ]
+    expected = [
+        [a.as_dict() for c in ('US', 'CA') for a in ap.parse(d, country=c)]
+        for d in documents]
+    with ap.AddressParserPool(countries=['US', 'ca'], workers=2,
+                              chunksize=1, as_dict=True) as pool:
+        assert pool.map(documents) == list(enumerate(expected))
+        unordered = sorted(pool.imap_unordered(documents))
+        assert unordered == list(enumerate(expected))
+
+    with ap.AddressParserPool(countries='US', workers=1) as pool:
+        results = dict(pool.imap_unordered(documents, chunksize=2))
+    assert results[0][0].full_address == \
+        "225 E. John Carpenter Freeway, Suite 1500 Irving, Texas 75062"
+    assert results[1] == []
+
+
+@pytest.mark.parametrize("backend", ['thread', 'process'])
+def test_address_parser_pool_backends(backend):
+    documents = [STREAM_TEXT[i:] for i in range(0, len(STREAM_TEXT), 97)]
+    expected = [[a.as_dict() for a in ap.parse(d, country='GB')]
+                for d in documents]
+    with ap.AddressParserPool(countries='GB', workers=3, chunksize=2,
+                              as_dict=True, backend=backend) as pool:
+        assert pool.backend == backend
+        assert pool.map(documents) == list(enumerate(expected))
+        assert sorted(pool.imap_unordered(documents)) == \
+            list(enumerate(expected))
+
+
+def test_address_parser_pool_default_backend():
+    with ap.AddressParserPool(countries='US', workers=1) as pool:
+        assert pool.backend == \
+            ('thread' if ap.pool.free_threaded() else 'process')
+    with pytest.raises(ValueError):
+        ap.AddressParserPool(countries='US', backend='fiber')
+
+
+def test_address_parser_pool_missing_country():
+    with pytest.raises(e.CountryDetectionMissing):
+        ap.AddressParserPool(countries=['TheMoon'], workers=1)
+
+
+STREAM_TEXT = (
+    "Lorem ipsum \n 225 E. John Carpenter Freeway, \n"
+    "Suite 1500 Irving, Texas 75062 dolor sit amet,  \t,\n  "
+    "1111, 101-3RD STREET SW, CALGARY, ALBERTA T2P3E6 — "
+    "11-59 High Road\nEast Finchley London\nN2 8AW, UK  "
+    "405, rue Sainte Montreal Québec  1827 Union St, San Francisco, "
+    "CA 94123 xxx\n\n"
+) * 3
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+@pytest.mark.parametrize("chunk_size", [13, 64, 1000])
+def test_parse_stream(country, chunk_size):
+    ap = parser.AddressParser(country=country)
+    expected = [a.as_dict() for a in ap.parse(STREAM_TEXT)]
+    assert expected
+    streamed = ap.parse_stream(io.StringIO(STREAM_TEXT), chunk_size)
+    assert [a.as_dict() for a in streamed] == expected
+    streamed = ap.parse_stream(
+        io.BytesIO(STREAM_TEXT.encode('utf-8')), chunk_size)
+    assert [a.as_dict() for a in streamed] == expected
+
+
+def test_parse_stream_long_match():
+    ap = parser.AddressParser(country='US')
+    text = (u'x ' * 2000 + u'123 Main Street Route ' + u'Q' * 60 +
+            u' Austin, TX 78701' + u' y' * 2000)
+    expected = [a.as_dict() for a in ap.parse(text)]
+    assert len(expected) == 1
+    streamed = ap.parse_stream(io.StringIO(text), 256)
+    assert [a.as_dict() for a in streamed] == expected
+
+
+def test_parse_stream_unbounded_rules(monkeypatch):
+    ap = parser.AddressParser(country='US')
+    monkeypatch.setattr(ap, '_rules', registry.CountryRules(
+        'XX', r'(?P<full_address>\d+\ Main)'))
+    with pytest.raises(ValueError):
+        ap.parse_stream(io.StringIO(u'123 Main'))
+    streamed = ap.parse_stream(io.StringIO(u'x 123 Main'), 4, overlap=10)
+    assert [a.full_address for a in streamed] == [u'123 Main']
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_original_offsets(country):
+    ap = parser.AddressParser(country=country)
+    addresses = ap.parse(STREAM_TEXT)
+    assert addresses
+    clean_text = ap._normalize_string(STREAM_TEXT)
+    assert clean_text != STREAM_TEXT
+    for a in addresses:
+        original = STREAM_TEXT[a.orig_start:a.orig_end]
+        assert ap._normalize_string(original) == \
+            clean_text[a.match_start:a.match_end]
+
+
+def test_normalize_bytes():
+    text = u'a,b  c\t\u3000d \u2014e\n\n f\xa0, g' + parser.UNICODE_SPACES
+    assert parser.AddressParser._normalize_string(text.encode('utf-8')) == \
+        parser.AddressParser._normalize_string(text).encode('utf-8')
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+@pytest.mark.parametrize("kind", [bytes, bytearray, memoryview, mmap.mmap])
+def test_parse_bytes(tmpdir, country, kind):
+    ap = parser.AddressParser(country=country)
+    text = u'Café\u3000«\xa0' + STREAM_TEXT
+    data = text.encode('utf-8')
+    expected = [a.as_dict() for a in ap.parse(text)]
+    if kind is mmap.mmap:
+        path = tmpdir.join('text')
+        path.write_binary(data)
+        with open(str(path), 'rb') as f:
+            found = ap.parse(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    else:
+        found = ap.parse(kind(data))
+    assert len(found) == len(expected)
+    for a, b in zip(found, expected):
+        a = a.as_dict()
+        assert data[a.pop('byte_start'):a.pop('byte_end')] == \
+            text[a['orig_start']:a['orig_end']].encode('utf-8')
+        assert a == b
+
+
+def test_parse_bytes_chunks():
+    ap = parser.AddressParser(country='US')
+    rules = registry.get_rules('US', binary=True)
+    text = (u'\U0001f600\u3000 \u2014' + STREAM_TEXT) * 3
+    expected = [a.as_dict() for a in ap.parse(text.encode('utf-8'))]
+    assert expected
+    # positions in the normalized text are characters, like for str
+    assert [(a['match_start'], a['match_end']) for a in expected] == \
+        [(a.match_start, a.match_end) for a in ap.parse(text)]
+    for chunk_size in (1, 7, 64):
+        found = ap._iter_parse_binary(text.encode('utf-8'), rules,
+                                      chunk_size)
+        assert [a.as_dict() for a in found] == expected
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_parse_batch(country):
+    batch = parser.AddressParser(country=country).parse_batch
+    texts = [STREAM_TEXT[i:i + 90] for i in range(0, len(STREAM_TEXT), 13)]
+    texts += [u'', u'\n ' + texts[0] + u',\n', u'\x00'.join(texts[:3])]
+    expected = [[a.as_dict() for a in ap.parse(t, country=country)]
+                for t in texts]
+    assert any(expected)
+    for batch_size in (1, 100, parser.BATCH_SIZE):
+        found = batch(iter(texts), batch_size)
+        assert [[a.as_dict() for a in r] for r in found] == expected
+    assert [[a.as_dict() for a in r]
+            for r in ap.parse_batch(texts, country=country)] == expected
+
+
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_parser_shared_between_threads(country):
+    ap = parser.AddressParser(country=country)
+    state = dict(vars(ap))
+    documents = [STREAM_TEXT[i:] + STREAM_TEXT[:i]
+                 for i in range(0, len(STREAM_TEXT), 31)] * 2
+    expected = [[a.as_dict() for a in ap.parse(d)] for d in documents]
+    assert any(expected)
+
+    def parse(document):
+        if len(document) % 2:
+            found = ap.parse_stream(io.StringIO(document), 256)
+        else:
+            found = ap.iter_parse(document)
+        return [a.as_dict() for a in found]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(parse, documents)) == expected
+    # parsing leaves no state behind
+    assert vars(ap) == state
+
+
+def test_aparse():
+    text = STREAM_TEXT[:300]
+    addresses = asyncio.run(ap.aparse(text, country='US'))
+    assert [a.as_dict() for a in addresses] == \
+        [a.as_dict() for a in ap.parse(text, country='US')]
+
+    async def limited():
+        semaphore = asyncio.Semaphore(1)
+        return await asyncio.gather(*[
+            ap.aparse(text, semaphore=semaphore, country='US')
+            for _ in range(3)])
+    assert [len(found) for found in asyncio.run(limited())] == \
+        [len(addresses)] * 3
+
+
+def test_aiter_parse_backpressure():
+    documents = [STREAM_TEXT[i:] for i in range(0, len(STREAM_TEXT), 97)]
+    expected = [a.as_dict()
+                for d in documents for a in ap.parse(d, country='GB')]
+    taken = []
+
+    async def source():
+        for document in documents:
+            taken.append(document)
+            yield document
+
+    async def consume():
+        addresses = ap.aiter_parse(source(), concurrency=2, country='GB')
+        found = [(await addresses.__anext__()).as_dict()]
+        await asyncio.sleep(0.1)
+        # the first document is done, two more may be in flight
+        assert len(taken) == 3
+        async for address in addresses:
+            found.append(address.as_dict())
+        return found
+    assert asyncio.run(consume()) == expected
+    assert len(taken) == len(documents)
+
+
+def test_aiter_parse_source_error():
+    def source():
+        yield STREAM_TEXT
+        raise ValueError('broken source')
+
+    async def consume():
+        return [a async for a in ap.aiter_parse(source(), country='US')]
+    with pytest.raises(ValueError):
+        asyncio.run(consume())
+
+
+def test_engines_translate():
+    regex, problems = engines.translate(
+        r'''(?<![\d])(?P<number>\d{1,4}) [ \t]*
+            (?i:main)\ st(?:reet)?\b(?=,)(?(number)x|y)''')
+    assert regex == r'(?P<number>\d{1,4})[\ \x09]*(?i:main) st(?:reet)?\b' \
+        r'(?:x|y)'
+    assert problems == [
+        r'lookbehind (?<!\d) dropped',
+        r'lookahead (?=\,) dropped',
+        'conditional on group number made an alternative: x']
+    # letters ignoring ASCII case only are written out, re syntax keeps
+    # every construct
+    assert engines.translate(
+        r'(?<=\d)(?P<n>\ )?(?ai:st[a-c]|[^q])(?(n)x)', syntax='re') == (
+        r'(?<=\d)(?P<n> )?(?:(?:[Ss][Tt][a-cA-C]|[^Qq]))(?(n)x)', [])
+    # rules using no lookarounds translate to the same matches
+    source = registry.get_rules('US').source
+    regex, problems = engines.translate(source)
+    assert not problems
+    text = parser.AddressParser._normalize_string(STREAM_TEXT)
+    assert [m.groupdict() for m in re.finditer(regex, text)] == \
+        [m.groupdict() for m in registry.get_rules('US').pattern.finditer(
+            text)]
+
+
+# addresses whose parts RE2 cuts elsewhere without the lookarounds
+ENGINE_TEXT = STREAM_TEXT + u'''
+405, rue Sainte Montreal Québec
+total street
+Studio 53, Harrison cove, Smithbury, G88 4US, United Kingdom
+'''
+
+
+@pytest.mark.parametrize("engine", ['regex', 're2'])
+@pytest.mark.parametrize("country", ['US', 'CA', 'GB'])
+def test_engines_differential(engine, country):
+    pytest.importorskip(engine)
+    expected = [a.as_dict() for a in ap.parse(ENGINE_TEXT, country=country)]
+    assert expected
+    found = [a.as_dict() for a in
+             ap.parse(ENGINE_TEXT, country=country, engine=engine)]
+    changed = engines.get(engine).check(registry.get_rules(country).source)
+    if engine == 're2' and country != 'US':
+        # dropped lookarounds: the same addresses with other parts
+        assert changed
+        assert [a['full_address'] for a in found] == \
+            [a['full_address'] for a in expected]
+        assert found != expected
+    else:
+        # spans and every part are the same
+        assert not changed
+        assert found == expected
+
+
+def test_engine_missing():
+    with pytest.raises(e.EngineMissing):
+        parser.AddressParser(country='US', engine='TheMoon')
+
+
+@pytest.mark.parametrize("hyperscan", [True, False])
+def test_parse_multi(monkeypatch, hyperscan):
+    if hyperscan:
+        pytest.importorskip('hyperscan')
+    else:
+        monkeypatch.setattr(multi, '_load_hyperscan', lambda: None)
+    monkeypatch.setattr(multi, '_prefilters', {})
+    for text in [STREAM_TEXT, u'No address here',
+                 u'Écrire au 5, rue Saint-Joseph Saint-Jérôme (Québec) '
+                 u'J7Z 0B7 — ' + STREAM_TEXT, u'\udcff ' + STREAM_TEXT]:
+        expected = [a.as_dict() for country in multi.DEFAULT_COUNTRIES
+                    for a in ap.parse(text, country=country)]
+        assert [a.as_dict() for a in ap.parse_multi(text)] == expected
+    assert [a.as_dict() for a in ap.parse_multi(STREAM_TEXT, 'GB')] == \
+        [a.as_dict() for a in ap.parse(STREAM_TEXT, country='GB')]
+
+
+def test_multi_prefilter_ranges():
+    pytest.importorskip('hyperscan')
+    rules = [registry.get_rules(country)
+             for country in multi.DEFAULT_COUNTRIES]
+    prefilter = multi.Prefilter(rules)
+    # a lone surrogate, as left by bytes decoded with 'surrogateescape'
+    text = parser.AddressParser._normalize_string(
+        u'Voilà \udcff ' + STREAM_TEXT)
+    for country_rules, ranges in zip(rules, prefilter.ranges(text)):
+        if country_rules.anchor is None:
+            assert ranges is None
+            continue
+        # every position near an anchor is covered
+        for first, last in country_rules._candidate_ranges(
+                country_rules.shadow(text), 0):
+            assert any(start <= first and last <= end
+                       for start, end in ranges)
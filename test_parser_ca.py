@@ -6,6 +6,8 @@ import re
 import pytest
 import pyap.source_CA.data as data_ca
 from pyap import utils
+from pyap import parser
+from pyap import registry
 
 
 @pytest.mark.parametrize("input,expected", [
@@ -330,7 +332,7 @@ still finding correct matches in full_address
 """
 
 
-@pytest.mark.parametrize("input,expected", [
+FULL_ADDRESSES = [
     # positive assertions
     ("15979 Bow Bottom Trail SE, Calgary, AB T2J 6T5", True),
     ("1730 McPherson Crt. Unit 35, Pickering, ON",
@@ -387,15 +389,42 @@ still finding correct matches in full_address
     ("3351, boul. des Forges C.P. 500, Trois-Rivières (Québec)"
         " Canada, G9A 5H7", True),
     ("3264 Mainway Burlington L7M 1A7 Ontario, Canada", True),
-])
+]
+
+
+# tokens longer than the repeats of the rules allow
+LONG_TOKENS = [
+    ("3000 Steeles Avenue East Route " + "Q" * 600 +
+     " Markham, Ontario L3R 9W2", False),
+    ("3000 Steeles Avenue East Floor " + "9" * 600 +
+     " Markham, Ontario L3R 9W2", False),
+    ("3000 Steeles Avenue East Floor 999999 Markham, Ontario L3R 9W2", True),
+    ("C.P. " + "9" * 600 + " Markham, Ontario L3R 9W2", False),
+]
+
+
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES)
 def test_full_address_positive(input, expected):
     ''' tests exact string match for a full address '''
-    match = utils.match(
-        data_ca.full_address,
-        utils.unicode_str(input), re.VERBOSE | re.U)
+    # rules are matched against text with accents folded
+    text = utils.fold_accents(utils.unicode_str(input))
+    match = utils.match(data_ca.full_address, text, re.VERBOSE | re.U)
     is_found = match is not None
-    assert (is_found == expected) and\
-           (match.group(0) == utils.unicode_str(input))
+    assert (is_found == expected) and (match.group(0) == text)
+
+
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES + LONG_TOKENS)
+def test_full_address_prefilter(input, expected):
+    ''' matching near anchors only finds the same addresses
+    as trying every position '''
+    rules = registry.get_rules('CA')
+    text = rules.shadow(parser.AddressParser._normalize_string(
+        u'Lorem ipsum ' + utils.unicode_str(input) + u' dolor, ' +
+        utils.unicode_str(input) + u' sit amet'))
+    plain = [m.groupdict() for m in rules.pattern.finditer(text)]
+    for two_stage in (True, False):
+        found = rules.finditer(text, 0, two_stage, prefilter=True)
+        assert [m.groupdict() for m in found] == plain
 
 
 @pytest.mark.parametrize("input,expected", [
@@ -449,10 +478,35 @@ def test_postal_code_negative(input, expected):
 ])
 def test_region1(input, expected):
     ''' test exact string match for province '''
-    match = utils.match(data_ca.region1, input, re.VERBOSE)
+    text = utils.fold_accents(utils.unicode_str(input))
+    match = utils.match(data_ca.region1, text, re.VERBOSE)
     is_found = match is not None
-    assert is_found == expected and \
-        match.group(0) == utils.unicode_str(input)
+    assert is_found == expected and match.group(0) == text
+
+
+def test_accents_kept_in_results():
+    ''' rules match folded text, parts come from the original '''
+    ap = parser.AddressParser(country='CA')
+    addresses = ap.parse(u'Écrire au 5, rue Saint-Joseph Saint-Jérôme '
+                         u'(Québec) J7Z 0B7 svp')
+    assert [a.full_address for a in addresses] == \
+        [u'5, rue Saint-Joseph Saint-Jérôme (Québec) J7Z 0B7']
+    assert addresses[0].region1 == u'Québec'
+
+
+def test_folded_letters_in_parts():
+    ''' a folded letter is a letter like any other: 'Île' may now start
+    the city, it was left to the street name before folding '''
+    text = u'16, Place du Commerce Île des Soeurs Verdun (Québec) H3E 2A5'
+    address, = parser.AddressParser(country='CA').parse(text)
+    assert address.street_name == u'du Commerce'
+    assert address.city == u'Île des Soeurs Verdun'
+    assert address.region1 == u'Québec'
+    # without folding the rules, written without accents, miss 'Québec'
+    ap = parser.AddressParser(country='CA', fold_accents=False)
+    assert ap.parse(text) == []
+    assert [a.city for a in ap.parse(u'1111, 101-3RD STREET SW, CALGARY, '
+                                     u'ALBERTA T2P3E6')] == [u'CALGARY']
 
 
 @pytest.mark.parametrize("input,expected", [
@@ -8,6 +8,8 @@ import itertools
 import pyap
 import pyap.parser
 from pyap import utils
+from pyap import parser
+from pyap import registry
 from pyap.packages import six
 import pyap.source_GB.data as data_gb
 
@@ -428,7 +430,7 @@ def test_country(input, expected):
     execute_matching_test(input, expected, data_gb.country)
 
 
-@pytest.mark.parametrize("input,expected", [
+FULL_ADDRESSES = [
     # positive assertions
     ("11-59 High Road, East Finchley London, N2 8AW", True),
     ("88 White parkway, Stanleyton, L2 3DB", True),
@@ -466,11 +468,36 @@ def test_country(input, expected):
     ("ONE FOR ANY DIRECT, INDIRECT, IN", False),
     ("2 TRACTOR HEAD Actros MP", False),
     ("00 Straight Fit Jean, USA", False),
-])
+]
+
+
+# tokens longer than the repeats of the rules allow
+LONG_TOKENS = [
+    ("9 Shaun glen, Floor " + "9" * 600 + " East Joan, LN4 1LE", False),
+    ("PO Box " + "9" * 600 + ", East Joan, LN4 1LE", False),
+]
+
+
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES)
 def test_full_address(input, expected):
     ''' tests exact string match for a full address '''
     execute_matching_test(input, expected, data_gb.full_address)
 
+
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES + LONG_TOKENS)
+def test_full_address_prefilter(input, expected):
+    ''' matching near anchors only finds the same addresses
+    as trying every position '''
+    rules = registry.get_rules('GB')
+    text = parser.AddressParser._normalize_string(
+        u'Lorem ipsum ' + utils.unicode_str(input) + u' dolor, ' +
+        utils.unicode_str(input) + u' sit amet')
+    plain = [m.groupdict() for m in rules.pattern.finditer(text)]
+    for two_stage in (True, False):
+        found = rules.finditer(text, 0, two_stage, prefilter=True)
+        assert [m.groupdict() for m in found] == plain
+
+
 def test_full_address_parts():
     """Tests that the right parts of the address are picked up by the right regex"""
     example_addresses = [
@@ -5,6 +5,8 @@
 import re
 import pytest
 from pyap import utils
+from pyap import parser
+from pyap import registry
 from pyap.packages import six
 import pyap.source_US.data as data_us
 
@@ -341,7 +343,7 @@ def test_full_street_positive(input, expected):
     execute_matching_test(input, expected, data_us.full_street)
 
 
-@pytest.mark.parametrize("input,expected", [
+FULL_ADDRESSES = [
     # positive assertions
     ("0 OLD MILL RD, Maynard, MA 01754", True),
     ("103 Morgan Lane, Suite 102 Plainsboro, NJ 08536", True),
@@ -431,12 +433,51 @@ def test_full_street_positive(input, expected):
     ("ONE FOR ANY DIRECT, INDIRECT, IN", False),
     ("2 TRACTOR HEAD Actros MP", False),
     ("00 Straight Fit Jean, USA", False),
-])
+]
+
+
+# tokens longer than the repeats of the rules allow
+LONG_TOKENS = [
+    ("123 Main Street Route " + "Q" * 600 + " Austin, TX 78701", False),
+    ("123 Main Street Route " + "Q" * 60 + " Austin, TX 78701", True),
+    ("123 Main Street Floor " + "9" * 600 + " Austin, TX 78701", False),
+    ("PO Box " + "9" * 600 + " Austin, TX 78701", False),
+]
+
+
+@pytest.mark.parametrize("options", [
+    {}, {'prefilter': False}, {'two_stage': True},
+    {'engine': 'regex'}, {'engine': 're2'}])
+def test_full_address_unicode_case(options):
+    ''' letters match in any ASCII case only: 'ſ' is no 's' '''
+    if 'engine' in options:
+        pytest.importorskip(options['engine'])
+    ap = parser.AddressParser(country='US', **options)
+    found = ap.parse(u'Thou\u017fand Main Street, Austin, TX 78701')
+    assert [a.full_address for a in found] == \
+        [u'and Main Street, Austin, TX 78701']
+
+
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES)
 def test_full_address(input, expected):
     ''' tests exact string match for a full address '''
     execute_matching_test(input, expected, data_us.full_address)
 
 
+@pytest.mark.parametrize("input,expected", FULL_ADDRESSES + LONG_TOKENS)
+def test_full_address_prefilter(input, expected):
+    ''' matching near anchors only finds the same addresses
+    as trying every position '''
+    rules = registry.get_rules('US')
+    text = parser.AddressParser._normalize_string(
+        u'Lorem ipsum ' + utils.unicode_str(input) + u' dolor, ' +
+        utils.unicode_str(input) + u' sit amet')
+    plain = [m.groupdict() for m in rules.pattern.finditer(text)]
+    for two_stage in (True, False):
+        found = rules.finditer(text, 0, two_stage, prefilter=True)
+        assert [m.groupdict() for m in found] == plain
+
+
 @pytest.mark.parametrize("input,expected", [
     # positive assertions
     ("75062", True),